@@ -12,7 +12,9 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 # Import Base and all models so Alembic can detect them
 from app.database import Base
-from app.models import User, UserRole, OTPCode  # noqa: F401
+from app.models import (  # noqa: F401
+    User, UserRole, OTPCode, Property, Unit, PortfolioRollup, TokenRevocation, OutboxMessage,
+)
 from app.config import get_settings
 
 # Alembic Config object
@@ -30,6 +32,17 @@ config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 target_metadata = Base.metadata
 
 
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Skip the dialect-specific full-text search objects (see app.models.property)."""
+    if type_ == "table" and name.startswith("properties_fts"):
+        return False
+    if type_ == "column" and name in ("search_vector", "search_rowid"):
+        return False
+    if type_ == "index" and name in ("ix_properties_search_vector", "ix_properties_search_rowid"):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -38,6 +51,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -45,7 +59,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
     with context.begin_transaction():
         context.run_migrations()
 
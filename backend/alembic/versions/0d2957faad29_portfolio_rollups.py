@@ -0,0 +1,58 @@
+"""portfolio_rollups
+
+Revision ID: 0d2957faad29
+Revises: 59ca8f3d19dd
+Create Date: 2026-10-17 08:29:53.247814
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d2957faad29'
+down_revision: Union[str, None] = '59ca8f3d19dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('portfolio_rollups',
+    sa.Column('owner_id', sa.String(length=36), nullable=False),
+    sa.Column('property_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_units', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('occupied_units', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('vacant_units', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('maintenance_units', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rent_roll', sa.Numeric(precision=14, scale=2), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('owner_id')
+    )
+    op.add_column('properties', sa.Column('rent_roll', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False))
+    # Backfill: rent roll per property, then each owner's totals from those
+    op.execute(
+        """
+        UPDATE properties SET rent_roll = (
+            SELECT coalesce(sum(units.rent_amount), 0) FROM units
+            WHERE units.property_id = properties.id AND units.status = 'OCCUPIED'
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO portfolio_rollups (
+            owner_id, property_count, total_units, occupied_units,
+            vacant_units, maintenance_units, rent_roll
+        )
+        SELECT owner_id, count(*), sum(total_units), sum(occupied_units),
+               sum(vacant_units), sum(maintenance_units), sum(rent_roll)
+        FROM properties GROUP BY owner_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('properties', 'rent_roll')
+    op.drop_table('portfolio_rollups')
@@ -0,0 +1,26 @@
+"""outbox_lease
+
+Revision ID: 1a84b9b9e6d6
+Revises: 0d2957faad29
+Create Date: 2026-10-17 08:42:28.307848
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1a84b9b9e6d6'
+down_revision: Union[str, None] = '0d2957faad29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('notification_outbox', sa.Column('lease_id', sa.String(length=36), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('notification_outbox', 'lease_id')
@@ -0,0 +1,28 @@
+"""unit_search_indexes
+
+Revision ID: 2d3ece464e51
+Revises: 362b7bf7ee26
+Create Date: 2026-10-17 08:09:04.631552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d3ece464e51'
+down_revision: Union[str, None] = '362b7bf7ee26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_units_rent_amount', 'units', ['rent_amount'], unique=False)
+    op.create_index('ix_units_status_bedrooms_rent_amount', 'units', ['status', 'bedrooms', 'rent_amount'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_units_status_bedrooms_rent_amount', table_name='units')
+    op.drop_index('ix_units_rent_amount', table_name='units')
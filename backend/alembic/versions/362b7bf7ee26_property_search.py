@@ -0,0 +1,85 @@
+"""property_search
+
+Revision ID: 362b7bf7ee26
+Revises: 8db4da2476b3
+Create Date: 2026-10-17 08:04:27.458525
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '362b7bf7ee26'
+down_revision: Union[str, None] = '8db4da2476b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Full-text search over properties (name, address, city, description).
+# SQLite: external-content FTS5 table kept in sync by triggers.
+# PostgreSQL: generated tsvector column with a GIN index.
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE properties_fts USING fts5(
+        name, address, city, description,
+        content='properties', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER properties_fts_ai AFTER INSERT ON properties BEGIN
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        VALUES (new.rowid, new.name, new.address, new.city, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER properties_fts_ad AFTER DELETE ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.rowid, old.name, old.address, old.city, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER properties_fts_au AFTER UPDATE OF name, address, city, description
+    ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.rowid, old.name, old.address, old.city, old.description);
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        VALUES (new.rowid, new.name, new.address, new.city, new.description);
+    END
+    """,
+    # Index the rows that already exist
+    "INSERT INTO properties_fts(properties_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE properties ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(city, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(address, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX ix_properties_search_vector ON properties USING gin (search_vector)",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for trigger in ("properties_fts_ai", "properties_fts_ad", "properties_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS properties_fts")
+    elif dialect == "postgresql":
+        op.drop_index("ix_properties_search_vector", table_name="properties")
+        op.drop_column("properties", "search_vector")
@@ -0,0 +1,32 @@
+"""property_location
+
+Revision ID: 59ca8f3d19dd
+Revises: 2d3ece464e51
+Create Date: 2026-10-17 08:23:13.848035
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '59ca8f3d19dd'
+down_revision: Union[str, None] = '2d3ece464e51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('properties', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('properties', sa.Column('longitude', sa.Float(), nullable=True))
+    op.add_column('properties', sa.Column('geohash', sa.String(length=9), nullable=True))
+    op.create_index(op.f('ix_properties_geohash'), 'properties', ['geohash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_properties_geohash'), table_name='properties')
+    op.drop_column('properties', 'geohash')
+    op.drop_column('properties', 'longitude')
+    op.drop_column('properties', 'latitude')
@@ -0,0 +1,26 @@
+"""revocation_created_at_index
+
+Revision ID: 6555672c667b
+Revises: 1a84b9b9e6d6
+Create Date: 2026-10-17 08:44:10.189054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6555672c667b'
+down_revision: Union[str, None] = '1a84b9b9e6d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_token_revocations_created_at'), 'token_revocations', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_token_revocations_created_at'), table_name='token_revocations')
@@ -0,0 +1,31 @@
+"""otp_codes_composite_index
+
+Revision ID: 8b2e4d6f1a37
+Revises: 3f1c9a7d2b10
+Create Date: 2026-10-17 10:03:51.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a37'
+down_revision: Union[str, None] = '3f1c9a7d2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_otp_codes_user_purpose_used_created',
+        'otp_codes',
+        ['user_id', 'purpose', 'is_used', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_otp_codes_user_purpose_used_created', table_name='otp_codes')
@@ -0,0 +1,47 @@
+"""unit_counters
+
+Revision ID: 8db4da2476b3
+Revises: b7663eb88637
+Create Date: 2026-10-17 07:54:35.962395
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8db4da2476b3'
+down_revision: Union[str, None] = 'b7663eb88637'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('properties', sa.Column('occupied_units', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('properties', sa.Column('vacant_units', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('properties', sa.Column('maintenance_units', sa.Integer(), server_default='0', nullable=False))
+    with op.batch_alter_table('properties') as batch_op:
+        batch_op.alter_column('total_units', existing_type=sa.Integer(), server_default='0')
+    # total_units was never maintained: backfill every counter from the units table
+    op.execute(
+        """
+        UPDATE properties SET
+            total_units = (SELECT count(*) FROM units WHERE units.property_id = properties.id),
+            occupied_units = (SELECT count(*) FROM units
+                              WHERE units.property_id = properties.id AND units.status = 'OCCUPIED'),
+            vacant_units = (SELECT count(*) FROM units
+                            WHERE units.property_id = properties.id AND units.status = 'VACANT'),
+            maintenance_units = (SELECT count(*) FROM units
+                                 WHERE units.property_id = properties.id AND units.status = 'MAINTENANCE')
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('properties', 'maintenance_units')
+    op.drop_column('properties', 'vacant_units')
+    op.drop_column('properties', 'occupied_units')
+    with op.batch_alter_table('properties') as batch_op:
+        batch_op.alter_column('total_units', existing_type=sa.Integer(), server_default=None)
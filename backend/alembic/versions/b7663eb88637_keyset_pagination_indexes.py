@@ -0,0 +1,39 @@
+"""keyset_pagination_indexes
+
+Revision ID: b7663eb88637
+Revises: c3728789210b
+Create Date: 2026-10-17 07:45:18.386562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7663eb88637'
+down_revision: Union[str, None] = 'c3728789210b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_properties_created_at_id', 'properties', ['created_at', 'id'], unique=False)
+    op.create_index('ix_properties_owner_id_created_at_id', 'properties', ['owner_id', 'created_at', 'id'], unique=False)
+    # Add nullable, backfill existing rows, then enforce NOT NULL
+    op.add_column('units', sa.Column('created_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE units SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    with op.batch_alter_table('units') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+    op.create_index('ix_units_property_id_created_at_id', 'units', ['property_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_created_at_id', table_name='users')
+    op.drop_index('ix_units_property_id_created_at_id', table_name='units')
+    with op.batch_alter_table('units') as batch_op:
+        batch_op.drop_column('created_at')
+    op.drop_index('ix_properties_owner_id_created_at_id', table_name='properties')
+    op.drop_index('ix_properties_created_at_id', table_name='properties')
@@ -0,0 +1,67 @@
+"""properties_units
+
+Revision ID: c3728789210b
+Revises: d95a3c1e7b48
+Create Date: 2026-10-17 07:43:33.575998
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3728789210b'
+down_revision: Union[str, None] = 'd95a3c1e7b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('properties',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('address', sa.Text(), nullable=False),
+    sa.Column('city', sa.String(length=100), nullable=False),
+    sa.Column('type', sa.Enum('RESIDENTIAL', 'COMMERCIAL', 'MIXED', name='propertytype'), nullable=False),
+    sa.Column('owner_id', sa.String(length=36), nullable=False),
+    sa.Column('supervisor_id', sa.String(length=36), nullable=True),
+    sa.Column('total_units', sa.Integer(), nullable=False),
+    sa.Column('image_url', sa.Text(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['supervisor_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_properties_city'), 'properties', ['city'], unique=False)
+    op.create_index('ix_properties_owner_id_city', 'properties', ['owner_id', 'city'], unique=False)
+    op.create_index(op.f('ix_properties_supervisor_id'), 'properties', ['supervisor_id'], unique=False)
+    op.create_table('units',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('property_id', sa.String(length=36), nullable=False),
+    sa.Column('unit_number', sa.String(length=50), nullable=False),
+    sa.Column('floor', sa.Integer(), nullable=True),
+    sa.Column('bedrooms', sa.Integer(), nullable=True),
+    sa.Column('bathrooms', sa.Integer(), nullable=True),
+    sa.Column('area_sqm', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('rent_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('status', sa.Enum('VACANT', 'OCCUPIED', 'MAINTENANCE', name='unitstatus'), nullable=False),
+    sa.Column('tenant_id', sa.String(length=36), nullable=True),
+    sa.ForeignKeyConstraint(['property_id'], ['properties.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_units_property_id_status', 'units', ['property_id', 'status'], unique=False)
+    op.create_index(op.f('ix_units_tenant_id'), 'units', ['tenant_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_units_tenant_id'), table_name='units')
+    op.drop_index('ix_units_property_id_status', table_name='units')
+    op.drop_table('units')
+    op.drop_index(op.f('ix_properties_supervisor_id'), table_name='properties')
+    op.drop_index('ix_properties_owner_id_city', table_name='properties')
+    op.drop_index(op.f('ix_properties_city'), table_name='properties')
+    op.drop_table('properties')
@@ -0,0 +1,26 @@
+"""otp_codes_expires_at_index
+
+Revision ID: c41d7e9b5f02
+Revises: 8b2e4d6f1a37
+Create Date: 2026-10-17 10:41:26.775310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9b5f02'
+down_revision: Union[str, None] = '8b2e4d6f1a37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_otp_codes_expires_at'), 'otp_codes', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_otp_codes_expires_at'), table_name='otp_codes')
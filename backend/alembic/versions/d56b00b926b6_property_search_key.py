@@ -0,0 +1,118 @@
+"""property_search_key
+
+Revision ID: d56b00b926b6
+Revises: 6555672c667b
+Create Date: 2026-10-17 09:06:33.326831
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd56b00b926b6'
+down_revision: Union[str, None] = '6555672c667b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite only: re-key the FTS5 index on an explicit INTEGER column instead
+# of the implicit rowid of the String-keyed properties table, which VACUUM
+# may renumber. Existing rows take their current rowid as their key.
+SEARCH_TRIGGERS = ("properties_fts_ai", "properties_fts_ad", "properties_fts_au")
+
+SQLITE_UPGRADE = [
+    "ALTER TABLE properties ADD COLUMN search_rowid INTEGER",
+    "UPDATE properties SET search_rowid = rowid",
+    "CREATE UNIQUE INDEX ix_properties_search_rowid ON properties (search_rowid)",
+    """
+    CREATE VIRTUAL TABLE properties_fts USING fts5(
+        name, address, city, description,
+        content='properties', content_rowid='search_rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER properties_fts_ai AFTER INSERT ON properties BEGIN
+        UPDATE properties
+        SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM properties)
+        WHERE id = new.id AND search_rowid IS NULL;
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        SELECT search_rowid, name, address, city, description FROM properties WHERE id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER properties_fts_ad AFTER DELETE ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.search_rowid, old.name, old.address, old.city, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER properties_fts_au AFTER UPDATE OF name, address, city, description
+    ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.search_rowid, old.name, old.address, old.city, old.description);
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        VALUES (new.search_rowid, new.name, new.address, new.city, new.description);
+    END
+    """,
+    "INSERT INTO properties_fts(properties_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP INDEX ix_properties_search_rowid",
+    "ALTER TABLE properties DROP COLUMN search_rowid",
+    """
+    CREATE VIRTUAL TABLE properties_fts USING fts5(
+        name, address, city, description,
+        content='properties', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER properties_fts_ai AFTER INSERT ON properties BEGIN
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        VALUES (new.rowid, new.name, new.address, new.city, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER properties_fts_ad AFTER DELETE ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.rowid, old.name, old.address, old.city, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER properties_fts_au AFTER UPDATE OF name, address, city, description
+    ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.rowid, old.name, old.address, old.city, old.description);
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        VALUES (new.rowid, new.name, new.address, new.city, new.description);
+    END
+    """,
+    "INSERT INTO properties_fts(properties_fts) VALUES ('rebuild')",
+]
+
+
+def _drop_search_index() -> None:
+    for trigger in SEARCH_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS properties_fts")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _drop_search_index()
+    for statement in SQLITE_UPGRADE:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _drop_search_index()
+    for statement in SQLITE_DOWNGRADE:
+        op.execute(statement)
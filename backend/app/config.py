@@ -4,7 +4,7 @@ Uses pydantic-settings for validation and type coercion.
 """
 
 from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,12 +20,90 @@ class Settings(BaseSettings):
 
     # ── Database ──────────────────────────────────────────────
     DATABASE_URL: str = "sqlite+aiosqlite:///./amarati_dev.db"
+    # Pool profile (SQLite uses size/overflow only for its reader pool)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP_CONNECTIONS: int = 0  # 0 = warm up DB_POOL_SIZE connections
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements per connection
+    DB_COMPILED_CACHE_SIZE: int = 500  # SQLAlchemy compiled-SQL LRU entries per engine
+    # SQLite: pragmas applied on connect, and single-writer mode (one
+    # write connection, reads on a DB_POOL_SIZE reader pool)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_SINGLE_WRITER: bool = True
+    # Read replicas (JSON list of URLs, same dialect as DATABASE_URL). GET
+    # requests are spread across them; a user who just wrote reads from
+    # the primary for DB_READ_YOUR_WRITES_SECONDS
+    DATABASE_REPLICA_URLS: List[str] = []
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    DB_READ_YOUR_WRITES_MAX_USERS: int = 10000
 
     # ── JWT ───────────────────────────────────────────────────
     SECRET_KEY: str = "change-me-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    # Authorize RoleChecker from the signed "role" claim instead of the DB row
+    RBAC_TRUST_TOKEN_ROLE: bool = False
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    REVOCATION_COMPACTION_INTERVAL_SECONDS: int = 300
+    # Upper bound (plus replica lag) on how long a revocation made on one
+    # worker takes to be enforced by the others
+    REVOCATION_SYNC_INTERVAL_SECONDS: float = 2.0
+
+    # ── Password hashing ──────────────────────────────────────
+    # Tune with: python -m app.core.hash_calibration --target-p99-ms 250
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # bcrypt, argon2 (needs argon2-cffi)
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASH_EXECUTOR: str = "thread"  # thread, process
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 4
+
+    # ── Notifications (transactional outbox) ──────────────────
+    NOTIFICATION_SENDER: str = "console"  # console, file, smtp
+    NOTIFICATION_FILE_PATH: str = "./notifications.log"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 587
+    SMTP_USERNAME: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_FROM: str = "no-reply@amarati.local"
+    SMTP_USE_TLS: bool = True
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0  # 0 disables the background job
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_CONCURRENCY: int = 8
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_BACKOFF_BASE_SECONDS: float = 5.0
+    OUTBOX_BACKOFF_MAX_SECONDS: float = 600.0
+    # How long a claimed batch stays invisible to other workers; keep it
+    # above the worst-case send time of a batch
+    OUTBOX_LEASE_SECONDS: float = 300.0
+    # Sent and failed messages are deleted this long after their last attempt
+    OUTBOX_CLEANUP_INTERVAL_SECONDS: int = 3600  # 0 disables the background job
+    OUTBOX_RETENTION_HOURS: int = 24
+    OUTBOX_CLEANUP_BATCH_SIZE: int = 500
+    OUTBOX_CLEANUP_BATCH_PAUSE_SECONDS: float = 0.05
+
+    # ── Rate limiting (login, OTP, password reset) ────────────
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORE: str = "memory"  # memory, sqlite
+    RATE_LIMIT_SQLITE_PATH: str = "./rate_limits.db"
+    RATE_LIMIT_IP_BURST: int = 20
+    RATE_LIMIT_IP_PER_MINUTE: int = 60
+    RATE_LIMIT_EMAIL_BURST: int = 5
+    RATE_LIMIT_EMAIL_PER_MINUTE: int = 10
+    RATE_LIMIT_MAX_HASH_QUEUE: int = 32
+    # Reverse proxies (IPs or CIDRs) whose X-Forwarded-For is believed
+    # when keying buckets by client IP; empty uses the socket peer
+    TRUSTED_PROXIES: List[str] = []
 
     # ── App ───────────────────────────────────────────────────
     APP_NAME: str = "Amarati"
@@ -37,6 +115,37 @@ class Settings(BaseSettings):
     # ── OTP ───────────────────────────────────────────────────
     OTP_EXPIRE_MINUTES: int = 5
     OTP_LENGTH: int = 6
+    OTP_STORE: str = "sql"  # sql, memory (single-node only)
+    OTP_PURGE_INTERVAL_SECONDS: int = 3600  # 0 disables the background job
+    OTP_PURGE_RETENTION_MINUTES: int = 60
+    OTP_PURGE_BATCH_SIZE: int = 500
+    OTP_PURGE_BATCH_PAUSE_SECONDS: float = 0.05
+
+    # ── Caching ───────────────────────────────────────────────
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # ── Pagination ────────────────────────────────────────────
+    # "exact" counts matching rows in the page query; "estimate" uses the
+    # planner's row estimate (pg_class.reltuples) for unfiltered listings
+    # on PostgreSQL and falls back to exact elsewhere
+    PAGINATION_TOTAL_MODE: str = "exact"
+
+    # ── Bulk operations ───────────────────────────────────────
+    BULK_MAX_ITEMS: int = 5000
+
+    # ── Proximity search ──────────────────────────────────────
+    GEO_DEFAULT_RADIUS_KM: float = 5.0
+    GEO_MAX_RADIUS_KM: float = 100.0
+
+    # ── Unit search ───────────────────────────────────────────
+    # Rent facet bucket edges: [0, 2000), [2000, 3000), ..., [12000, ∞)
+    UNIT_SEARCH_RENT_BUCKETS: List[int] = [0, 2000, 3000, 5000, 8000, 12000]
+
+    # ── Unit counters and portfolio rollups ───────────────────
+    UNIT_COUNTER_RECONCILE_INTERVAL_SECONDS: int = 3600  # 0 disables the background job
+    UNIT_COUNTER_RECONCILE_BATCH_SIZE: int = 500
+    UNIT_COUNTER_RECONCILE_BATCH_PAUSE_SECONDS: float = 0.05
 
     @property
     def is_sqlite(self) -> bool:
@@ -0,0 +1,87 @@
+"""
+Instrumented connection pool for the async engine.
+
+Wraps SQLAlchemy's AsyncAdaptedQueuePool to record how long requests wait
+for a connection, so pool exhaustion under load shows up in
+/internal/metrics instead of only as slow responses.
+"""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Checkouts slower than this count as "waited" for the pool
+SLOW_CHECKOUT_SECONDS = 0.01
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that tracks checkout wait times and timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started_at
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            if waited > SLOW_CHECKOUT_SECONDS:
+                self.slow_checkouts += 1
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """Return occupancy and wait-time counters for an engine's pool."""
+    pool = engine.pool
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "timeout_seconds": pool.timeout(),
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update({
+            "checkouts": pool.checkouts,
+            "slow_checkouts": pool.slow_checkouts,
+            "timeouts": pool.timeouts,
+            "avg_wait_ms": round(pool.total_wait_seconds / pool.checkouts * 1000, 3)
+            if pool.checkouts else 0.0,
+            "max_wait_ms": round(pool.max_wait_seconds * 1000, 3),
+        })
+    return stats
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open `connections` connections at once and return them to the pool,
+    so the first requests after startup do not pay the connect cost.
+    Returns the number of connections opened.
+    """
+    if connections <= 0:
+        return 0
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+        )
+        for conn in conns:
+            await conn.exec_driver_sql("SELECT 1")
+    return len(conns)
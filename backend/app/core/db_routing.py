@@ -0,0 +1,84 @@
+"""
+Read-replica routing for request sessions.
+
+Writes always go to the primary. Read-only requests are spread across
+the configured replicas round-robin, except for users who wrote within
+the read-your-writes window: they are pinned to the primary so they
+never read from a replica that has not yet replayed their own change.
+
+Pins are kept in-process (per worker), like the user cache; behind a
+load balancer without sticky sessions a user may still hit a replica
+from another worker within the window.
+"""
+
+import itertools
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.db_pool import pool_stats
+from app.utils.cache import TTLCache
+
+
+class ReadRouter:
+    """Chooses the session factory for read-only requests."""
+
+    def __init__(
+        self,
+        primary_factory: async_sessionmaker,
+        make_engine: Callable[[str], AsyncEngine],
+        pin_seconds: float,
+        max_pinned: int,
+    ):
+        self.primary_factory = primary_factory
+        self._make_engine = make_engine
+        self.pins = TTLCache(max_size=max_pinned, ttl_seconds=pin_seconds)
+        self.engines: list[AsyncEngine] = []
+        self._factories: list[async_sessionmaker] = []
+        self._reads: list[int] = []
+        self._next = itertools.count()
+        self.primary_reads = 0
+        self.pinned_reads = 0
+
+    def configure(self, replica_urls: Sequence[str]) -> None:
+        """Create one engine per replica URL (call dispose() before reconfiguring)."""
+        self.engines = [self._make_engine(url) for url in replica_urls]
+        self._factories = [
+            async_sessionmaker(e, class_=AsyncSession, expire_on_commit=False)
+            for e in self.engines
+        ]
+        self._reads = [0] * len(self.engines)
+
+    async def dispose(self) -> None:
+        """Close all replica connections and forget the replicas."""
+        for engine in self.engines:
+            await engine.dispose()
+        self.configure([])
+
+    def factory_for(self, subject: Optional[str]) -> async_sessionmaker:
+        """Session factory for a read by `subject` (user ID, or None if anonymous)."""
+        if not self._factories:
+            self.primary_reads += 1
+            return self.primary_factory
+        if subject is not None and self.pins.get(subject):
+            self.pinned_reads += 1
+            return self.primary_factory
+        index = next(self._next) % len(self._factories)
+        self._reads[index] += 1
+        return self._factories[index]
+
+    def record_write(self, subject: Optional[str]) -> None:
+        """Pin `subject` to the primary for the read-your-writes window."""
+        if subject is not None and self._factories:
+            self.pins.set(subject, True)
+
+    def stats(self) -> dict[str, Any]:
+        """Routing counters and per-replica pool stats for monitoring."""
+        return {
+            "replicas": len(self.engines),
+            "primary_reads": self.primary_reads,
+            "pinned_reads": self.pinned_reads,
+            "pinned_users": len(self.pins),
+            "replica_reads": list(self._reads),
+            "replica_pools": [pool_stats(e) for e in self.engines],
+        }
@@ -2,6 +2,8 @@
 Custom exception classes and FastAPI exception handlers.
 """
 
+import math
+
 from fastapi import HTTPException, status
 
 
@@ -83,3 +85,14 @@ class OTPInvalidException(HTTPException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=detail,
         )
+
+
+class TooManyRequestsException(HTTPException):
+    """Raised when a client exceeds a rate limit or the server sheds load."""
+
+    def __init__(self, retry_after: float, detail: str = "Too many requests. Please try again later."):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
@@ -0,0 +1,150 @@
+"""
+Password-hash cost calibration.
+
+Benchmarks hash and verify times for bcrypt rounds (and argon2 time costs
+when argon2-cffi is installed) on the current machine, and recommends the
+strongest setting whose verify p99 stays within a target latency.
+
+Usage (from backend/):
+    python -m app.core.hash_calibration --target-p99-ms 250
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from passlib.exc import MissingBackendError
+
+from app.config import get_settings
+from app.core.security import build_crypt_context
+
+settings = get_settings()
+
+PASSWORD = "Calibration-Password-123!"
+
+
+@dataclass
+class CalibrationResult:
+    scheme: str
+    cost: int
+    hash_p50_ms: float
+    verify_p50_ms: float
+    verify_p99_ms: float
+
+    @property
+    def logins_per_core_per_second(self) -> float:
+        return 1000 / self.verify_p50_ms if self.verify_p50_ms else 0.0
+
+    @property
+    def setting(self) -> str:
+        if self.scheme == "bcrypt":
+            return f"PASSWORD_HASH_SCHEME=bcrypt BCRYPT_ROUNDS={self.cost}"
+        return f"PASSWORD_HASH_SCHEME=argon2 ARGON2_TIME_COST={self.cost}"
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def measure(scheme: str, cost: int, samples: int) -> Optional[CalibrationResult]:
+    """Time hash and verify for one scheme/cost; None if unavailable."""
+    if scheme == "bcrypt":
+        context = build_crypt_context(scheme="bcrypt", bcrypt_rounds=cost)
+    else:
+        context = build_crypt_context(scheme="argon2", argon2_time_cost=cost)
+
+    try:
+        hashed = context.hash(PASSWORD)
+    except MissingBackendError:
+        return None
+
+    hash_times, verify_times = [], []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash(PASSWORD)
+        hash_times.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        verify_times.append((time.perf_counter() - start) * 1000)
+
+    return CalibrationResult(
+        scheme=scheme,
+        cost=cost,
+        hash_p50_ms=statistics.median(hash_times),
+        verify_p50_ms=statistics.median(verify_times),
+        verify_p99_ms=_percentile(verify_times, 0.99),
+    )
+
+
+def calibrate(
+    target_p99_ms: float,
+    samples: int,
+    bcrypt_rounds: range,
+    argon2_time_costs: range,
+) -> list[CalibrationResult]:
+    """Benchmark all candidates, printing a table row for each."""
+    print(f"{'scheme':<8} {'cost':>4} {'hash p50':>10} {'verify p50':>11} "
+          f"{'verify p99':>11} {'logins/s/core':>14}")
+    results = []
+    candidates = [("bcrypt", c) for c in bcrypt_rounds]
+    candidates += [("argon2", c) for c in argon2_time_costs]
+    finished: set[str] = set()
+    for scheme, cost in candidates:
+        if scheme in finished:
+            continue
+        result = measure(scheme, cost, samples)
+        if result is None:
+            print(f"{scheme:<8} {'-':>4} backend not installed, skipped")
+            finished.add(scheme)
+            continue
+        results.append(result)
+        print(f"{scheme:<8} {cost:>4} {result.hash_p50_ms:>8.1f}ms {result.verify_p50_ms:>9.1f}ms "
+              f"{result.verify_p99_ms:>9.1f}ms {result.logins_per_core_per_second:>14.1f}")
+        # Cost grows with each step; stop once well past the target
+        if result.verify_p50_ms > target_p99_ms * 2:
+            finished.add(scheme)
+    return results
+
+
+def recommend(results: list[CalibrationResult], target_p99_ms: float) -> Optional[CalibrationResult]:
+    """Pick the most expensive setting per scheme that meets the target."""
+    within = [r for r in results if r.verify_p99_ms <= target_p99_ms]
+    if not within:
+        return None
+    preferred = [r for r in within if r.scheme == settings.PASSWORD_HASH_SCHEME] or within
+    return max(preferred, key=lambda r: r.verify_p50_ms)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibrate password-hash cost.")
+    parser.add_argument("--target-p99-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=15)
+    parser.add_argument("--max-argon2-time-cost", type=int, default=6)
+    args = parser.parse_args()
+
+    results = calibrate(
+        target_p99_ms=args.target_p99_ms,
+        samples=args.samples,
+        bcrypt_rounds=range(args.min_rounds, args.max_rounds + 1),
+        argon2_time_costs=range(1, args.max_argon2_time_cost + 1),
+    )
+    best = recommend(results, args.target_p99_ms)
+    print()
+    if best is None:
+        print(f"No setting meets a verify p99 of {args.target_p99_ms:.0f} ms on this machine.")
+        return
+    print(f"Recommended for verify p99 <= {args.target_p99_ms:.0f} ms: {best.setting}")
+    print(f"  ~{best.logins_per_core_per_second:.1f} logins/s per core "
+          f"(current: PASSWORD_HASH_SCHEME={settings.PASSWORD_HASH_SCHEME} "
+          f"BCRYPT_ROUNDS={settings.BCRYPT_ROUNDS})")
+    print("Existing hashes are upgraded on each user's next successful login.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Token-bucket rate limiting for expensive unauthenticated endpoints.
+
+Buckets are keyed by client IP and by submitted email. Behind reverse
+proxies listed in TRUSTED_PROXIES the client IP is taken from
+X-Forwarded-For; otherwise it is the socket peer. Buckets live either
+in sharded in-process dicts (single worker) or in a shared SQLite file
+(several workers on one host). Requests are also shed while the
+password-hashing pool is saturated. Rejections happen in a dependency,
+before any bcrypt or DB work is done.
+"""
+
+import asyncio
+import hashlib
+import ipaddress
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Request
+
+from app.config import get_settings
+from app.core.exceptions import TooManyRequestsException
+from app.core.hashing_pool import hashing_pool
+
+settings = get_settings()
+
+
+def _take(
+    tokens: float,
+    updated_at: float,
+    now: float,
+    capacity: int,
+    refill_per_second: float,
+) -> tuple[float, float]:
+    """
+    Refill a bucket and try to take one token.
+    Returns (remaining tokens, retry-after seconds; 0 if allowed).
+    """
+    tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / refill_per_second
+
+
+class MemoryBucketStore:
+    """In-process bucket store split into LRU-bounded shards."""
+
+    def __init__(self, shards: int = 16, max_keys_per_shard: int = 10000):
+        self.max_keys_per_shard = max_keys_per_shard
+        self._shards: list[OrderedDict[str, tuple[float, float]]] = [
+            OrderedDict() for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> OrderedDict:
+        digest = hashlib.blake2b(key.encode(), digest_size=4).digest()
+        return self._shards[int.from_bytes(digest, "little") % len(self._shards)]
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        shard = self._shard(key)
+        now = time.monotonic()
+        tokens, updated_at = shard.get(key, (capacity, now))
+        tokens, retry_after = _take(tokens, updated_at, now, capacity, refill_per_second)
+        shard[key] = (tokens, now)
+        shard.move_to_end(key)
+        if len(shard) > self.max_keys_per_shard:
+            shard.popitem(last=False)
+        return retry_after
+
+    async def reset(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+
+class SQLiteBucketStore:
+    """Bucket store in a SQLite file shared by all workers on a host."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                " key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def _consume_sync(self, key: str, capacity: int, refill_per_second: float) -> float:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated_at = row if row else (capacity, now)
+            tokens, retry_after = _take(tokens, updated_at, now, capacity, refill_per_second)
+            conn.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return retry_after
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        return await asyncio.to_thread(self._consume_sync, key, capacity, refill_per_second)
+
+    async def reset(self) -> None:
+        await asyncio.to_thread(
+            lambda: self._connect().execute("DELETE FROM rate_limit_buckets")
+        )
+
+
+def _create_store():
+    if settings.RATE_LIMIT_STORE == "sqlite":
+        return SQLiteBucketStore(settings.RATE_LIMIT_SQLITE_PATH)
+    return MemoryBucketStore()
+
+
+bucket_store = _create_store()
+
+# Counters: {"<scope>": {"allowed": n, "rejected_ip": n, ...}}
+rate_limit_counters: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+
+@lru_cache(maxsize=4)
+def _trusted_networks(proxies: tuple[str, ...]) -> tuple[Any, ...]:
+    return tuple(ipaddress.ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def _is_trusted(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _trusted_networks(tuple(settings.TRUSTED_PROXIES)))
+
+
+def client_ip(request: Request) -> str:
+    """
+    Address of the client that sent the request. When the socket peer is
+    a trusted proxy, X-Forwarded-For is walked from the right (the hops
+    our proxies appended) to the first address that is not a trusted
+    proxy; entries further left are client-supplied and ignored.
+    """
+    host = request.client.host if request.client else "unknown"
+    if not settings.TRUSTED_PROXIES or not _is_trusted(host):
+        return host
+    for hop in reversed(request.headers.get("x-forwarded-for", "").split(",")):
+        hop = hop.strip()
+        if not hop:
+            continue
+        host = hop
+        if not _is_trusted(hop):
+            break
+    return host
+
+
+class RateLimiter:
+    """
+    FastAPI dependency that rate-limits an endpoint per client IP and
+    per request-body email. Declare it in the route's `dependencies`
+    so it runs before any other work.
+
+    Usage:
+        @router.post("/login", dependencies=[Depends(RateLimiter("login"))])
+    """
+
+    def __init__(self, scope: str, uses_password_hashing: bool = False):
+        self.scope = scope
+        self.uses_password_hashing = uses_password_hashing
+
+    async def __call__(self, request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        counters = rate_limit_counters[self.scope]
+
+        # CPU-aware shedding: don't queue more hashing work than we can absorb
+        if (
+            self.uses_password_hashing
+            and hashing_pool.waiting >= settings.RATE_LIMIT_MAX_HASH_QUEUE
+        ):
+            counters["rejected_overload"] += 1
+            raise TooManyRequestsException(retry_after=1)
+
+        ip = client_ip(request)
+        retry_after = await bucket_store.consume(
+            f"{self.scope}:ip:{ip}",
+            settings.RATE_LIMIT_IP_BURST,
+            settings.RATE_LIMIT_IP_PER_MINUTE / 60,
+        )
+        if retry_after:
+            counters["rejected_ip"] += 1
+            raise TooManyRequestsException(retry_after=retry_after)
+
+        email = await self._get_email(request)
+        if email:
+            retry_after = await bucket_store.consume(
+                f"{self.scope}:email:{email}",
+                settings.RATE_LIMIT_EMAIL_BURST,
+                settings.RATE_LIMIT_EMAIL_PER_MINUTE / 60,
+            )
+            if retry_after:
+                counters["rejected_email"] += 1
+                raise TooManyRequestsException(retry_after=retry_after)
+
+        counters["allowed"] += 1
+
+    @staticmethod
+    async def _get_email(request: Request) -> Optional[str]:
+        try:
+            body = await request.json()
+        except ValueError:
+            return None
+        email = body.get("email") if isinstance(body, dict) else None
+        return email.strip().lower() if isinstance(email, str) else None
+
+
+def rate_limit_stats() -> dict[str, Any]:
+    """Return per-endpoint allow/reject counters for monitoring."""
+    return {
+        "store": settings.RATE_LIMIT_STORE,
+        "endpoints": {scope: dict(counts) for scope, counts in rate_limit_counters.items()},
+    }
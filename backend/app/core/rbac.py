@@ -3,11 +3,15 @@ Role-Based Access Control (RBAC) for FastAPI.
 Provides dependency-based authorization using role checks.
 """
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import Depends, Request
 
+from app.config import get_settings
 from app.core.exceptions import ForbiddenException
+from app.dependencies import load_request_user
+
+settings = get_settings()
 
 
 class RoleChecker:
@@ -24,23 +28,36 @@ class RoleChecker:
             _=Depends(RoleChecker(["owner", "admin"])),
             current_user=Depends(get_current_user),
         ): ...
+
+    With RBAC_TRUST_TOKEN_ROLE enabled, the role is read from the signed
+    access-token claim and no user row is loaded. Role changes then take
+    effect when the user's current access token expires.
     """
 
     def __init__(self, allowed_roles: List[str]):
         self.allowed_roles = allowed_roles
 
     async def __call__(self, request: Request) -> None:
-        # The user is set on request.state by the get_current_user dependency
-        user = getattr(request.state, "user", None)
-        if user is None:
+        role = await self._get_role(request)
+        if role is None:
             raise ForbiddenException(detail="Authentication required")
 
-        if user.role.value not in self.allowed_roles:
+        if role not in self.allowed_roles:
             raise ForbiddenException(
-                detail=f"Role '{user.role.value}' is not authorized. "
+                detail=f"Role '{role}' is not authorized. "
                 f"Required: {', '.join(self.allowed_roles)}"
             )
 
+    @staticmethod
+    async def _get_role(request: Request) -> Optional[str]:
+        if settings.RBAC_TRUST_TOKEN_ROLE:
+            payload = getattr(request.state, "token_payload", None)
+            return payload.get("role") if payload else None
+
+        # Shares the lazy user lookup attached by AuthMiddleware
+        user = await load_request_user(request)
+        return user.role.value if user else None
+
 
 # ── Permission matrix ──────────────────────────────────────────
 # Defines what each role can access (for reference & middleware)
@@ -0,0 +1,187 @@
+"""
+Access-token revocation list.
+
+Revoked token IDs (jti) and user-level "revoked before" cut-offs are
+stored in the token_revocations table and mirrored into an in-memory
+Bloom filter. The auth middleware checks the filter in O(1) on every
+request; the table is only consulted when the filter reports a hit.
+
+The filter is rebuilt from the table at startup and by the periodic
+compaction task. Revocations made by other workers are picked up by a
+sync poll: on a filter miss, if the last poll is older than
+REVOCATION_SYNC_INTERVAL_SECONDS, rows created since the last seen
+created_at are read and added before the miss is trusted. A revocation
+is therefore enforced by every worker within that interval (plus replica
+lag, since the poll uses the read pool).
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from app.config import get_settings
+from app.database import async_session_factory, read_session_factory
+from app.repositories.revocation_repository import RevocationRepository
+from app.utils.bloom import BloomFilter
+
+settings = get_settings()
+
+# Rows are stamped by the writing worker before it commits, so each poll
+# re-reads this far behind the watermark to catch late commits and small
+# clock skew between workers (re-adding a key to the filter is harmless).
+_SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Handle naive datetimes from SQLite
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _jti_key(jti: str) -> str:
+    return f"jti:{jti}"
+
+
+def _user_key(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+class RevocationList:
+    """Bloom-filter front for the token_revocations table."""
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_interval: float = settings.REVOCATION_SYNC_INTERVAL_SECONDS,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self._filter = BloomFilter(capacity, error_rate)
+        self._watermark: Optional[datetime] = None  # newest created_at seen
+        self._synced_at = float("-inf")  # time.monotonic() of the last poll
+
+        # Metrics
+        self.checks = 0
+        self.filter_hits = 0
+        self.revoked = 0
+        self.syncs = 0
+
+    def add_jti(self, jti: str) -> None:
+        self._filter.add(_jti_key(jti))
+
+    def add_user(self, user_id: str) -> None:
+        self._filter.add(_user_key(user_id))
+
+    def rebuild(
+        self,
+        entries: Iterable[tuple[Optional[str], Optional[str]]],
+        as_of: Optional[datetime] = None,
+    ) -> None:
+        """
+        Replace the filter contents with (jti, user_id) entries read from
+        the table at `as_of`; the next sync continues from there.
+        """
+        entries = list(entries)
+        new_filter = BloomFilter(max(self.capacity, len(entries) * 2), self.error_rate)
+        for jti, user_id in entries:
+            if jti:
+                new_filter.add(_jti_key(jti))
+            elif user_id:
+                new_filter.add(_user_key(user_id))
+        self._filter = new_filter
+        if as_of is not None:
+            self._watermark = as_of
+            self._synced_at = time.monotonic()
+
+    async def sync(self) -> None:
+        """Add revocations recorded (e.g. by other workers) since the last sync."""
+        # Claim the poll up front so concurrent misses don't all query
+        self._synced_at = time.monotonic()
+        since = (
+            self._watermark - _SYNC_OVERLAP
+            if self._watermark is not None
+            else datetime.min.replace(tzinfo=timezone.utc)
+        )
+        async with read_session_factory() as session:
+            entries, newest = await RevocationRepository(session).get_created_since(since)
+        for jti, user_id in entries:
+            if jti:
+                self.add_jti(jti)
+            elif user_id:
+                self.add_user(user_id)
+        if newest is not None:
+            newest = _as_utc(newest)
+            if self._watermark is None or newest > self._watermark:
+                self._watermark = newest
+        self.syncs += 1
+
+    def _filter_hits(self, jti: Optional[str], user_id: Optional[str]) -> tuple[bool, bool]:
+        return (
+            bool(jti) and _jti_key(jti) in self._filter,
+            bool(user_id) and _user_key(user_id) in self._filter,
+        )
+
+    async def is_revoked(self, payload: dict[str, Any]) -> bool:
+        """Check whether a verified access-token payload has been revoked."""
+        self.checks += 1
+        jti = payload.get("jti")
+        user_id = payload.get("sub")
+        jti_hit, user_hit = self._filter_hits(jti, user_id)
+        if not (jti_hit or user_hit):
+            if time.monotonic() - self._synced_at < self.sync_interval:
+                return False
+            await self.sync()
+            jti_hit, user_hit = self._filter_hits(jti, user_id)
+            if not (jti_hit or user_hit):
+                return False
+
+        self.filter_hits += 1
+        async with read_session_factory() as session:
+            repo = RevocationRepository(session)
+            if jti_hit and await repo.is_jti_revoked(jti):
+                self.revoked += 1
+                return True
+
+            if user_hit:
+                cutoff = await repo.get_user_revoked_before(user_id)
+                if cutoff is not None:
+                    # iat has whole-second resolution, so compare seconds:
+                    # tokens issued in the cut-off's own second are revoked
+                    if payload.get("iat", 0) <= int(_as_utc(cutoff).timestamp()):
+                        self.revoked += 1
+                        return True
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        """Return filter and lookup counters for monitoring."""
+        return {
+            "entries": self._filter.count,
+            "checks": self.checks,
+            "filter_hits": self.filter_hits,
+            "revoked": self.revoked,
+            "syncs": self.syncs,
+            "false_positives": self.filter_hits - self.revoked,
+        }
+
+
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
+
+
+async def load_revocation_list(purge_expired: bool = False) -> int:
+    """
+    Rebuild the in-memory filter from the table.
+    With purge_expired, first delete rows whose tokens have expired.
+    Returns the number of rows deleted.
+    """
+    now = datetime.now(timezone.utc)
+    async with async_session_factory() as session:
+        repo = RevocationRepository(session)
+        deleted = await repo.delete_expired(now) if purge_expired else 0
+        entries = await repo.get_active(now)
+        await session.commit()
+    revocation_list.rebuild(entries, as_of=now)
+    return deleted
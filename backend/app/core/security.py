@@ -2,6 +2,9 @@
 Security utilities: password hashing and JWT token management.
 """
 
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -9,11 +12,39 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import get_settings
+from app.core.hashing_pool import hashing_pool
+from app.utils.cache import TTLCache
 
 settings = get_settings()
 
 # ── Password hashing ────────────────────────────────────────────
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def build_crypt_context(
+    scheme: str = settings.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = settings.BCRYPT_ROUNDS,
+    argon2_time_cost: int = settings.ARGON2_TIME_COST,
+    argon2_memory_cost: int = settings.ARGON2_MEMORY_COST,
+    argon2_parallelism: int = settings.ARGON2_PARALLELISM,
+) -> CryptContext:
+    """
+    Build a CryptContext for the given scheme and cost.
+    Hashes made with another scheme or cost still verify, but
+    needs_update() reports them so they can be rehashed on login.
+    """
+    schemes = [scheme] if scheme == "bcrypt" else [scheme, "bcrypt"]
+    return CryptContext(
+        schemes=schemes,
+        default=scheme,
+        deprecated="auto",
+        bcrypt__default_rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+pwd_context = build_crypt_context()
 
 
 def hash_password(password: str) -> str:
@@ -26,18 +57,62 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool without blocking the event loop."""
+    return await hashing_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool without blocking the event loop."""
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if its hash uses an outdated scheme or cost,
+    return a replacement hash (otherwise None).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Async variant of verify_and_update_password on the hashing pool."""
+    return await hashing_pool.run(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
+
 # ── JWT Token Management ────────────────────────────────────────
+# Verified access-token payloads keyed by token digest. Entries expire
+# together with the token, so a cached payload is never past its "exp".
+token_cache = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: Optional[timedelta] = None,
 ) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + (
+    now = datetime.now(timezone.utc)
+    expire = now + (
         expires_delta
         or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
-    to_encode.update({"exp": expire, "type": "access"})
+    # jti/iat allow individual or user-wide revocation (see core.revocation)
+    to_encode.update({
+        "exp": expire,
+        "iat": now,
+        "jti": uuid.uuid4().hex,
+        "type": "access",
+    })
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
@@ -72,14 +147,27 @@ def decode_token(token: str) -> dict[str, Any]:
 
 
 def verify_access_token(token: str) -> Optional[dict[str, Any]]:
-    """Verify an access token and return its payload, or None."""
+    """
+    Verify an access token and return its payload, or None.
+    Successful verifications are cached until the token expires;
+    the returned payload must be treated as read-only.
+    """
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        return payload
+
     try:
         payload = decode_token(token)
-        if payload.get("type") != "access":
-            return None
-        return payload
     except JWTError:
         return None
+    if payload.get("type") != "access":
+        return None
+
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.set(cache_key, payload, ttl_seconds=exp - time.time())
+    return payload
 
 
 def verify_refresh_token(token: str) -> Optional[dict[str, Any]]:
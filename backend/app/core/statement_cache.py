@@ -0,0 +1,65 @@
+"""
+SQL compilation cache monitoring.
+
+SQLAlchemy keeps a per-engine LRU of compiled SQL keyed by statement
+structure. A hit skips compilation; a miss compiles and stores. Ad-hoc
+select() constructs also pay to rebuild the statement and its cache key
+on every call, which is why the hot lookups in the repositories use
+statements built once at import time.
+"""
+
+import weakref
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class CompiledCacheStats:
+    """Counts compiled-cache hits and misses across instrumented engines."""
+
+    def __init__(self):
+        self._engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def install(self, engine: AsyncEngine) -> None:
+        """Start counting statements executed on `engine`."""
+        self._engines.add(engine.sync_engine)
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CACHE_MISS:
+            self.misses += 1
+        else:
+            # Driver-level SQL, PRAGMAs, or caching disabled
+            self.uncached += 1
+
+    def reset(self) -> None:
+        self.hits = self.misses = self.uncached = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters plus current size/capacity of each engine's cache."""
+        lookups = self.hits + self.misses
+        caches = [
+            getattr(engine, "_compiled_cache", None) for engine in self._engines
+        ]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": sum(len(c) for c in caches if c is not None),
+            "capacity_per_engine": next(
+                (c.capacity for c in caches if c is not None), 0
+            ),
+        }
+
+
+compiled_cache_stats = CompiledCacheStats()
@@ -0,0 +1,55 @@
+"""
+In-process cache of authenticated users, keyed by user ID.
+
+Used by the auth middleware to avoid a SELECT on every request.
+Services that change a user must call invalidate_user() with their
+session so that updates (e.g. deactivation) take effect as soon as they
+are committed. Evicting earlier would let a concurrent request re-cache
+the old row before the commit lands.
+"""
+
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.user import User
+from app.utils.cache import TTLCache
+
+settings = get_settings()
+
+user_cache = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+def get_cached_user(user_id: str) -> Optional[User]:
+    """Return a cached user, or None on miss."""
+    return user_cache.get(user_id)
+
+
+def cache_user(user: User) -> None:
+    """Cache an active user instance (detached from its session)."""
+    user_cache.set(user.id, user)
+
+
+_PENDING_KEY = "invalidate_users"
+
+
+def invalidate_user(session: AsyncSession, user_id: str) -> None:
+    """Remove a modified user from the cache once `session` commits."""
+    session.sync_session.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
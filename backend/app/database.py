@@ -3,33 +3,99 @@ Async SQLAlchemy database engine and session management.
 Supports both SQLite (dev) and PostgreSQL (production).
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
+from app.core.db_pool import InstrumentedQueuePool, warm_up_pool
+from app.core.db_routing import ReadRouter
+from app.core.statement_cache import compiled_cache_stats
 
 settings = get_settings()
 
 # ── Engine configuration ────────────────────────────────────────
-engine_kwargs = {}
+engine_kwargs = {
+    "poolclass": InstrumentedQueuePool,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    "query_cache_size": settings.DB_COMPILED_CACHE_SIZE,
+}
 if settings.is_sqlite:
     # SQLite needs connect_args for async
     engine_kwargs["connect_args"] = {"check_same_thread": False}
+else:
+    engine_kwargs["pool_size"] = settings.DB_POOL_SIZE
+    engine_kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+    if "asyncpg" in settings.DATABASE_URL:
+        engine_kwargs["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    **engine_kwargs,
-)
+# SQLite single-writer mode: all writes share one connection (callers
+# queue on the pool for it) while reads use a separate pool, so writers
+# never contend for the database lock and WAL lets readers run alongside.
+single_writer = settings.is_sqlite and settings.SQLITE_SINGLE_WRITER
+if single_writer:
+    engine_kwargs.update(pool_size=1, max_overflow=0)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply journal, sync and lock-wait pragmas to each new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.close()
+
+
+def _create_engine(url: str, **overrides) -> AsyncEngine:
+    """Create an engine with the shared pool profile (and SQLite pragmas)."""
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        **{**engine_kwargs, **overrides},
+    )
+    if settings.is_sqlite:
+        event.listen(new_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    compiled_cache_stats.install(new_engine)
+    return new_engine
 
-# ── Session factory ─────────────────────────────────────────────
+
+# Readers (and replicas) always get the full pool, even in single-writer mode
+reader_pool = {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+
+engine = _create_engine(settings.DATABASE_URL)
+read_engine = _create_engine(settings.DATABASE_URL, **reader_pool) if single_writer else engine
+
+# ── Session factories ───────────────────────────────────────────
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+# Read-only work on the primary (auth lookups, pinned readers); same
+# engine unless SQLite single-writer mode is on.
+read_session_factory = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# GET/HEAD requests: replicas when DATABASE_REPLICA_URLS is set, else the
+# primary read factory. Replicas must share the primary's dialect.
+read_router = ReadRouter(
+    read_session_factory,
+    lambda url: _create_engine(url, **reader_pool),
+    pin_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    max_pinned=settings.DB_READ_YOUR_WRITES_MAX_USERS,
+)
+read_router.configure(settings.DATABASE_REPLICA_URLS)
+
 
 # ── Base model ──────────────────────────────────────────────────
 class Base(DeclarativeBase):
@@ -38,12 +104,25 @@ class Base(DeclarativeBase):
 
 
 # ── Dependency ──────────────────────────────────────────────────
-async def get_db() -> AsyncSession:
+async def get_db(request: Request) -> AsyncSession:
     """
     FastAPI dependency that provides an async database session.
-    Automatically commits on success, rolls back on error.
+    GET/HEAD requests get a read session (a replica, unless the user wrote
+    within the read-your-writes window); everything else the primary.
+    A write request holds the (SQLite single) writer from its first
+    statement to commit, which serializes read-modify-write requests;
+    password hashing must therefore happen before that first statement
+    (see AuthService) rather than while the writer is held.
+
+    The request is the unit of work: repositories only stage changes
+    (flushing when they need generated ids), and this dependency commits
+    once on success or rolls back on error.
     """
-    async with async_session_factory() as session:
+    payload = getattr(request.state, "token_payload", None)
+    subject = payload.get("sub") if payload else None
+    is_read = request.method in ("GET", "HEAD")
+    factory = read_router.factory_for(subject) if is_read else async_session_factory
+    async with factory() as session:
         try:
             yield session
             await session.commit()
@@ -52,6 +131,20 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+    if not is_read:
+        read_router.record_write(subject)
+
+
+async def warm_up_engine() -> int:
+    """Pre-open pool connections at startup; returns connections opened."""
+    warmed = await warm_up_pool(
+        read_engine, settings.DB_POOL_WARMUP_CONNECTIONS or read_engine.pool.size()
+    )
+    if read_engine is not engine:
+        warmed += await warm_up_pool(engine, engine.pool.size())
+    for replica in read_router.engines:
+        warmed += await warm_up_pool(replica, replica.pool.size())
+    return warmed
 
 
 async def create_tables():
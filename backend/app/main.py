@@ -16,9 +16,17 @@ from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.database import create_tables
+from app.core.hashing_pool import hashing_pool
+from app.core.revocation import load_revocation_list
+from app.database import create_tables, warm_up_engine
 from app.middleware.auth_middleware import AuthMiddleware
-from app.routers import auth, users, properties, units
+from app.routers import auth, users, properties, units, internal
+from app.tasks.otp_purge import purge_otps
+from app.tasks.outbox_cleanup import clean_outbox
+from app.tasks.outbox_worker import drain_outbox
+from app.tasks.revocation_compaction import compact_revocations
+from app.tasks.portfolio_rollup_rebuild import rebuild_portfolio_rollups
+from app.tasks.scheduler import scheduler
 
 settings = get_settings()
 
@@ -31,11 +39,35 @@ async def lifespan(app: FastAPI):
         await create_tables()
         print(f"[START] {settings.APP_NAME} v{settings.APP_VERSION} started (DEBUG mode)")
         print(f"[DB] Database: {settings.DATABASE_URL}")
+
+    warmed = await warm_up_engine()
+    print(f"[DB] Pool warmed up with {warmed} connection(s)")
+    await load_revocation_list()
+    scheduler.start()
     yield
     # Shutdown
+    await scheduler.stop()
+    hashing_pool.shutdown()
     print(f"[STOP] {settings.APP_NAME} shutting down")
 
 
+# ── Background jobs ──────────────────────────────────────────────
+scheduler.add_job(
+    "revocation-compaction",
+    settings.REVOCATION_COMPACTION_INTERVAL_SECONDS,
+    compact_revocations,
+)
+scheduler.add_job("otp-purge", settings.OTP_PURGE_INTERVAL_SECONDS, purge_otps)
+scheduler.add_job("outbox-worker", settings.OUTBOX_POLL_INTERVAL_SECONDS, drain_outbox)
+scheduler.add_job("outbox-cleanup", settings.OUTBOX_CLEANUP_INTERVAL_SECONDS, clean_outbox)
+# Repairs property counters first, then the owner rollups summed from them
+scheduler.add_job(
+    "portfolio-rollup-rebuild",
+    settings.UNIT_COUNTER_RECONCILE_INTERVAL_SECONDS,
+    rebuild_portfolio_rollups,
+)
+
+
 # ── App instance ─────────────────────────────────────────────────
 app = FastAPI(
     title=settings.APP_NAME,
@@ -56,19 +88,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated"],
 )
 
 # ── Auth Middleware ──────────────────────────────────────────────
 app.add_middleware(AuthMiddleware)
 
 # ── API Routes ───────────────────────────────────────────────────
-from app.routers import auth, users, properties, units
+from app.routers import auth, users, properties, units, internal
 
 api_router = APIRouter(prefix=settings.API_V1_STR)
 api_router.include_router(auth.router)
 api_router.include_router(users.router)
 api_router.include_router(properties.router)
 api_router.include_router(units.router)
+api_router.include_router(internal.router)
 
 app.include_router(api_router)
 
@@ -1,13 +1,23 @@
 """
-Authentication middleware: extracts JWT from requests
-and sets current user on request.state.
+Authentication middleware: verifies the JWT from requests and attaches
+a lazy user loader to request.state.
+
+Implemented as a plain ASGI middleware (no BaseHTTPMiddleware), so it
+adds no extra task or response stream per request. The user row is only
+fetched when a dependency actually awaits the loader. Revoked tokens
+(logout, deactivation) are rejected via the in-memory revocation list.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import asyncio
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.core.revocation import revocation_list
 from app.core.security import verify_access_token
-from app.database import async_session_factory
+from app.core.user_cache import cache_user, get_cached_user
+from app.database import read_session_factory
+from app.models.user import User
 from app.repositories.user_repository import UserRepository
 
 
@@ -28,38 +38,77 @@ PUBLIC_PATHS = {
 }
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class UserLoader:
+    """
+    Awaitable that resolves the authenticated user on first call.
+
+    The result (or in-flight lookup) is shared, so every dependency in
+    the same request gets the same user from a single lookup.
+    """
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self._task: Optional[asyncio.Task] = None
+
+    async def __call__(self) -> Optional[User]:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._load())
+        return await self._task
+
+    async def _load(self) -> Optional[User]:
+        user = get_cached_user(self.user_id)
+        if user is None:
+            # Cache miss: fetch user from DB
+            async with read_session_factory() as session:
+                user_repo = UserRepository(session)
+                user = await user_repo.get_by_id(self.user_id)
+            if user and user.is_active:
+                cache_user(user)
+
+        if user is None or not user.is_active:
+            return None
+        return user
+
+
+def _get_bearer_token(scope: Scope) -> Optional[str]:
+    """Extract the bearer token from raw ASGI headers."""
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            auth_header = value.decode("latin-1")
+            if auth_header.startswith("Bearer "):
+                return auth_header.split(" ", 1)[1]
+            return None
+    return None
+
+
+class AuthMiddleware:
     """
-    Middleware that extracts JWT bearer token from Authorization header,
-    verifies it, and sets request.state.user for downstream handlers.
+    ASGI middleware that extracts the JWT bearer token from the
+    Authorization header, verifies it, and sets request.state.token_payload
+    and request.state.user_loader for downstream dependencies.
 
-    Public paths are skipped.
+    Public paths and CORS preflight requests are skipped.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip public paths
-        if request.url.path in PUBLIC_PATHS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Skip OPTIONS (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] in PUBLIC_PATHS
+            or scope["method"] == "OPTIONS"
+        ):
+            await self.app(scope, receive, send)
+            return
 
-        # Extract token
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ", 1)[1]
+        token = _get_bearer_token(scope)
+        if token:
             payload = verify_access_token(token)
+            user_id = payload.get("sub") if payload else None
+            if user_id and not await revocation_list.is_revoked(payload):
+                state = scope.setdefault("state", {})
+                state["token_payload"] = payload
+                state["user_loader"] = UserLoader(user_id)
 
-            if payload:
-                user_id = payload.get("sub")
-                if user_id:
-                    # Fetch user from DB
-                    async with async_session_factory() as session:
-                        user_repo = UserRepository(session)
-                        user = await user_repo.get_by_id(user_id)
-                        if user and user.is_active:
-                            request.state.user = user
-
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
@@ -4,5 +4,11 @@ from app.models.user import User, UserRole
 from app.models.otp import OTPCode
 from app.models.property import Property
 from app.models.unit import Unit
+from app.models.portfolio import PortfolioRollup
+from app.models.token_revocation import TokenRevocation
+from app.models.outbox import OutboxMessage
 
-__all__ = ["User", "UserRole", "OTPCode", "Property", "Unit"]
+__all__ = [
+    "User", "UserRole", "OTPCode", "Property", "Unit", "PortfolioRollup",
+    "TokenRevocation", "OutboxMessage",
+]
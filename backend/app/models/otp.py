@@ -5,7 +5,7 @@ OTP (One-Time Password) model for email/phone verification.
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -15,6 +15,16 @@ class OTPCode(Base):
     """OTP verification code model."""
 
     __tablename__ = "otp_codes"
+    __table_args__ = (
+        # Serves get_latest_valid / invalidate_all lookups
+        Index(
+            "ix_otp_codes_user_purpose_used_created",
+            "user_id",
+            "purpose",
+            "is_used",
+            "created_at",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -37,6 +47,7 @@ class OTPCode(Base):
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
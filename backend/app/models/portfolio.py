@@ -0,0 +1,34 @@
+"""
+Owner portfolio rollup model for Amarati.
+"""
+
+from sqlalchemy import ForeignKey, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PortfolioRollup(Base):
+    """
+    Per-owner totals over all their properties, kept in step with
+    property and unit writes so dashboards read one row instead of
+    aggregating units. Repaired by app.tasks.portfolio_rollup_rebuild.
+    """
+
+    __tablename__ = "portfolio_rollups"
+
+    owner_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    property_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    total_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    occupied_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    vacant_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    maintenance_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Monthly rent of occupied units
+    rent_roll: Mapped[float] = mapped_column(Numeric(14, 2), default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<PortfolioRollup {self.owner_id}>"
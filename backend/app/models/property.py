@@ -6,10 +6,11 @@ import uuid
 from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, Numeric, String, Text, event, inspect
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.geo import GEOHASH_PRECISION, encode_geohash
 
 
 class PropertyType(str, PyEnum):
@@ -22,6 +23,13 @@ class Property(Base):
     """Property model."""
 
     __tablename__ = "properties"
+    __table_args__ = (
+        # Serve keyset-paginated listings (all properties / per owner)
+        Index("ix_properties_created_at_id", "created_at", "id"),
+        Index("ix_properties_owner_id_created_at_id", "owner_id", "created_at", "id"),
+        # Serves owner listings narrowed by city
+        Index("ix_properties_owner_id_city", "owner_id", "city"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -30,7 +38,7 @@ class Property(Base):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     address: Mapped[str] = mapped_column(Text, nullable=False)
-    city: Mapped[str] = mapped_column(String(100), nullable=False)
+    city: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     type: Mapped[PropertyType] = mapped_column(
         Enum(PropertyType),
         nullable=False,
@@ -46,11 +54,25 @@ class Property(Base):
         String(36),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
-    total_units: Mapped[int] = mapped_column(Integer, default=0)
+    # Unit counters, kept in step with unit writes by UnitService and
+    # repaired by app.tasks.unit_counter_reconcile
+    total_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    occupied_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    vacant_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    maintenance_units: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Monthly rent of occupied units
+    rent_roll: Mapped[float] = mapped_column(Numeric(12, 2), default=0, server_default="0")
     image_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Optional location; geohash is derived from it on every ORM write and
+    # indexed so proximity searches range-scan a few cells
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    geohash: Mapped[str | None] = mapped_column(String(GEOHASH_PRECISION), nullable=True, index=True)
     
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -59,7 +81,112 @@ class Property(Base):
     )
 
     # Relationships
-    units = relationship("Unit", back_populates="property", cascade="all, delete-orphan")
+    units = relationship(
+        "Unit",
+        back_populates="property",
+        cascade="all, delete-orphan",
+        order_by="(Unit.created_at, Unit.id)",
+    )
+
+    @property
+    def loaded_units(self):
+        """Units if they were eager-loaded, else None (never lazy-loads)."""
+        return None if "units" in inspect(self).unloaded else self.units
 
     def __repr__(self) -> str:
         return f"<Property {self.name}>"
+
+
+@event.listens_for(Property, "before_insert")
+@event.listens_for(Property, "before_update")
+def _sync_geohash(mapper, connection, target: Property) -> None:
+    """Keep the geohash in step with latitude/longitude."""
+    located = target.latitude is not None and target.longitude is not None
+    target.geohash = encode_geohash(target.latitude, target.longitude) if located else None
+
+
+# ── Full-text search index ─────────────────────────────────────────
+# Dialect specific, so kept outside the ORM mapping: an external-content
+# FTS5 table synced by triggers on SQLite, a generated tsvector column
+# with a GIN index on PostgreSQL. Both stay in sync with every write,
+# including Core/bulk statements. Created alongside the table here
+# (create_all) and by the property_search migrations in deployed databases.
+#
+# The FTS5 rows are keyed on search_rowid, an explicit INTEGER column
+# assigned on insert, not on the implicit rowid of this String-keyed
+# table, which VACUUM may renumber. Table-recreating migrations (Alembic
+# batch mode) drop the triggers, though: run app.tasks.property_search_rebuild
+# after one, and after restoring properties from a dump.
+SQLITE_SEARCH_KEY_DDL = [
+    "ALTER TABLE properties ADD COLUMN search_rowid INTEGER",
+    "CREATE UNIQUE INDEX ix_properties_search_rowid ON properties (search_rowid)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5(
+        name, address, city, description,
+        content='properties', content_rowid='search_rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    # Writes are serialized on SQLite, so max() + 1 is unique
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_ai AFTER INSERT ON properties BEGIN
+        UPDATE properties
+        SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM properties)
+        WHERE id = new.id AND search_rowid IS NULL;
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        SELECT search_rowid, name, address, city, description FROM properties WHERE id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_ad AFTER DELETE ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.search_rowid, old.name, old.address, old.city, old.description);
+    END
+    """,
+    # Only text edits reindex; counter updates leave the index alone
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_au AFTER UPDATE OF name, address, city, description
+    ON properties BEGIN
+        INSERT INTO properties_fts(properties_fts, rowid, name, address, city, description)
+        VALUES ('delete', old.search_rowid, old.name, old.address, old.city, old.description);
+        INSERT INTO properties_fts(rowid, name, address, city, description)
+        VALUES (new.search_rowid, new.name, new.address, new.city, new.description);
+    END
+    """,
+]
+
+# Repairs the index (see app.tasks.property_search_rebuild): key rows
+# inserted while the triggers were missing, then reindex every row
+SQLITE_SEARCH_REBUILD = [
+    """
+    UPDATE properties
+    SET search_rowid = (SELECT coalesce(max(search_rowid), 0) FROM properties) + rowid
+    WHERE search_rowid IS NULL
+    """,
+    "INSERT INTO properties_fts(properties_fts) VALUES ('rebuild')",
+]
+
+POSTGRES_SEARCH_DDL = [
+    """
+    ALTER TABLE properties ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(city, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(address, '')), 'C') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX ix_properties_search_vector ON properties USING gin (search_vector)",
+]
+
+for _statement in SQLITE_SEARCH_KEY_DDL + SQLITE_SEARCH_DDL:
+    event.listen(Property.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Property.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+event.listen(
+    Property.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS properties_fts").execute_if(dialect="sqlite"),
+)
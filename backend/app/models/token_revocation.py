@@ -0,0 +1,58 @@
+"""
+Token revocation model: revoked access tokens and per-user cut-offs.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class TokenRevocation(Base):
+    """
+    A revoked access token (by jti) or a user-level revocation that
+    invalidates every token issued at or before `revoked_before`.
+    Rows can be deleted once `expires_at` has passed.
+    """
+
+    __tablename__ = "token_revocations"
+
+    id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    jti: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        unique=True,
+        index=True,
+    )
+    user_id: Mapped[str | None] = mapped_column(
+        String(36),
+        nullable=True,
+        index=True,
+    )
+    revoked_before: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+    # Indexed for the cross-worker sync poll (see core.revocation)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        target = f"jti={self.jti}" if self.jti else f"user={self.user_id}"
+        return f"<TokenRevocation {target}>"
@@ -3,9 +3,10 @@ Unit model for Amarati.
 """
 
 import uuid
+from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -21,6 +22,15 @@ class Unit(Base):
     """Unit model representing a single apartment, office, etc."""
 
     __tablename__ = "units"
+    __table_args__ = (
+        # Serves keyset-paginated per-property listings
+        Index("ix_units_property_id_created_at_id", "property_id", "created_at", "id"),
+        # Serves per-property counts and status filters
+        Index("ix_units_property_id_status", "property_id", "status"),
+        # Serve portfolio-wide /units/search filters
+        Index("ix_units_status_bedrooms_rent_amount", "status", "bedrooms", "rent_amount"),
+        Index("ix_units_rent_amount", "rent_amount"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -49,6 +59,13 @@ class Unit(Base):
         String(36),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
     )
 
     # Relationships
@@ -7,7 +7,7 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -26,6 +26,10 @@ class User(Base):
     """User account model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Serves keyset-paginated user listings
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
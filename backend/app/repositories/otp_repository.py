@@ -2,25 +2,25 @@
 OTP repository: database operations for OTP codes.
 """
 
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import delete, or_, select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.otp import OTPCode
+from app.repositories.otp_store import OTPStore
 
 
-class OTPRepository:
-    """Data access layer for OTP codes."""
+class OTPRepository(OTPStore):
+    """Data access layer for OTP codes (SQL implementation of OTPStore)."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(self, otp: OTPCode) -> OTPCode:
-        """Insert a new OTP code."""
+        """Stage a new OTP code (inserted when the request commits)."""
         self.db.add(otp)
-        await self.db.flush()
-        await self.db.refresh(otp)
         return otp
 
     async def get_latest_valid(
@@ -48,22 +48,44 @@ class OTPRepository:
     async def mark_used(self, otp: OTPCode) -> OTPCode:
         """Mark an OTP as used."""
         otp.is_used = True
-        await self.db.flush()
-        await self.db.refresh(otp)
         return otp
 
     async def invalidate_all(self, user_id: str, purpose: str = "verification") -> None:
-        """Mark all unused OTPs for a user/purpose as used."""
-        result = await self.db.execute(
-            select(OTPCode).where(
+        """Mark all unused OTPs for a user/purpose as used (single UPDATE)."""
+        await self.db.execute(
+            update(OTPCode)
+            .where(
                 and_(
                     OTPCode.user_id == user_id,
                     OTPCode.purpose == purpose,
                     OTPCode.is_used == False,  # noqa: E712
                 )
             )
+            .values(is_used=True)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_purgeable_batch(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        Delete up to batch_size codes that expired, or were used, before
+        cutoff. Returns the number of rows deleted.
+        """
+        batch_ids = (
+            select(OTPCode.id)
+            .where(
+                or_(
+                    OTPCode.expires_at < cutoff,
+                    and_(
+                        OTPCode.is_used == True,  # noqa: E712
+                        OTPCode.created_at < cutoff,
+                    ),
+                )
+            )
+            .limit(batch_size)
+        )
+        result = await self.db.execute(
+            delete(OTPCode)
+            .where(OTPCode.id.in_(batch_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
         )
-        otps = result.scalars().all()
-        for otp in otps:
-            otp.is_used = True
-        await self.db.flush()
+        return result.rowcount or 0
@@ -0,0 +1,109 @@
+"""
+OTP storage interface and an in-memory TTL implementation.
+
+AuthService depends only on OTPStore. The SQL implementation is
+OTPRepository; InMemoryOTPStore keeps codes in process memory so OTP
+traffic skips the database entirely in single-node deployments.
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.otp import OTPCode
+
+settings = get_settings()
+
+
+class OTPStore(ABC):
+    """Storage operations AuthService needs for OTP codes."""
+
+    @abstractmethod
+    async def create(self, otp: OTPCode) -> OTPCode:
+        """Store a new OTP code."""
+
+    @abstractmethod
+    async def get_latest_valid(
+        self,
+        user_id: str,
+        purpose: str = "verification",
+    ) -> Optional[OTPCode]:
+        """Get the latest unused OTP for a user (may be expired)."""
+
+    @abstractmethod
+    async def mark_used(self, otp: OTPCode) -> OTPCode:
+        """Mark an OTP as used."""
+
+    @abstractmethod
+    async def invalidate_all(self, user_id: str, purpose: str = "verification") -> None:
+        """Mark all unused OTPs for a user/purpose as used."""
+
+
+class InMemoryOTPStore(OTPStore):
+    """
+    Process-local OTP store. Codes are dropped once they have been
+    expired for longer than `retention`. Not shared between workers.
+    """
+
+    def __init__(self, retention: timedelta = timedelta(minutes=settings.OTP_EXPIRE_MINUTES)):
+        self.retention = retention
+        self._codes: dict[tuple[str, str], list[OTPCode]] = {}
+
+    def _prune(self, key: tuple[str, str]) -> list[OTPCode]:
+        cutoff = datetime.now(timezone.utc) - self.retention
+        codes = [otp for otp in self._codes.get(key, []) if otp.expires_at > cutoff]
+        if codes:
+            self._codes[key] = codes
+        else:
+            self._codes.pop(key, None)
+        return codes
+
+    async def create(self, otp: OTPCode) -> OTPCode:
+        otp.id = otp.id or str(uuid.uuid4())
+        otp.created_at = otp.created_at or datetime.now(timezone.utc)
+        otp.is_used = bool(otp.is_used)
+        key = (otp.user_id, otp.purpose)
+        self._prune(key)
+        self._codes.setdefault(key, []).append(otp)
+        return otp
+
+    async def get_latest_valid(
+        self,
+        user_id: str,
+        purpose: str = "verification",
+    ) -> Optional[OTPCode]:
+        for otp in reversed(self._prune((user_id, purpose))):
+            if not otp.is_used:
+                return otp
+        return None
+
+    async def mark_used(self, otp: OTPCode) -> OTPCode:
+        otp.is_used = True
+        return otp
+
+    async def invalidate_all(self, user_id: str, purpose: str = "verification") -> None:
+        for otp in self._codes.get((user_id, purpose), []):
+            otp.is_used = True
+
+    def purge_expired(self) -> int:
+        """Drop codes expired for longer than retention; returns codes removed."""
+        before = sum(len(codes) for codes in self._codes.values())
+        for key in list(self._codes):
+            self._prune(key)
+        return before - sum(len(codes) for codes in self._codes.values())
+
+
+memory_otp_store = InMemoryOTPStore()
+
+
+def get_otp_store(db: AsyncSession) -> OTPStore:
+    """Return the OTP store selected by settings.OTP_STORE."""
+    if settings.OTP_STORE == "memory":
+        return memory_otp_store
+
+    from app.repositories.otp_repository import OTPRepository
+    return OTPRepository(db)
@@ -0,0 +1,127 @@
+"""
+Outbox repository: database operations for outbound notifications.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.outbox import OutboxMessage
+
+
+class OutboxRepository:
+    """Data access layer for the notification outbox."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, message: OutboxMessage) -> OutboxMessage:
+        """Stage a message; it is committed with the caller's transaction."""
+        self.db.add(message)
+        return message
+
+    async def claim_due_batch(
+        self, now: datetime, limit: int, lease_until: datetime
+    ) -> list[OutboxMessage]:
+        """
+        Lease up to `limit` due pending messages to the caller and return
+        them. Leased messages stay pending but are not due again until
+        `lease_until`, so other workers skip them while they are being sent
+        and pick them up again if this worker dies. The claim is a single
+        UPDATE (rows locked by another worker are skipped on PostgreSQL).
+        """
+        lease_id = str(uuid.uuid4())
+        due = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status == "pending",
+                OutboxMessage.next_attempt_at <= now,
+            )
+            .order_by(OutboxMessage.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        await self.db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due.scalar_subquery()))
+            .values(lease_id=lease_id, next_attempt_at=lease_until)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(
+            select(OutboxMessage).where(OutboxMessage.lease_id == lease_id)
+        )
+        return list(result.scalars().all())
+
+    async def record_outcomes(self, outcomes: list[dict[str, Any]]) -> None:
+        """
+        Apply sent_values()/failed_values() results in one executemany.
+        Rows whose lease has passed to another worker are left alone.
+        """
+        if not outcomes:
+            return
+        table = OutboxMessage.__table__
+        stmt = update(table).where(
+            table.c.id == bindparam("message_id"),
+            table.c.lease_id == bindparam("held_lease_id"),
+        )
+        conn = await self.db.connection()
+        await conn.execute(stmt, outcomes)
+
+    @staticmethod
+    def sent_values(message: OutboxMessage) -> dict[str, Any]:
+        """Record a delivery; the body (which may hold an OTP) is cleared."""
+        return {
+            **_release(message),
+            "body": "",
+            "status": "sent",
+            "attempts": message.attempts + 1,
+            "sent_at": datetime.now(timezone.utc),
+            "last_error": None,
+            "next_attempt_at": message.next_attempt_at,
+        }
+
+    @staticmethod
+    def failed_values(message: OutboxMessage, error: str, retry_at: datetime | None) -> dict[str, Any]:
+        """
+        Record a failed attempt; retry_at=None gives up on the message and
+        clears its body.
+        """
+        return {
+            **_release(message),
+            "body": message.body if retry_at is not None else "",
+            "status": "pending" if retry_at is not None else "failed",
+            "attempts": message.attempts + 1,
+            "sent_at": None,
+            "last_error": error[:2000],
+            "next_attempt_at": retry_at or message.next_attempt_at,
+        }
+
+
+    async def delete_finished_batch(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        Delete up to batch_size sent or failed messages whose last attempt
+        was before cutoff. Returns the number of rows deleted.
+        """
+        # next_attempt_at holds the lease expiry of the final attempt
+        batch_ids = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status.in_(("sent", "failed")),
+                OutboxMessage.next_attempt_at < cutoff,
+            )
+            .limit(batch_size)
+        )
+        result = await self.db.execute(
+            delete(OutboxMessage)
+            .where(OutboxMessage.id.in_(batch_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+
+def _release(message: OutboxMessage) -> dict[str, Any]:
+    """Match the message under its current lease and clear the lease."""
+    return {"message_id": message.id, "held_lease_id": message.lease_id, "lease_id": None}
@@ -0,0 +1,133 @@
+"""
+Owner portfolio rollup repository for Amarati.
+"""
+
+from typing import Any, List, Mapping, Optional
+from sqlalchemy import bindparam, func, or_, select, union, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.portfolio import PortfolioRollup
+from app.models.property import Property
+from app.models.user import User
+from app.repositories.property_repository import UNIT_COUNTER_COLUMNS, counter_delta_rows
+
+settings = get_settings()
+
+
+def _insert():
+    """INSERT construct with ON CONFLICT support for the configured database."""
+    if settings.is_postgres:
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+class PortfolioRepository:
+    """Repository for per-owner portfolio rollups."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, owner_id: str) -> Optional[PortfolioRollup]:
+        """An owner's rollup row (served from the session if already loaded), if any."""
+        return await self.db.get(PortfolioRollup, owner_id)
+
+    async def add_property(self, owner_id: str) -> None:
+        """Count a new (unit-less) property, creating the owner's row if needed."""
+        table = PortfolioRollup.__table__
+        stmt = _insert()(table).values(owner_id=owner_id, property_count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.owner_id],
+            set_={"property_count": table.c.property_count + 1},
+        )
+        await self.db.execute(stmt)
+
+    async def remove_property(self, property_id: str) -> None:
+        """Subtract a property and its counters; run before deleting it."""
+        table = PortfolioRollup.__table__
+        owned = select(Property.owner_id).where(Property.id == property_id).scalar_subquery()
+        values: dict[str, Any] = {"property_count": table.c.property_count - 1}
+        for column in UNIT_COUNTER_COLUMNS:
+            counter = select(Property.__table__.c[column]).where(Property.id == property_id)
+            values[column] = table.c[column] - counter.scalar_subquery()
+        await self.db.execute(update(table).where(table.c.owner_id == owned).values(values))
+
+    async def adjust_unit_counters(self, deltas: Mapping[str, Mapping[str, Any]]) -> int:
+        """
+        Add per-property deltas ({property_id: {column: delta}}) to the
+        owning portfolios as `col = col + :delta` (one executemany).
+        """
+        rows = counter_delta_rows(deltas)
+        if not rows:
+            return 0
+        table = PortfolioRollup.__table__
+        owned = select(Property.owner_id).where(Property.id == bindparam("property_id"))
+        stmt = (
+            update(table)
+            .where(table.c.owner_id == owned.scalar_subquery())
+            .values({c: table.c[c] + bindparam(f"d_{c}") for c in UNIT_COUNTER_COLUMNS})
+        )
+        conn = await self.db.connection()
+        result = await conn.execute(stmt, rows if len(rows) > 1 else rows[0])
+        return result.rowcount
+
+    # ── Rebuild ──────────────────────────────────────────────
+    async def get_owner_ids_after(self, after_id: Optional[str], limit: int) -> List[str]:
+        """Owners with properties or a rollup row, in ID order after `after_id`."""
+        owners = union(
+            select(Property.owner_id.label("owner_id")),
+            select(PortfolioRollup.owner_id.label("owner_id")),
+        ).subquery()
+        query = select(owners.c.owner_id).order_by(owners.c.owner_id).limit(limit)
+        if after_id is not None:
+            query = query.where(owners.c.owner_id > after_id)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def reconcile(self, owner_ids: List[str]) -> int:
+        """
+        Re-sum the given owners' properties and overwrite rollups that
+        have drifted (creating missing rows). Returns the rows repaired.
+        """
+        if not owner_ids:
+            return 0
+        table = PortfolioRollup.__table__
+        missing = select(User.id).where(
+            User.id.in_(owner_ids),
+            ~select(table.c.owner_id).where(table.c.owner_id == User.id).exists(),
+        )
+        await self.db.execute(_insert()(table).from_select(["owner_id"], missing))
+        # Lock the rollups before re-summing so the UPDATE reads a snapshot
+        # that includes property changes committed while it waited (see
+        # PropertyRepository.reconcile_unit_counters)
+        await self.db.execute(
+            select(table.c.owner_id)
+            .where(table.c.owner_id.in_(owner_ids))
+            .order_by(table.c.owner_id)
+            .with_for_update()
+        )
+
+        properties = Property.__table__
+        actual = {
+            "property_count": select(func.count())
+            .select_from(properties)
+            .where(properties.c.owner_id == table.c.owner_id)
+            .scalar_subquery()
+        }
+        for column in UNIT_COUNTER_COLUMNS:
+            actual[column] = (
+                select(func.coalesce(func.sum(properties.c[column]), 0))
+                .where(properties.c.owner_id == table.c.owner_id)
+                .scalar_subquery()
+            )
+        result = await self.db.execute(
+            update(table)
+            .where(
+                table.c.owner_id.in_(owner_ids),
+                or_(*(table.c[c] != total for c, total in actual.items())),
+            )
+            .values(actual)
+        )
+        return result.rowcount
@@ -2,12 +2,45 @@
 Property repository for Amarati.
 """
 
-from typing import List, Optional
-from sqlalchemy import select, func
+import math
+import re
+from typing import Any, Iterable, List, Mapping, Optional
+from sqlalchemy import Select, and_, bindparam, case, column, func, literal_column, or_, select, table, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.models.property import Property
+from app.config import get_settings
+from app.models.property import Property, PropertyType
+from app.models.unit import Unit, UnitStatus
 from app.schemas.property import PropertyCreate, PropertyUpdate
+from app.utils.geo import KM_PER_DEGREE, bounding_box, covering_cells
+from app.utils.helpers import chunked
+from app.utils.pagination import Page, paginate
+
+settings = get_settings()
+
+# Keeps IN (...) lists well below SQLite's bound-parameter limit
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Built once so per-request lookups reuse the cached compiled statement
+_PROPERTY_WITH_UNITS_BY_ID = (
+    select(Property)
+    .where(Property.id == bindparam("property_id"))
+    .options(selectinload(Property.units))
+)
+
+# Upper bound on geohash range scans per proximity search
+GEO_MAX_CELLS = 9
+
+# Counter column on properties for each unit status
+UNIT_STATUS_COUNTERS = {
+    UnitStatus.OCCUPIED: "occupied_units",
+    UnitStatus.VACANT: "vacant_units",
+    UnitStatus.MAINTENANCE: "maintenance_units",
+}
+# Rollup columns shared by properties and portfolio_rollups; rent_roll
+# sums rent_amount over occupied units
+UNIT_COUNTER_COLUMNS = ("total_units", *UNIT_STATUS_COUNTERS.values(), "rent_roll")
 
 
 class PropertyRepository:
@@ -20,14 +53,27 @@ class PropertyRepository:
         """Create a new property."""
         db_property = Property(**property_in.model_dump())
         self.db.add(db_property)
-        await self.db.commit()
-        await self.db.refresh(db_property)
+        # Assigns the client-side id/created_at; the request commits later
+        await self.db.flush()
         return db_property
 
-    async def get_by_id(self, property_id: str) -> Optional[Property]:
-        """Get property by ID."""
-        result = await self.db.execute(select(Property).where(Property.id == property_id))
-        return result.scalars().first()
+    async def get_by_id(self, property_id: str, include_units: bool = False) -> Optional[Property]:
+        """
+        Get property by ID (served from the session if already loaded),
+        optionally with its units (one extra query).
+        """
+        if not include_units:
+            return await self.db.get(Property, property_id)
+        result = await self.db.execute(_PROPERTY_WITH_UNITS_BY_ID, {"property_id": property_id})
+        return result.scalar_one_or_none()
+
+    async def get_existing_ids(self, property_ids: Iterable[str]) -> set[str]:
+        """Return which of the given property IDs exist."""
+        existing: set[str] = set()
+        for chunk in chunked(list(set(property_ids)), IN_CLAUSE_CHUNK_SIZE):
+            result = await self.db.execute(select(Property.id).where(Property.id.in_(chunk)))
+            existing.update(result.scalars().all())
+        return existing
 
     async def get_multi(
         self, 
@@ -35,38 +81,58 @@ class PropertyRepository:
         limit: int = 100,
         owner_id: Optional[str] = None,
         supervisor_id: Optional[str] = None,
-        city: Optional[str] = None
-    ) -> List[Property]:
-        """Get multiple properties with optional filters."""
+        city: Optional[str] = None,
+        cursor: Optional[str] = None,
+        total: Optional[str] = None,
+        include_units: bool = False,
+        property_type: Optional[PropertyType] = None,
+        search: Optional[str] = None,
+        near: Optional[tuple[float, float]] = None,
+        radius_km: float = settings.GEO_DEFAULT_RADIUS_KM,
+    ) -> Page[Property]:
+        """
+        Get a page of properties (newest first) with optional filters.
+        `total` ("exact"/"estimate") also returns the matching row count;
+        `include_units` loads the page's units in one extra SELECT ... IN.
+        `search` matches words (by prefix) in name, address, city and
+        description through the full-text index, best matches first.
+        `near` (lat, lon) keeps properties within `radius_km`, nearest first.
+        """
         query = select(Property)
+        if include_units:
+            query = query.options(selectinload(Property.units))
         if owner_id:
             query = query.where(Property.owner_id == owner_id)
         if supervisor_id:
             query = query.where(Property.supervisor_id == supervisor_id)
         if city:
             query = query.where(Property.city == city)
-        
-        result = await self.db.execute(query.offset(skip).limit(limit))
-        return result.scalars().all()
+        if property_type:
+            query = query.where(Property.type == property_type)
+
+        order_by = None
+        terms = _search_terms(search)
+        if terms:
+            query, order_by = _apply_search(query, terms)
+        if near is not None:
+            query, order_by = _apply_near(query, near, radius_km)
+
+        return await paginate(
+            self.db, query, Property.created_at, Property.id,
+            limit=limit, skip=skip, cursor=cursor, descending=True, total=total,
+            order_by=order_by,
+        )
 
     async def update(self, db_property: Property, property_in: PropertyUpdate) -> Property:
         """Update a property."""
         update_data = property_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_property, field, value)
-        
-        await self.db.commit()
-        await self.db.refresh(db_property)
         return db_property
 
-    async def delete(self, property_id: str) -> bool:
-        """Delete a property."""
-        db_property = await self.get_by_id(property_id)
-        if not db_property:
-            return False
+    async def delete(self, db_property: Property) -> None:
+        """Stage a property (and its units) for deletion."""
         await self.db.delete(db_property)
-        await self.db.commit()
-        return True
 
     async def count(self, owner_id: Optional[str] = None) -> int:
         """Count properties."""
@@ -75,3 +141,180 @@ class PropertyRepository:
             query = query.where(Property.owner_id == owner_id)
         result = await self.db.execute(query)
         return result.scalar() or 0
+
+    # ── Unit counters and rent roll ──────────────────────────
+    async def adjust_unit_counters(self, deltas: Mapping[str, Mapping[str, int]]) -> int:
+        """
+        Add per-property deltas ({property_id: {column: delta}}) to the unit
+        counters as `col = col + :delta`, so concurrent writers never lose
+        updates. Returns the number of property rows updated.
+        """
+        rows = counter_delta_rows(deltas)
+        if not rows:
+            return 0
+        table = Property.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("property_id"))
+            .values({c: table.c[c] + bindparam(f"d_{c}") for c in UNIT_COUNTER_COLUMNS})
+        )
+        # Core statement on the session's connection: one executemany, and
+        # no ORM bulk-by-primary-key handling of the parameter sets
+        conn = await self.db.connection()
+        result = await conn.execute(stmt, rows if len(rows) > 1 else rows[0])
+        return result.rowcount
+
+    async def get_ids_after(self, after_id: Optional[str], limit: int) -> List[str]:
+        """Property IDs in ID order, starting after `after_id` (for batch jobs)."""
+        query = select(Property.id).order_by(Property.id).limit(limit)
+        if after_id is not None:
+            query = query.where(Property.id > after_id)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def reconcile_unit_counters(self, property_ids: List[str]) -> int:
+        """
+        Recount units (and rent roll) for the given properties and overwrite
+        counters that have drifted, in one UPDATE. Returns the number of
+        rows repaired.
+        """
+        if not property_ids:
+            return 0
+        # Lock the batch (in id order) before recounting. Under READ
+        # COMMITTED the UPDATE's subqueries would otherwise use a snapshot
+        # taken before it waited on a concurrent unit write's row lock, and
+        # write back a count that misses it. KEY SHARE locks taken by unit
+        # inserts are not blocked. SQLite ignores this; its writer is exclusive.
+        await self.db.execute(
+            select(Property.id)
+            .where(Property.id.in_(property_ids))
+            .order_by(Property.id)
+            .with_for_update(key_share=True)
+        )
+        actual = {"total_units": _unit_count()}
+        for status, column in UNIT_STATUS_COUNTERS.items():
+            actual[column] = _unit_count(status)
+        actual["rent_roll"] = _unit_rent_roll()
+        table = Property.__table__
+        result = await self.db.execute(
+            update(Property)
+            .where(
+                Property.id.in_(property_ids),
+                or_(*(table.c[c] != count for c, count in actual.items())),
+            )
+            .values(actual)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+def counter_delta_rows(deltas: Mapping[str, Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Executemany parameters ({property_id, d_<column>}) for non-zero deltas."""
+    return [
+        {"property_id": property_id, **{f"d_{c}": delta.get(c, 0) for c in UNIT_COUNTER_COLUMNS}}
+        for property_id, delta in deltas.items()
+        if any(delta.values())
+    ]
+
+
+def _search_terms(search: Optional[str]) -> list[str]:
+    """Words of a search string; punctuation and query syntax are dropped."""
+    return re.findall(r"\w+", search.lower()) if search else []
+
+
+def _apply_search(query: Select, terms: list[str]) -> tuple[Select, list[Any]]:
+    """
+    Restrict `query` to properties matching every term (as a prefix) and
+    return it with a best-match-first ordering.
+    """
+    if settings.is_sqlite:
+        fts = table("properties_fts", column("rowid"))
+        match = " ".join(f'"{term}"*' for term in terms)
+        # Rank inside a subquery: FTS5 auxiliary functions such as bm25()
+        # cannot be evaluated next to the page's count(*) OVER () window.
+        # Weights follow the FTS column order: name, address, city, description
+        matches = (
+            select(
+                fts.c.rowid.label("rowid"),
+                func.bm25(literal_column("properties_fts"), 10.0, 2.0, 5.0, 1.0).label("rank"),
+            )
+            .where(literal_column("properties_fts").op("MATCH")(match))
+            .subquery("fts_match")
+        )
+        query = query.join(matches, matches.c.rowid == literal_column("properties.search_rowid"))
+        return query, [matches.c.rank, Property.id]
+
+    if settings.is_postgres:
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        vector = literal_column("properties.search_vector")
+        query = query.where(vector.op("@@")(tsquery))
+        return query, [func.ts_rank_cd(vector, tsquery).desc(), Property.id]
+
+    # Other databases: unindexed substring match, newest first
+    for term in terms:
+        pattern = f"%{term}%"
+        query = query.where(or_(
+            Property.name.ilike(pattern),
+            Property.address.ilike(pattern),
+            Property.city.ilike(pattern),
+            Property.description.ilike(pattern),
+        ))
+    return query, [Property.created_at.desc(), Property.id.desc()]
+
+
+def _apply_near(query: Select, near: tuple[float, float], radius_km: float) -> tuple[Select, list[Any]]:
+    """
+    Restrict `query` to located properties within `radius_km` of `near`
+    and return it with a nearest-first ordering.
+
+    The geohash index narrows rows to a few covering cells (each a range
+    scan); the bounding box and an equirectangular distance, plain
+    arithmetic that runs on any database, then trim and order them. The
+    approximation is negligible at city scale and stays within a few
+    percent of great-circle distance at GEO_MAX_RADIUS_KM below the
+    polar regions.
+    """
+    latitude, longitude = near
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    cells = covering_cells(latitude, longitude, radius_km, GEO_MAX_CELLS)
+    query = query.where(Property.geohash.is_not(None))
+    if cells:
+        # "~" sorts after every geohash character: [cell, cell~) is the prefix
+        query = query.where(or_(*(
+            and_(Property.geohash >= cell, Property.geohash < cell + "~") for cell in cells
+        )))
+    query = query.where(Property.latitude.between(min_lat, max_lat))
+    if min_lon < -180 or max_lon > 180:
+        # The box crosses the antimeridian: keep both sides
+        query = query.where(or_(
+            Property.longitude >= (min_lon + 540) % 360 - 180,
+            Property.longitude <= (max_lon + 540) % 360 - 180,
+        ))
+    elif max_lon - min_lon < 360:
+        query = query.where(Property.longitude.between(min_lon, max_lon))
+
+    # Longitude difference folded into [-180, 180], scaled to ground distance
+    dlon = Property.longitude - longitude
+    dlon = case((dlon > 180, dlon - 360), (dlon < -180, dlon + 360), else_=dlon)
+    dx = dlon * math.cos(math.radians(latitude))
+    dy = Property.latitude - latitude
+    squared = dx * dx + dy * dy
+    query = query.where(squared <= (radius_km / KM_PER_DEGREE) ** 2)
+    return query, [squared, Property.id]
+
+
+def _unit_count(status: Optional[UnitStatus] = None):
+    """Correlated count of a property's units (optionally by status)."""
+    query = select(func.count()).select_from(Unit).where(Unit.property_id == Property.id)
+    if status is not None:
+        query = query.where(Unit.status == status)
+    return query.scalar_subquery()
+
+
+def _unit_rent_roll():
+    """Correlated sum of rent over a property's occupied units."""
+    return (
+        select(func.coalesce(func.sum(Unit.rent_amount), 0))
+        .where(Unit.property_id == Property.id, Unit.status == UnitStatus.OCCUPIED)
+        .scalar_subquery()
+    )
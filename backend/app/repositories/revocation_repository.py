@@ -0,0 +1,109 @@
+"""
+Token revocation repository: database operations for revoked tokens.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.token_revocation import TokenRevocation
+
+
+class RevocationRepository:
+    """Data access layer for token revocations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def revoke_jti(self, jti: str, user_id: str, expires_at: datetime) -> TokenRevocation:
+        """Record a single revoked token (idempotent per jti)."""
+        existing = await self.db.execute(
+            select(TokenRevocation).where(TokenRevocation.jti == jti)
+        )
+        revocation = existing.scalar_one_or_none()
+        if revocation:
+            return revocation
+
+        revocation = TokenRevocation(jti=jti, user_id=user_id, expires_at=expires_at)
+        self.db.add(revocation)
+        return revocation
+
+    async def revoke_user(
+        self, user_id: str, revoked_before: datetime, expires_at: datetime
+    ) -> TokenRevocation:
+        """Record a cut-off that revokes all of a user's earlier tokens."""
+        revocation = TokenRevocation(
+            user_id=user_id,
+            revoked_before=revoked_before,
+            expires_at=expires_at,
+        )
+        self.db.add(revocation)
+        return revocation
+
+    async def is_jti_revoked(self, jti: str) -> bool:
+        """Check whether a token ID has been revoked."""
+        result = await self.db.execute(
+            select(TokenRevocation.id).where(TokenRevocation.jti == jti).limit(1)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def get_user_revoked_before(self, user_id: str) -> Optional[datetime]:
+        """Get the latest user-level revocation cut-off, if any."""
+        result = await self.db.execute(
+            select(func.max(TokenRevocation.revoked_before)).where(
+                TokenRevocation.user_id == user_id,
+                TokenRevocation.revoked_before.is_not(None),
+            )
+        )
+        return result.scalar()
+
+    async def get_active(self, now: datetime) -> list[tuple[Optional[str], Optional[str]]]:
+        """
+        Get all unexpired revocations as (jti, user_id) pairs.
+        Exactly one element is set: jti for token revocations,
+        user_id for user-level cut-offs.
+        """
+        result = await self.db.execute(
+            select(
+                TokenRevocation.jti,
+                TokenRevocation.user_id,
+                TokenRevocation.revoked_before,
+            ).where(TokenRevocation.expires_at > now)
+        )
+        return [
+            (row.jti, None) if row.jti else (None, row.user_id)
+            for row in result
+            if row.jti or row.revoked_before is not None
+        ]
+
+    async def get_created_since(
+        self, since: datetime
+    ) -> tuple[list[tuple[Optional[str], Optional[str]]], Optional[datetime]]:
+        """
+        Get revocations recorded after `since` as (jti, user_id) pairs (see
+        get_active), plus the newest created_at among them.
+        """
+        result = await self.db.execute(
+            select(
+                TokenRevocation.jti,
+                TokenRevocation.user_id,
+                TokenRevocation.revoked_before,
+                TokenRevocation.created_at,
+            ).where(TokenRevocation.created_at > since)
+        )
+        rows = result.all()
+        entries = [
+            (row.jti, None) if row.jti else (None, row.user_id)
+            for row in rows
+            if row.jti or row.revoked_before is not None
+        ]
+        return entries, max((row.created_at for row in rows), default=None)
+
+    async def delete_expired(self, now: datetime) -> int:
+        """Delete revocations whose tokens have expired anyway."""
+        result = await self.db.execute(
+            delete(TokenRevocation).where(TokenRevocation.expires_at <= now)
+        )
+        return result.rowcount or 0
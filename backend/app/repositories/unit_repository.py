@@ -2,12 +2,19 @@
 Unit repository for Amarati.
 """
 
-from typing import List, Optional
-from sqlalchemy import select, func
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional
+from sqlalchemy import Select, case, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.unit import Unit
-from app.schemas.unit import UnitCreate, UnitUpdate
+from app.models.property import Property
+from app.models.unit import Unit, UnitStatus
+from app.schemas.unit import UnitCreate, UnitSearchFilters, UnitUpdate
+from app.utils.helpers import chunked
+from app.utils.pagination import Page, paginate
+
+# Keeps IN (...) lists well below SQLite's bound-parameter limit
+IN_CLAUSE_CHUNK_SIZE = 500
 
 
 class UnitRepository:
@@ -20,47 +27,159 @@ class UnitRepository:
         """Create a new unit."""
         db_unit = Unit(**unit_in.model_dump())
         self.db.add(db_unit)
-        await self.db.commit()
-        await self.db.refresh(db_unit)
+        # Assigns the client-side id/created_at; the request commits later
+        await self.db.flush()
         return db_unit
 
-    async def get_by_id(self, unit_id: str) -> Optional[Unit]:
-        """Get unit by ID."""
-        result = await self.db.execute(select(Unit).where(Unit.id == unit_id))
-        return result.scalars().first()
+    async def get_by_id(self, unit_id: str, for_update: bool = False) -> Optional[Unit]:
+        """
+        Get unit by ID (served from the session if already loaded). With
+        for_update the row is re-read and locked until commit.
+        """
+        if for_update:
+            return await self.db.get(Unit, unit_id, with_for_update=True, populate_existing=True)
+        return await self.db.get(Unit, unit_id)
 
     async def get_multi_by_property(
         self, 
         property_id: str,
         skip: int = 0, 
-        limit: int = 100
-    ) -> List[Unit]:
-        """Get multiple units for a specific property."""
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        total: Optional[str] = None,
+    ) -> Page[Unit]:
+        """
+        Get a page of units for a property, in creation order.
+        `total` ("exact"/"estimate") also returns the matching row count.
+        """
         query = select(Unit).where(Unit.property_id == property_id)
-        result = await self.db.execute(query.offset(skip).limit(limit))
-        return result.scalars().all()
+        return await paginate(
+            self.db, query, Unit.created_at, Unit.id,
+            limit=limit, skip=skip, cursor=cursor, total=total,
+        )
 
     async def update(self, db_unit: Unit, unit_in: UnitUpdate) -> Unit:
         """Update a unit."""
         update_data = unit_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_unit, field, value)
-        
-        await self.db.commit()
-        await self.db.refresh(db_unit)
         return db_unit
 
-    async def delete(self, unit_id: str) -> bool:
-        """Delete a unit."""
-        db_unit = await self.get_by_id(unit_id)
-        if not db_unit:
-            return False
+    async def delete(self, db_unit: Unit) -> None:
+        """Stage a unit for deletion."""
         await self.db.delete(db_unit)
-        await self.db.commit()
-        return True
 
     async def count_by_property(self, property_id: str) -> int:
         """Count units in a property."""
         query = select(func.count()).where(Unit.property_id == property_id)
         result = await self.db.execute(query)
         return result.scalar() or 0
+
+    # ── Search ───────────────────────────────────────────────
+    async def search(
+        self,
+        filters: UnitSearchFilters,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Page[Unit]:
+        """Get a page of units across all properties (newest first)."""
+        query = _apply_search_filters(select(Unit), filters)
+        return await paginate(
+            self.db, query, Unit.created_at, Unit.id,
+            limit=limit, skip=skip, cursor=cursor, descending=True,
+        )
+
+    async def facet_counts(
+        self, filters: UnitSearchFilters, rent_edges: List[int]
+    ) -> List[tuple[UnitStatus, Optional[int], int, int]]:
+        """
+        Count matching units per (status, bedrooms, rent bucket) in one
+        GROUP BY pass; callers roll the groups up into facets and a total.
+        Rent bucket i covers [rent_edges[i], rent_edges[i + 1]); -1 = no rent.
+        """
+        bucket = _rent_bucket(rent_edges)
+        query = _apply_search_filters(
+            select(Unit.status, Unit.bedrooms, bucket, func.count()), filters
+        ).group_by(Unit.status, Unit.bedrooms, bucket)
+        result = await self.db.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    # ── Bulk operations (no ORM objects, single transaction) ─────
+    async def get_states(
+        self, unit_ids: Iterable[str], for_update: bool = False
+    ) -> dict[str, tuple[str, UnitStatus, Optional[Decimal]]]:
+        """
+        Map each existing unit ID to its (property_id, status, rent_amount).
+        With for_update the rows are locked (in id order) until commit.
+        """
+        states: dict[str, tuple[str, UnitStatus, Optional[Decimal]]] = {}
+        for chunk in chunked(sorted(set(unit_ids)), IN_CLAUSE_CHUNK_SIZE):
+            query = (
+                select(Unit.id, Unit.property_id, Unit.status, Unit.rent_amount)
+                .where(Unit.id.in_(chunk))
+            )
+            if for_update:
+                query = query.order_by(Unit.id).with_for_update()
+            result = await self.db.execute(query)
+            states.update((id_, tuple(state)) for id_, *state in result)
+        return states
+
+    async def bulk_insert(self, rows: list[dict[str, Any]]) -> None:
+        """Insert many units with one executemany (rows must include ids)."""
+        if rows:
+            await self.db.execute(insert(Unit), rows)
+
+    async def bulk_update_same_values(self, unit_ids: list[str], values: dict[str, Any]) -> None:
+        """Apply the same values to many units: UPDATE ... WHERE id IN (...)."""
+        for chunk in chunked(unit_ids, IN_CLAUSE_CHUNK_SIZE):
+            await self.db.execute(
+                update(Unit)
+                .where(Unit.id.in_(chunk))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def bulk_update_by_id(self, rows: list[dict[str, Any]]) -> None:
+        """Update many units with per-row values (executemany keyed by id)."""
+        if rows:
+            await self.db.execute(update(Unit), rows)
+
+    async def bulk_delete(self, unit_ids: list[str]) -> None:
+        """Delete many units: DELETE ... WHERE id IN (...)."""
+        for chunk in chunked(unit_ids, IN_CLAUSE_CHUNK_SIZE):
+            await self.db.execute(
+                delete(Unit)
+                .where(Unit.id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+
+
+def _apply_search_filters(query: Select, filters: UnitSearchFilters) -> Select:
+    """Add WHERE clauses (and the property join for city) for search filters."""
+    if filters.status is not None:
+        query = query.where(Unit.status == filters.status)
+    ranges = [
+        (Unit.bedrooms, filters.min_bedrooms, filters.max_bedrooms),
+        (Unit.bathrooms, filters.min_bathrooms, filters.max_bathrooms),
+        (Unit.floor, filters.min_floor, filters.max_floor),
+        (Unit.area_sqm, filters.min_area_sqm, filters.max_area_sqm),
+        (Unit.rent_amount, filters.min_rent, filters.max_rent),
+    ]
+    for column, low, high in ranges:
+        if low is not None:
+            query = query.where(column >= low)
+        if high is not None:
+            query = query.where(column <= high)
+    if filters.city:
+        query = query.join(Property, Property.id == Unit.property_id).where(
+            Property.city == filters.city
+        )
+    return query
+
+
+def _rent_bucket(rent_edges: List[int]):
+    """CASE expression giving each unit's rent bucket index (-1 = no rent)."""
+    whens = [(Unit.rent_amount.is_(None), -1)]
+    whens += [(Unit.rent_amount < edge, i) for i, edge in enumerate(rent_edges[1:])]
+    return case(*whens, else_=len(rent_edges) - 1)
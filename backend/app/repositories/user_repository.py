@@ -4,10 +4,17 @@ User repository: database operations for User model.
 
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User, UserRole
+from app.utils.pagination import TOTAL_EXACT, Page, paginate
+
+# Hot lookups are built once: executing a pre-built statement reuses its
+# memoized cache key and compiled SQL instead of rebuilding both per call.
+# Primary-key lookups use session.get(), which skips SQL for loaded rows.
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_BY_PHONE = select(User).where(User.phone == bindparam("phone"))
 
 
 class UserRepository:
@@ -17,31 +24,23 @@ class UserRepository:
         self.db = db
 
     async def create(self, user: User) -> User:
-        """Insert a new user."""
+        """Stage a new user and assign its id (no commit)."""
         self.db.add(user)
         await self.db.flush()
-        await self.db.refresh(user)
         return user
 
     async def get_by_id(self, user_id: str) -> Optional[User]:
-        """Get user by ID."""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+        """Get user by ID (served from the session if already loaded)."""
+        return await self.db.get(User, user_id)
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
-        result = await self.db.execute(
-            select(User).where(User.email == email)
-        )
+        result = await self.db.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_by_phone(self, phone: str) -> Optional[User]:
         """Get user by phone number."""
-        result = await self.db.execute(
-            select(User).where(User.phone == phone)
-        )
+        result = await self.db.execute(_USER_BY_PHONE, {"phone": phone})
         return result.scalar_one_or_none()
 
     async def get_all(
@@ -50,38 +49,28 @@ class UserRepository:
         limit: int = 20,
         role: Optional[UserRole] = None,
         is_active: Optional[bool] = None,
-    ) -> tuple[list[User], int]:
-        """Get paginated user list with optional filters."""
+        cursor: Optional[str] = None,
+        total: Optional[str] = TOTAL_EXACT,
+    ) -> Page[User]:
+        """Get a page of users (newest first) and their total in one query."""
         query = select(User)
-        count_query = select(func.count(User.id))
-
         if role is not None:
             query = query.where(User.role == role)
-            count_query = count_query.where(User.role == role)
         if is_active is not None:
             query = query.where(User.is_active == is_active)
-            count_query = count_query.where(User.is_active == is_active)
-
-        # Get total count
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
 
-        # Get paginated results
-        query = query.offset(skip).limit(limit).order_by(User.created_at.desc())
-        result = await self.db.execute(query)
-        users = list(result.scalars().all())
-
-        return users, total
+        return await paginate(
+            self.db, query, User.created_at, User.id,
+            limit=limit, skip=skip, cursor=cursor, descending=True, total=total,
+        )
 
     async def update(self, user: User) -> User:
-        """Update an existing user."""
+        """Write pending changes to an existing user (sets updated_at)."""
         await self.db.flush()
-        await self.db.refresh(user)
         return user
 
     async def deactivate(self, user: User) -> User:
         """Soft-delete a user by deactivating."""
         user.is_active = False
         await self.db.flush()
-        await self.db.refresh(user)
         return user
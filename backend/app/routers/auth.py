@@ -2,9 +2,10 @@
 Authentication routes: register, login, OTP, token refresh, password reset, logout.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.rate_limit import RateLimiter
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
@@ -41,7 +42,11 @@ async def register(
     return await service.register(data)
 
 
-@router.post("/verify-otp", response_model=TokenResponse)
+@router.post(
+    "/verify-otp",
+    response_model=TokenResponse,
+    dependencies=[Depends(RateLimiter("verify-otp"))],
+)
 async def verify_otp(
     data: OTPVerifyRequest,
     db: AsyncSession = Depends(get_db),
@@ -67,7 +72,11 @@ async def resend_otp(
     return await service.resend_otp(data.email)
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(RateLimiter("login", uses_password_hashing=True))],
+)
 async def login(
     data: LoginRequest,
     db: AsyncSession = Depends(get_db),
@@ -116,7 +125,11 @@ async def request_password_reset(
     return await service.request_password_reset(data.email)
 
 
-@router.post("/confirm-password-reset", response_model=MessageResponse)
+@router.post(
+    "/confirm-password-reset",
+    response_model=MessageResponse,
+    dependencies=[Depends(RateLimiter("confirm-password-reset", uses_password_hashing=True))],
+)
 async def confirm_password_reset(
     data: PasswordResetConfirm,
     db: AsyncSession = Depends(get_db),
@@ -131,11 +144,15 @@ async def confirm_password_reset(
 
 @router.post("/logout", response_model=LogoutResponse)
 async def logout(
+    request: Request,
     current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Logout current user.
-    Client should discard tokens. (Server-side token blacklisting
-    can be added in production with Redis.)
+    The access token is revoked server-side; the client should also
+    discard its tokens.
     """
+    service = AuthService(db)
+    await service.logout(request.state.token_payload)
     return LogoutResponse()
@@ -0,0 +1,36 @@
+"""
+Internal operational routes: runtime metrics for monitoring.
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.core.db_pool import pool_stats
+from app.core.hashing_pool import hashing_pool
+from app.core.rate_limit import rate_limit_stats
+from app.core.rbac import RoleChecker
+from app.core.revocation import revocation_list
+from app.core.security import token_cache
+from app.core.statement_cache import compiled_cache_stats
+from app.core.user_cache import user_cache
+from app.database import engine, read_engine, read_router
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@router.get("/metrics", dependencies=[Depends(RoleChecker(["admin"]))])
+async def get_metrics():
+    """
+    Return in-process cache and pool counters.
+    Admin-only endpoint.
+    """
+    return {
+        "user_cache": user_cache.stats(),
+        "password_hashing": hashing_pool.stats(),
+        "token_cache": token_cache.stats(),
+        "revocation": revocation_list.stats(),
+        "rate_limit": rate_limit_stats(),
+        "db_pool": pool_stats(engine),
+        "db_read_pool": pool_stats(read_engine),
+        "db_replicas": read_router.stats(),
+        "sql_compiled_cache": compiled_cache_stats.stats(),
+    }
@@ -3,18 +3,49 @@ Property router for Amarati.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+from app.core.exceptions import BadRequestException, ForbiddenException
 from app.database import get_db
 from app.services.property_service import PropertyService
-from app.schemas.property import PropertyCreate, PropertyUpdate, PropertyResponse
+from app.schemas.property import PortfolioSummary, PropertyCreate, PropertyUpdate, PropertyResponse
 from app.core.rbac import RoleChecker
 from app.dependencies import get_current_active_user
-from app.models.user import User
+from app.models.property import PropertyType
+from app.models.user import User, UserRole
+from app.utils.pagination import page_headers
+
+settings = get_settings()
 
 router = APIRouter(prefix="/properties", tags=["Properties"])
 
+# Related data the read endpoints can embed with ?include=
+PROPERTY_INCLUDES = {"units"}
+
+
+def _parse_include(include: Optional[str]) -> set[str]:
+    """Split a comma-separated include list; 400 on unknown names."""
+    names = {name.strip() for name in (include or "").split(",") if name.strip()}
+    unknown = names - PROPERTY_INCLUDES
+    if unknown:
+        raise BadRequestException(detail=f"Unsupported include: {', '.join(sorted(unknown))}")
+    return names
+
+
+def _parse_near(near: Optional[str]) -> Optional[tuple[float, float]]:
+    """Parse "lat,lon"; 400 if malformed or out of range."""
+    if near is None:
+        return None
+    try:
+        latitude, longitude = (float(part) for part in near.split(","))
+    except ValueError:
+        raise BadRequestException(detail="near must be 'latitude,longitude'")
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise BadRequestException(detail="near is outside valid latitude/longitude ranges")
+    return latitude, longitude
+
 
 @router.post("/", response_model=PropertyResponse, status_code=status.HTTP_201_CREATED)
 async def create_property(
@@ -29,34 +60,74 @@ async def create_property(
 
 @router.get("/", response_model=List[PropertyResponse])
 async def list_properties(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     owner_id: Optional[str] = None,
     supervisor_id: Optional[str] = None,
     city: Optional[str] = None,
-    type: Optional[str] = None,
+    type: Optional[PropertyType] = None,
     search: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: float = Query(settings.GEO_DEFAULT_RADIUS_KM, gt=0, le=settings.GEO_MAX_RADIUS_KM),
+    include: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """List properties with advanced filters (city, type, search)."""
+    """
+    List properties with advanced filters (city, type, search).
+    Pass the X-Next-Cursor response header back as `cursor` for the next page;
+    `include_total=true` adds an X-Total-Count header and `include=units`
+    nests each property's units (one extra query for the whole page).
+    `search` is a full-text search over name, address, city and description;
+    results are ranked by relevance and paged with `skip` only.
+    `near=lat,lon` keeps located properties within `radius_km`, nearest
+    first with their `distance_km`, also paged with `skip` only.
+    """
+    includes = _parse_include(include)
+    location = _parse_near(near)
     service = PropertyService(db)
-    # The repository already supports filtering, but we can extend it if needed.
-    return await service.list_properties(
+    page = await service.list_properties(
         skip=skip, limit=limit, owner_id=owner_id,
-        supervisor_id=supervisor_id, city=city
+        supervisor_id=supervisor_id, city=city, cursor=cursor,
+        include_total=include_total, include_units="units" in includes,
+        property_type=type, search=search, near=location, radius_km=radius_km,
     )
+    response.headers.update(page_headers(page))
+    return page.items
+
+
+# Declared before /{property_id} so "summary" is not taken as an ID
+@router.get("/summary", response_model=PortfolioSummary)
+async def get_portfolio_summary(
+    owner_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Occupancy, unit counts and monthly rent roll across an owner's
+    properties (default: your own). Admins can view any owner.
+    """
+    owner_id = owner_id or current_user.id
+    if current_user.role != UserRole.ADMIN and owner_id != current_user.id:
+        raise ForbiddenException(detail="You can only view your own portfolio")
+    service = PropertyService(db)
+    return await service.get_portfolio_summary(owner_id)
 
 
 @router.get("/{property_id}", response_model=PropertyResponse)
 async def get_property(
     property_id: str,
+    include: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get property by ID."""
+    """Get property by ID; `include=units` nests its units."""
+    includes = _parse_include(include)
     service = PropertyService(db)
-    return await service.get_property(property_id)
+    return await service.get_property(property_id, include_units="units" in includes)
 
 
 @router.put("/{property_id}", response_model=PropertyResponse)
@@ -2,16 +2,27 @@
 Unit router for Amarati.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.services.unit_service import UnitService
-from app.schemas.unit import UnitCreate, UnitUpdate, UnitResponse
+from app.schemas.unit import (
+    BulkResponse,
+    UnitBulkCreate,
+    UnitBulkDelete,
+    UnitBulkUpdate,
+    UnitCreate,
+    UnitResponse,
+    UnitSearchFilters,
+    UnitSearchResponse,
+    UnitUpdate,
+)
 from app.core.rbac import RoleChecker
 from app.dependencies import get_current_active_user
 from app.models.user import User
+from app.utils.pagination import page_headers
 
 router = APIRouter(prefix="/units", tags=["Units"])
 
@@ -27,17 +38,82 @@ async def create_unit(
     return await service.create_unit(unit_in)
 
 
+# Search and bulk routes are declared before /{unit_id} so "search" and
+# "bulk" are not taken as IDs
+@router.get("/search", response_model=UnitSearchResponse)
+async def search_units(
+    filters: UnitSearchFilters = Depends(),
+    skip: int = 0,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Search units across all properties by status, city and bedroom,
+    bathroom, floor, area and rent ranges. Returns the page, the total
+    and facet counts (status, bedrooms, rent buckets) over all matches.
+    Pass `next_cursor` back as `cursor` for the next page.
+    """
+    service = UnitService(db)
+    return await service.search_units(filters, skip=skip, limit=limit, cursor=cursor)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_units(
+    data: UnitBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(RoleChecker(["admin", "owner"]))
+):
+    """Create many units in one transaction (Admin or Owner only)."""
+    service = UnitService(db)
+    return await service.bulk_create_units(data.items)
+
+
+@router.put("/bulk", response_model=BulkResponse)
+async def bulk_update_units(
+    data: UnitBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(RoleChecker(["admin", "owner", "supervisor"]))
+):
+    """Update many units in one transaction (Admin, Owner, or Supervisor)."""
+    service = UnitService(db)
+    return await service.bulk_update_units(data.items)
+
+
+@router.delete("/bulk", response_model=BulkResponse)
+async def bulk_delete_units(
+    data: UnitBulkDelete,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(RoleChecker(["admin", "owner"]))
+):
+    """Delete many units in one transaction (Admin or Owner only)."""
+    service = UnitService(db)
+    return await service.bulk_delete_units(data.ids)
+
+
 @router.get("/property/{property_id}", response_model=List[UnitResponse])
 async def list_units_by_property(
     property_id: str,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """List units for a property."""
+    """
+    List units for a property.
+    Pass the X-Next-Cursor response header back as `cursor` for the next page;
+    `include_total=true` adds an X-Total-Count header.
+    """
     service = UnitService(db)
-    return await service.list_units_by_property(property_id, skip, limit)
+    page = await service.list_units_by_property(
+        property_id, skip, limit, cursor, include_total=include_total
+    )
+    response.headers.update(page_headers(page))
+    return page.items
 
 
 @router.get("/{unit_id}", response_model=UnitResponse)
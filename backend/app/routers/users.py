@@ -28,24 +28,27 @@ async def list_users(
     page_size: int = Query(20, ge=1, le=100),
     role: Optional[UserRole] = Query(None),
     is_active: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     _=Depends(RoleChecker(["admin"])),
 ):
     """
     List all users with pagination and filters.
+    Pass `next_cursor` back as `cursor` for keyset paging (ignores `page`).
     Admin-only endpoint.
     """
     service = UserService(db)
     skip = (page - 1) * page_size
-    users, total = await service.get_users(
-        skip=skip, limit=page_size, role=role, is_active=is_active
+    result = await service.get_users(
+        skip=skip, limit=page_size, role=role, is_active=is_active, cursor=cursor
     )
     return UserListResponse(
-        users=[UserResponse.model_validate(u) for u in users],
-        total=total,
+        users=[UserResponse.model_validate(u) for u in result.items],
+        total=result.total,
         page=page,
         page_size=page_size,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -3,10 +3,12 @@ Property schemas for Amarati.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.property import PropertyType
+from app.schemas.unit import UnitResponse
 
 
 class PropertyBase(BaseModel):
@@ -16,20 +18,35 @@ class PropertyBase(BaseModel):
     type: PropertyType = PropertyType.RESIDENTIAL
     description: Optional[str] = None
     image_url: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
 
-class PropertyCreate(PropertyBase):
+class _LocationPair(BaseModel):
+    @model_validator(mode="after")
+    def _both_coordinates(self):
+        """Latitude and longitude are set (or cleared) together."""
+        if ("latitude" in self.model_fields_set) != ("longitude" in self.model_fields_set) or (
+            (self.latitude is None) != (self.longitude is None)
+        ):
+            raise ValueError("latitude and longitude must be given together")
+        return self
+
+
+class PropertyCreate(PropertyBase, _LocationPair):
     owner_id: str
     supervisor_id: Optional[str] = None
 
 
-class PropertyUpdate(BaseModel):
+class PropertyUpdate(_LocationPair):
     name: Optional[str] = Field(None, min_length=2, max_length=255)
     address: Optional[str] = Field(None, min_length=5)
     city: Optional[str] = Field(None, min_length=2, max_length=100)
     type: Optional[PropertyType] = None
     description: Optional[str] = None
     image_url: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
     supervisor_id: Optional[str] = None
 
 
@@ -38,7 +55,30 @@ class PropertyResponse(PropertyBase):
     owner_id: str
     supervisor_id: Optional[str]
     total_units: int
+    occupied_units: int
+    vacant_units: int
+    maintenance_units: int
+    rent_roll: Decimal
     created_at: datetime
+    # Only populated with ?near=
+    distance_km: Optional[float] = None
+    # Only populated with ?include=units
+    units: Optional[List[UnitResponse]] = Field(None, validation_alias="loaded_units")
+
+    class Config:
+        from_attributes = True
+
+
+class PortfolioSummary(BaseModel):
+    """An owner's totals across all their properties."""
+    owner_id: str
+    property_count: int = 0
+    total_units: int = 0
+    occupied_units: int = 0
+    vacant_units: int = 0
+    maintenance_units: int = 0
+    occupancy_rate: float = 0.0  # occupied / total units
+    rent_roll: Decimal = Decimal("0")  # monthly rent of occupied units
 
     class Config:
         from_attributes = True
@@ -2,12 +2,16 @@
 Unit schemas for Amarati.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Literal, Optional
 from decimal import Decimal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from app.config import get_settings
 from app.models.unit import UnitStatus
 
+settings = get_settings()
+
 
 class UnitBase(BaseModel):
     unit_number: str = Field(..., min_length=1, max_length=50)
@@ -33,11 +37,87 @@ class UnitUpdate(BaseModel):
     status: Optional[UnitStatus] = None
     tenant_id: Optional[str] = None
 
+    @field_validator("unit_number", "status")
+    @classmethod
+    def _not_null(cls, value):
+        """May be omitted, but not cleared: the columns are NOT NULL."""
+        if value is None:
+            raise ValueError("cannot be null")
+        return value
+
 
 class UnitResponse(UnitBase):
     id: str
     property_id: str
     tenant_id: Optional[str]
+    created_at: datetime
 
     class Config:
         from_attributes = True
+
+
+# ── Bulk operations ──────────────────────────────────────────
+class UnitBulkCreate(BaseModel):
+    items: list[UnitCreate] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+
+class UnitBulkUpdateItem(UnitUpdate):
+    id: str
+
+
+class UnitBulkUpdate(BaseModel):
+    items: list[UnitBulkUpdateItem] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+
+class UnitBulkDelete(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[str] = None
+    status: Literal["created", "updated", "deleted", "error"]
+    error: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult]
+
+
+# ── Search ───────────────────────────────────────────────────
+class UnitSearchFilters(BaseModel):
+    """Query filters for /units/search (all optional, ranges inclusive)."""
+    status: Optional[UnitStatus] = None
+    city: Optional[str] = None
+    min_bedrooms: Optional[int] = Field(None, ge=0)
+    max_bedrooms: Optional[int] = Field(None, ge=0)
+    min_bathrooms: Optional[int] = Field(None, ge=0)
+    max_bathrooms: Optional[int] = Field(None, ge=0)
+    min_floor: Optional[int] = None
+    max_floor: Optional[int] = None
+    min_area_sqm: Optional[Decimal] = Field(None, ge=0)
+    max_area_sqm: Optional[Decimal] = Field(None, ge=0)
+    min_rent: Optional[Decimal] = Field(None, ge=0)
+    max_rent: Optional[Decimal] = Field(None, ge=0)
+
+
+class RentBucketCount(BaseModel):
+    min: Optional[int] = None
+    max: Optional[int] = None  # exclusive; None = open-ended
+    count: int
+
+
+class UnitFacets(BaseModel):
+    status: dict[str, int]
+    bedrooms: dict[str, int]  # "unknown" for units without a bedroom count
+    rent: list[RentBucketCount]
+    rent_unknown: int
+
+
+class UnitSearchResponse(BaseModel):
+    items: list[UnitResponse]
+    total: int
+    next_cursor: Optional[str] = None
+    facets: UnitFacets
@@ -37,6 +37,7 @@ class UserListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class ChangePasswordRequest(BaseModel):
@@ -5,6 +5,7 @@ Authentication service: registration, login, OTP, password reset.
 import random
 import string
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,14 +21,19 @@ from app.core.exceptions import (
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password_async,
     verify_refresh_token,
 )
+from app.core.user_cache import invalidate_user
+from app.database import read_session_factory
 from app.models.otp import OTPCode
+from app.models.outbox import OutboxMessage
 from app.models.user import User, UserRole
-from app.repositories.otp_repository import OTPRepository
+from app.repositories.otp_store import OTPStore, get_otp_store
+from app.repositories.outbox_repository import OutboxRepository
 from app.repositories.user_repository import UserRepository
+from app.services.revocation_service import RevocationService
 from app.schemas.auth import (
     LoginRequest,
     OTPResponse,
@@ -43,14 +49,19 @@ settings = get_settings()
 class AuthService:
     """Business logic for authentication operations."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, otp_store: Optional[OTPStore] = None):
         self.db = db
         self.user_repo = UserRepository(db)
-        self.otp_repo = OTPRepository(db)
+        self.otp_store = otp_store or get_otp_store(db)
+        self.outbox_repo = OutboxRepository(db)
 
     # ── Registration ─────────────────────────────────────────
     async def register(self, data: RegisterRequest) -> RegisterResponse:
         """Register a new user account."""
+        # Hash before the first statement: a write request holds the
+        # writer from then until commit
+        hashed_password = await hash_password_async(data.password)
+
         # Check duplicate email
         existing = await self.user_repo.get_by_email(data.email)
         if existing:
@@ -66,7 +77,7 @@ class AuthService:
         user = User(
             email=data.email,
             full_name=data.full_name,
-            hashed_password=hash_password(data.password),
+            hashed_password=hashed_password,
             phone=data.phone,
             role=data.role,
             is_verified=False,
@@ -75,7 +86,7 @@ class AuthService:
         user = await self.user_repo.create(user)
 
         # Generate and store OTP
-        await self._generate_otp(user.id, purpose="verification")
+        await self._generate_otp(user, purpose="verification")
 
         return RegisterResponse(
             id=user.id,
@@ -92,7 +103,7 @@ class AuthService:
         if not user:
             raise NotFoundException(detail="User not found")
 
-        otp = await self.otp_repo.get_latest_valid(user.id, purpose="verification")
+        otp = await self.otp_store.get_latest_valid(user.id, purpose="verification")
         if not otp:
             raise OTPInvalidException(detail="No valid OTP found. Please request a new one.")
 
@@ -103,9 +114,10 @@ class AuthService:
             raise OTPInvalidException()
 
         # Mark OTP as used and verify user
-        await self.otp_repo.mark_used(otp)
+        await self.otp_store.mark_used(otp)
         user.is_verified = True
         await self.user_repo.update(user)
+        invalidate_user(self.db, user.id)
 
         # Return tokens
         return self._create_token_response(user)
@@ -121,8 +133,8 @@ class AuthService:
             raise BadRequestException(detail="Account is already verified")
 
         # Invalidate old OTPs and generate new one
-        await self.otp_repo.invalidate_all(user.id, purpose="verification")
-        otp_code = await self._generate_otp(user.id, purpose="verification")
+        await self.otp_store.invalidate_all(user.id, purpose="verification")
+        otp_code = await self._generate_otp(user, purpose="verification")
 
         response = OTPResponse(message="OTP sent successfully")
         if settings.DEBUG:
@@ -132,11 +144,14 @@ class AuthService:
     # ── Login ────────────────────────────────────────────────
     async def login(self, data: LoginRequest) -> TokenResponse:
         """Authenticate user and return JWT tokens."""
-        user = await self.user_repo.get_by_email(data.email)
+        user = await self._get_for_password_check(data.email)
         if not user:
             raise CredentialsException(detail="Invalid email or password")
 
-        if not verify_password(data.password, user.hashed_password):
+        valid, new_hash = await verify_and_update_password_async(
+            data.password, user.hashed_password
+        )
+        if not valid:
             raise CredentialsException(detail="Invalid email or password")
 
         if not user.is_active:
@@ -147,6 +162,15 @@ class AuthService:
                 detail="Account not verified. Please verify your OTP first."
             )
 
+        # Transparently upgrade hashes made with an outdated scheme/cost,
+        # unless the password changed while it was being checked
+        if new_hash:
+            current = await self.user_repo.get_by_id(user.id)
+            if current and current.hashed_password == user.hashed_password:
+                current.hashed_password = new_hash
+                await self.user_repo.update(current)
+                invalidate_user(self.db, current.id)
+
         return self._create_token_response(user)
 
     # ── Token Refresh ────────────────────────────────────────
@@ -166,6 +190,11 @@ class AuthService:
 
         return self._create_token_response(user)
 
+    # ── Logout ───────────────────────────────────────────────
+    async def logout(self, token_payload: dict) -> None:
+        """Revoke the access token used for this request."""
+        await RevocationService(self.db).revoke_token(token_payload)
+
     # ── Password Reset Request ───────────────────────────────
     async def request_password_reset(self, email: str) -> OTPResponse:
         """Send password reset OTP."""
@@ -175,8 +204,8 @@ class AuthService:
             raise NotFoundException(detail="User not found")
 
         # Invalidate old reset OTPs and generate new one
-        await self.otp_repo.invalidate_all(user.id, purpose="password_reset")
-        otp_code = await self._generate_otp(user.id, purpose="password_reset")
+        await self.otp_store.invalidate_all(user.id, purpose="password_reset")
+        otp_code = await self._generate_otp(user, purpose="password_reset")
 
         response = OTPResponse(message="Password reset OTP sent")
         if settings.DEBUG:
@@ -186,11 +215,14 @@ class AuthService:
     # ── Password Reset Confirm ───────────────────────────────
     async def confirm_password_reset(self, data: PasswordResetConfirm) -> dict:
         """Verify reset OTP and set new password."""
+        # Hash before the first statement (see register)
+        new_hash = await hash_password_async(data.new_password)
+
         user = await self.user_repo.get_by_email(data.email)
         if not user:
             raise NotFoundException(detail="User not found")
 
-        otp = await self.otp_repo.get_latest_valid(user.id, purpose="password_reset")
+        otp = await self.otp_store.get_latest_valid(user.id, purpose="password_reset")
         if not otp:
             raise OTPInvalidException(detail="No valid reset OTP found")
 
@@ -200,29 +232,51 @@ class AuthService:
         if otp.code != data.code:
             raise OTPInvalidException()
 
-        # Update password
-        await self.otp_repo.mark_used(otp)
-        user.hashed_password = hash_password(data.new_password)
+        await self.otp_store.mark_used(otp)
+        user.hashed_password = new_hash
         await self.user_repo.update(user)
+        invalidate_user(self.db, user.id)
 
         return {"message": "Password reset successful. You can now login with your new password."}
 
     # ── Helpers ──────────────────────────────────────────────
-    async def _generate_otp(self, user_id: str, purpose: str = "verification") -> str:
-        """Generate a random OTP code and store it."""
+    @staticmethod
+    async def _get_for_password_check(email: str) -> Optional[User]:
+        """
+        Look a user up on a short read session, so the password can be
+        checked before the request session (and the writer) is used.
+        """
+        async with read_session_factory() as session:
+            return await UserRepository(session).get_by_email(email)
+
+    async def _generate_otp(self, user: User, purpose: str = "verification") -> str:
+        """
+        Generate a random OTP code, store it and queue its delivery.
+        The outbox row commits with the request; the outbox worker sends it.
+        """
         code = "".join(random.choices(string.digits, k=settings.OTP_LENGTH))
 
         otp = OTPCode(
-            user_id=user_id,
+            user_id=user.id,
             code=code,
             purpose=purpose,
             expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.OTP_EXPIRE_MINUTES),
         )
-        await self.otp_repo.create(otp)
+        await self.otp_store.create(otp)
 
-        # In production, send via SMS/email service here
-        # For now, mock: log to console
-        print(f"[MOCK OTP] User {user_id} | Purpose: {purpose} | Code: {code}")
+        subject = (
+            "Your password reset code" if purpose == "password_reset"
+            else "Your verification code"
+        )
+        await self.outbox_repo.enqueue(OutboxMessage(
+            channel="email",
+            recipient=user.email,
+            subject=f"{settings.APP_NAME}: {subject}",
+            body=(
+                f"Your {settings.APP_NAME} code is {code}. "
+                f"It expires in {settings.OTP_EXPIRE_MINUTES} minutes."
+            ),
+        ))
         return code
 
     def _create_token_response(self, user: User) -> TokenResponse:
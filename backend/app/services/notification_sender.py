@@ -0,0 +1,113 @@
+"""
+Pluggable notification senders used by the outbox worker.
+
+- console: prints messages (development default)
+- file:    appends JSON lines to a local file (local stand-in for a provider)
+- smtp:    delivers email through an SMTP server
+"""
+
+import asyncio
+import json
+import smtplib
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from email.message import EmailMessage
+
+from app.config import get_settings
+from app.models.outbox import OutboxMessage
+
+settings = get_settings()
+
+
+class NotificationSender(ABC):
+    """Delivers a single outbox message; raises on failure."""
+
+    @abstractmethod
+    async def send(self, message: OutboxMessage) -> None:
+        """Deliver the message or raise an exception."""
+
+
+class ConsoleSender(NotificationSender):
+    """Mock sender: logs messages to the console."""
+
+    async def send(self, message: OutboxMessage) -> None:
+        print(f"[MOCK {message.channel.upper()}] To: {message.recipient} | {message.body}")
+
+
+class FileSender(NotificationSender):
+    """Appends each message as a JSON line to a local file."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _write(self, line: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    async def send(self, message: OutboxMessage) -> None:
+        line = json.dumps({
+            "id": message.id,
+            "channel": message.channel,
+            "recipient": message.recipient,
+            "subject": message.subject,
+            "body": message.body,
+            "delivered_at": datetime.now(timezone.utc).isoformat(),
+        })
+        await asyncio.to_thread(self._write, line)
+
+
+class SMTPSender(NotificationSender):
+    """Sends email messages through an SMTP server."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        from_address: str,
+        use_tls: bool = True,
+        timeout: float = 10.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.from_address = from_address
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+    def _send_sync(self, message: OutboxMessage) -> None:
+        email = EmailMessage()
+        email["From"] = self.from_address
+        email["To"] = message.recipient
+        email["Subject"] = message.subject or settings.APP_NAME
+        email.set_content(message.body)
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+            smtp.send_message(email)
+
+    async def send(self, message: OutboxMessage) -> None:
+        if message.channel != "email":
+            raise ValueError(f"SMTPSender cannot deliver '{message.channel}' messages")
+        await asyncio.to_thread(self._send_sync, message)
+
+
+def get_notification_sender() -> NotificationSender:
+    """Return the sender selected by settings.NOTIFICATION_SENDER."""
+    if settings.NOTIFICATION_SENDER == "file":
+        return FileSender(settings.NOTIFICATION_FILE_PATH)
+    if settings.NOTIFICATION_SENDER == "smtp":
+        return SMTPSender(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            from_address=settings.SMTP_FROM,
+            use_tls=settings.SMTP_USE_TLS,
+        )
+    return ConsoleSender()
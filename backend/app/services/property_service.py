@@ -5,10 +5,16 @@ Property management service for Amarati.
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.property import Property
+from app.config import get_settings
+from app.models.property import Property, PropertyType
+from app.repositories.portfolio_repository import PortfolioRepository
 from app.repositories.property_repository import PropertyRepository
-from app.schemas.property import PropertyCreate, PropertyUpdate
+from app.schemas.property import PortfolioSummary, PropertyCreate, PropertyUpdate
 from app.core.exceptions import NotFoundException
+from app.utils.geo import haversine_km
+from app.utils.pagination import Page
+
+settings = get_settings()
 
 
 class PropertyService:
@@ -16,14 +22,17 @@ class PropertyService:
 
     def __init__(self, db: AsyncSession):
         self.repo = PropertyRepository(db)
+        self.portfolio_repo = PortfolioRepository(db)
 
     async def create_property(self, property_in: PropertyCreate) -> Property:
-        """Create a new property."""
-        return await self.repo.create(property_in)
+        """Create a new property and count it in its owner's portfolio."""
+        db_property = await self.repo.create(property_in)
+        await self.portfolio_repo.add_property(db_property.owner_id)
+        return db_property
 
-    async def get_property(self, property_id: str) -> Property:
-        """Get property by ID or raise 404."""
-        db_property = await self.repo.get_by_id(property_id)
+    async def get_property(self, property_id: str, include_units: bool = False) -> Property:
+        """Get property by ID (optionally with its units) or raise 404."""
+        db_property = await self.repo.get_by_id(property_id, include_units=include_units)
         if not db_property:
             raise NotFoundException(f"Property with ID {property_id} not found")
         return db_property
@@ -34,13 +43,30 @@ class PropertyService:
         limit: int = 100,
         owner_id: Optional[str] = None,
         supervisor_id: Optional[str] = None,
-        city: Optional[str] = None
-    ) -> List[Property]:
-        """List properties with pagination and filters."""
-        return await self.repo.get_multi(
+        city: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        include_units: bool = False,
+        property_type: Optional[PropertyType] = None,
+        search: Optional[str] = None,
+        near: Optional[tuple[float, float]] = None,
+        radius_km: float = settings.GEO_DEFAULT_RADIUS_KM,
+    ) -> Page[Property]:
+        """
+        List properties with pagination (offset or cursor) and filters.
+        With `near`, each property carries its great-circle `distance_km`.
+        """
+        page = await self.repo.get_multi(
             skip=skip, limit=limit, owner_id=owner_id, 
-            supervisor_id=supervisor_id, city=city
+            supervisor_id=supervisor_id, city=city, cursor=cursor,
+            total=settings.PAGINATION_TOTAL_MODE if include_total else None,
+            include_units=include_units, property_type=property_type, search=search,
+            near=near, radius_km=radius_km,
         )
+        if near is not None:
+            for item in page.items:
+                item.distance_km = round(haversine_km(*near, item.latitude, item.longitude), 3)
+        return page
 
     async def update_property(self, property_id: str, property_in: PropertyUpdate) -> Property:
         """Update property details."""
@@ -48,7 +74,18 @@ class PropertyService:
         return await self.repo.update(db_property, property_in)
 
     async def delete_property(self, property_id: str) -> bool:
-        """Delete a property."""
-        # Ensure it exists
-        await self.get_property(property_id)
-        return await self.repo.delete(property_id)
+        """Delete a property and subtract it from its owner's portfolio."""
+        db_property = await self.get_property(property_id)
+        await self.portfolio_repo.remove_property(property_id)
+        await self.repo.delete(db_property)
+        return True
+
+    async def get_portfolio_summary(self, owner_id: str) -> PortfolioSummary:
+        """An owner's portfolio totals, read from the rollup (one row)."""
+        rollup = await self.portfolio_repo.get(owner_id)
+        if rollup is None:
+            return PortfolioSummary(owner_id=owner_id)
+        summary = PortfolioSummary.model_validate(rollup)
+        if summary.total_units:
+            summary.occupancy_rate = round(summary.occupied_units / summary.total_units, 4)
+        return summary
@@ -0,0 +1,39 @@
+"""
+Token revocation service: logout and account-wide token revocation.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core.revocation import revocation_list
+from app.repositories.revocation_repository import RevocationRepository
+
+settings = get_settings()
+
+
+class RevocationService:
+    """Business logic for revoking access tokens."""
+
+    def __init__(self, db: AsyncSession):
+        self.repo = RevocationRepository(db)
+
+    async def revoke_token(self, payload: dict[str, Any]) -> None:
+        """Revoke a single access token until it expires."""
+        jti = payload.get("jti")
+        if not jti:
+            return
+
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        await self.repo.revoke_jti(jti, payload.get("sub"), expires_at)
+        revocation_list.add_jti(jti)
+
+    async def revoke_user(self, user_id: str) -> None:
+        """Revoke every access token issued to a user so far."""
+        # Whole seconds, matching the resolution of the tokens' iat claim
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        expires_at = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        await self.repo.revoke_user(user_id, revoked_before=now, expires_at=expires_at)
+        revocation_list.add_user(user_id)
@@ -2,13 +2,32 @@
 Unit management service for Amarati.
 """
 
-from typing import List, Optional
+import uuid
+from collections import Counter, defaultdict
+from decimal import Decimal
+from typing import Any, Container, List, Mapping, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.unit import Unit
+from app.config import get_settings
+from app.models.unit import Unit, UnitStatus
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.property_repository import UNIT_STATUS_COUNTERS, PropertyRepository
 from app.repositories.unit_repository import UnitRepository
-from app.schemas.unit import UnitCreate, UnitUpdate
+from app.schemas.unit import (
+    BulkItemResult,
+    BulkResponse,
+    RentBucketCount,
+    UnitBulkUpdateItem,
+    UnitCreate,
+    UnitFacets,
+    UnitSearchFilters,
+    UnitSearchResponse,
+    UnitUpdate,
+)
 from app.core.exceptions import NotFoundException
+from app.utils.pagination import Page
+
+settings = get_settings()
 
 
 class UnitService:
@@ -16,14 +35,21 @@ class UnitService:
 
     def __init__(self, db: AsyncSession):
         self.repo = UnitRepository(db)
+        self.property_repo = PropertyRepository(db)
+        self.portfolio_repo = PortfolioRepository(db)
 
     async def create_unit(self, unit_in: UnitCreate) -> Unit:
-        """Create a new unit."""
+        """Create a new unit and count it on its property and portfolio."""
+        deltas = _counter_deltas()
+        _count_unit(deltas, unit_in.property_id, unit_in.status, unit_in.rent_amount, +1)
+        # The counter UPDATE doubles as the property existence check
+        if not await self._adjust_counters(deltas):
+            raise NotFoundException(f"Property with ID {unit_in.property_id} not found")
         return await self.repo.create(unit_in)
 
-    async def get_unit(self, unit_id: str) -> Unit:
-        """Get unit by ID or raise 404."""
-        db_unit = await self.repo.get_by_id(unit_id)
+    async def get_unit(self, unit_id: str, for_update: bool = False) -> Unit:
+        """Get unit by ID (locked until commit with for_update) or raise 404."""
+        db_unit = await self.repo.get_by_id(unit_id, for_update=for_update)
         if not db_unit:
             raise NotFoundException(f"Unit with ID {unit_id} not found")
         return db_unit
@@ -32,20 +58,216 @@ class UnitService:
         self, 
         property_id: str,
         skip: int = 0, 
-        limit: int = 100
-    ) -> List[Unit]:
-        """List units for a property with pagination."""
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Page[Unit]:
+        """List units for a property with pagination (offset or cursor)."""
         return await self.repo.get_multi_by_property(
-            property_id=property_id, skip=skip, limit=limit
+            property_id=property_id, skip=skip, limit=limit, cursor=cursor,
+            total=settings.PAGINATION_TOTAL_MODE if include_total else None,
         )
 
     async def update_unit(self, unit_id: str, unit_in: UnitUpdate) -> Unit:
-        """Update unit details."""
-        db_unit = await self.get_unit(unit_id)
-        return await self.repo.update(db_unit, unit_in)
+        """Update unit details, moving the unit between counters and rent roll."""
+        # Locked so concurrent writers compute deltas from the row they change
+        db_unit = await self.get_unit(unit_id, for_update=True)
+        old_status, old_rent = db_unit.status, db_unit.rent_amount
+        db_unit = await self.repo.update(db_unit, unit_in)
+        if (db_unit.status, db_unit.rent_amount) != (old_status, old_rent):
+            deltas = _counter_deltas()
+            _count_unit(deltas, db_unit.property_id, old_status, old_rent, -1)
+            _count_unit(deltas, db_unit.property_id, db_unit.status, db_unit.rent_amount, +1)
+            await self._adjust_counters(deltas)
+        return db_unit
 
     async def delete_unit(self, unit_id: str) -> bool:
-        """Delete a unit."""
-        # Ensure it exists
-        await self.get_unit(unit_id)
-        return await self.repo.delete(unit_id)
+        """Delete a unit and uncount it from its property and portfolio."""
+        # Locked: a concurrent delete that got there first makes this a 404
+        db_unit = await self.get_unit(unit_id, for_update=True)
+        deltas = _counter_deltas()
+        _count_unit(deltas, db_unit.property_id, db_unit.status, db_unit.rent_amount, -1)
+        await self._adjust_counters(deltas)
+        await self.repo.delete(db_unit)
+        return True
+
+    async def _adjust_counters(self, deltas: Mapping[str, Mapping[str, Any]]) -> int:
+        """Apply counter deltas to properties, then to their owners' portfolios."""
+        updated = await self.property_repo.adjust_unit_counters(deltas)
+        if updated:
+            await self.portfolio_repo.adjust_unit_counters(deltas)
+        return updated
+
+    async def search_units(
+        self,
+        filters: UnitSearchFilters,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> UnitSearchResponse:
+        """
+        Search units across properties. Facets and the total come from one
+        grouped count over all matches (not just the page).
+        """
+        page = await self.repo.search(filters, skip=skip, limit=limit, cursor=cursor)
+        edges = settings.UNIT_SEARCH_RENT_BUCKETS
+        groups = await self.repo.facet_counts(filters, edges)
+
+        by_status = {status.value: 0 for status in UnitStatus}
+        by_bedrooms: Counter = Counter()
+        by_rent = [0] * len(edges)
+        rent_unknown = 0
+        for status, bedrooms, bucket, count in groups:
+            by_status[UnitStatus(status).value] += count
+            by_bedrooms[bedrooms] += count
+            if bucket < 0:
+                rent_unknown += count
+            else:
+                by_rent[bucket] += count
+
+        facets = UnitFacets(
+            status=by_status,
+            bedrooms={
+                "unknown" if bedrooms is None else str(bedrooms): count
+                for bedrooms, count in sorted(
+                    by_bedrooms.items(), key=lambda kv: (kv[0] is None, kv[0] or 0)
+                )
+            },
+            rent=[
+                RentBucketCount(
+                    min=edges[i], max=edges[i + 1] if i + 1 < len(edges) else None, count=count
+                )
+                for i, count in enumerate(by_rent)
+            ],
+            rent_unknown=rent_unknown,
+        )
+        return UnitSearchResponse(
+            items=page.items,
+            total=sum(by_status.values()),
+            next_cursor=page.next_cursor,
+            facets=facets,
+        )
+
+    # ── Bulk operations ──────────────────────────────────────
+    # Items are validated in one pass (one existence query per batch, which
+    # locks the units being changed so their counter deltas are exact);
+    # valid items are written together and invalid ones reported per item.
+    # Property and portfolio counters get one executemany each per batch.
+    async def bulk_create_units(self, items: List[UnitCreate]) -> BulkResponse:
+        """Create many units with a single executemany INSERT."""
+        property_ids = await self.property_repo.get_existing_ids(
+            item.property_id for item in items
+        )
+        rows: list[dict[str, Any]] = []
+        results: list[BulkItemResult] = []
+        deltas = _counter_deltas()
+        for index, item in enumerate(items):
+            if item.property_id not in property_ids:
+                results.append(_error(index, None, f"Property with ID {item.property_id} not found"))
+                continue
+            unit_id = str(uuid.uuid4())
+            rows.append({"id": unit_id, **item.model_dump()})
+            _count_unit(deltas, item.property_id, item.status, item.rent_amount, +1)
+            results.append(BulkItemResult(index=index, id=unit_id, status="created"))
+
+        await self._adjust_counters(deltas)
+        await self.repo.bulk_insert(rows)
+        return _bulk_response(results)
+
+    async def bulk_update_units(self, items: List[UnitBulkUpdateItem]) -> BulkResponse:
+        """
+        Update many units. Items sharing identical values become one
+        UPDATE ... WHERE id IN (...); the rest go in one executemany.
+        """
+        states = await self.repo.get_states((item.id for item in items), for_update=True)
+        groups: dict[tuple, list[str]] = {}
+        group_values: dict[tuple, dict[str, Any]] = {}
+        seen: set[str] = set()
+        results: list[BulkItemResult] = []
+        deltas = _counter_deltas()
+        for index, item in enumerate(items):
+            values = item.model_dump(exclude_unset=True, exclude={"id"})
+            error = _validate_id(item.id, states, seen) or (
+                None if values else "No fields to update"
+            )
+            if error:
+                results.append(_error(index, item.id, error))
+                continue
+            property_id, old_status, old_rent = states[item.id]
+            new_status = values.get("status") or old_status
+            new_rent = values.get("rent_amount", old_rent)
+            if (new_status, new_rent) != (old_status, old_rent):
+                _count_unit(deltas, property_id, old_status, old_rent, -1)
+                _count_unit(deltas, property_id, new_status, new_rent, +1)
+            key = tuple(sorted(values.items()))
+            groups.setdefault(key, []).append(item.id)
+            group_values[key] = values
+            results.append(BulkItemResult(index=index, id=item.id, status="updated"))
+
+        per_row: list[dict[str, Any]] = []
+        for key, unit_ids in groups.items():
+            if len(unit_ids) > 1:
+                await self.repo.bulk_update_same_values(unit_ids, group_values[key])
+            else:
+                per_row.append({"id": unit_ids[0], **group_values[key]})
+        await self.repo.bulk_update_by_id(per_row)
+        await self._adjust_counters(deltas)
+        return _bulk_response(results)
+
+    async def bulk_delete_units(self, unit_ids: List[str]) -> BulkResponse:
+        """Delete many units with DELETE ... WHERE id IN (...)."""
+        states = await self.repo.get_states(unit_ids, for_update=True)
+        seen: set[str] = set()
+        to_delete: list[str] = []
+        results: list[BulkItemResult] = []
+        deltas = _counter_deltas()
+        for index, unit_id in enumerate(unit_ids):
+            error = _validate_id(unit_id, states, seen)
+            if error:
+                results.append(_error(index, unit_id, error))
+                continue
+            to_delete.append(unit_id)
+            _count_unit(deltas, *states[unit_id], -1)
+            results.append(BulkItemResult(index=index, id=unit_id, status="deleted"))
+
+        await self._adjust_counters(deltas)
+        await self.repo.bulk_delete(to_delete)
+        return _bulk_response(results)
+
+
+def _counter_deltas() -> defaultdict[str, Counter]:
+    """Per-property counter deltas: {property_id: {column: delta}}."""
+    return defaultdict(Counter)
+
+
+def _count_unit(
+    deltas: defaultdict[str, Counter],
+    property_id: str,
+    status: UnitStatus,
+    rent_amount: Optional[Decimal],
+    sign: int,
+) -> None:
+    """Add (+1) or remove (-1) one unit from a property's counters and rent roll."""
+    deltas[property_id]["total_units"] += sign
+    deltas[property_id][UNIT_STATUS_COUNTERS[status]] += sign
+    if status == UnitStatus.OCCUPIED and rent_amount:
+        deltas[property_id]["rent_roll"] += sign * rent_amount
+
+
+def _validate_id(unit_id: str, existing: Container[str], seen: set[str]) -> Optional[str]:
+    """Error message for a missing or repeated unit ID, else None."""
+    if unit_id not in existing:
+        return f"Unit with ID {unit_id} not found"
+    if unit_id in seen:
+        return "Duplicate unit ID in request"
+    seen.add(unit_id)
+    return None
+
+
+def _error(index: int, unit_id: Optional[str], message: str) -> BulkItemResult:
+    return BulkItemResult(index=index, id=unit_id, status="error", error=message)
+
+
+def _bulk_response(results: list[BulkItemResult]) -> BulkResponse:
+    failed = sum(1 for r in results if r.status == "error")
+    return BulkResponse(succeeded=len(results) - failed, failed=failed, results=results)
@@ -6,11 +6,18 @@ from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.exceptions import CredentialsException, NotFoundException
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_password_async
+from app.core.user_cache import invalidate_user
+from app.database import read_session_factory
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import ChangePasswordRequest, UserResponse, UserUpdate
+from app.services.revocation_service import RevocationService
+from app.utils.pagination import Page
+
+settings = get_settings()
 
 
 class UserService:
@@ -33,10 +40,12 @@ class UserService:
         limit: int = 20,
         role: Optional[UserRole] = None,
         is_active: Optional[bool] = None,
-    ) -> tuple[list[User], int]:
-        """Get paginated user list with optional filters."""
+        cursor: Optional[str] = None,
+    ) -> Page[User]:
+        """Get paginated user list (with total) and optional filters."""
         return await self.user_repo.get_all(
-            skip=skip, limit=limit, role=role, is_active=is_active
+            skip=skip, limit=limit, role=role, is_active=is_active, cursor=cursor,
+            total=settings.PAGINATION_TOTAL_MODE,
         )
 
     async def update_user(self, user_id: str, data: UserUpdate) -> User:
@@ -47,23 +56,38 @@ class UserService:
         for field, value in update_data.items():
             setattr(user, field, value)
 
-        return await self.user_repo.update(user)
+        user = await self.user_repo.update(user)
+        invalidate_user(self.db, user.id)
+        return user
 
     async def change_password(
         self, user_id: str, data: ChangePasswordRequest
     ) -> dict:
         """Change user password (requires current password)."""
-        user = await self.get_user_by_id(user_id)
-
-        if not verify_password(data.current_password, user.hashed_password):
+        # Check and hash before the request session's first statement, so
+        # the writer is not held during bcrypt (see AuthService.login)
+        async with read_session_factory() as session:
+            checked = await UserRepository(session).get_by_id(user_id)
+        if not checked:
+            raise NotFoundException(detail="User not found")
+        if not await verify_password_async(data.current_password, checked.hashed_password):
             raise CredentialsException(detail="Current password is incorrect")
+        new_hash = await hash_password_async(data.new_password)
 
-        user.hashed_password = hash_password(data.new_password)
+        user = await self.get_user_by_id(user_id)
+        if user.hashed_password != checked.hashed_password:
+            # Changed concurrently: the verified password is no longer current
+            raise CredentialsException(detail="Current password is incorrect")
+        user.hashed_password = new_hash
         await self.user_repo.update(user)
+        invalidate_user(self.db, user.id)
 
         return {"message": "Password changed successfully"}
 
     async def deactivate_user(self, user_id: str) -> User:
         """Deactivate (soft-delete) a user account."""
         user = await self.get_user_by_id(user_id)
-        return await self.user_repo.deactivate(user)
+        user = await self.user_repo.deactivate(user)
+        await RevocationService(self.db).revoke_user(user.id)
+        invalidate_user(self.db, user.id)
+        return user
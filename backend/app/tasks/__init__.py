@@ -0,0 +1 @@
+"""Tasks package: periodic background jobs and their CLIs."""
@@ -0,0 +1,59 @@
+"""
+OTP purge: deletes expired and used OTP codes older than the retention
+window, in bounded batches so no single statement holds long locks.
+
+Runs periodically from the application lifespan, or manually with:
+    python -m app.tasks.otp_purge [--retention-minutes N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.config import get_settings
+from app.database import async_session_factory
+from app.repositories.otp_repository import OTPRepository
+from app.repositories.otp_store import memory_otp_store
+
+settings = get_settings()
+
+
+async def purge_otps(
+    retention_minutes: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Purge old OTP codes; returns the number of codes removed."""
+    if retention_minutes is None:
+        retention_minutes = settings.OTP_PURGE_RETENTION_MINUTES
+    if batch_size is None:
+        batch_size = settings.OTP_PURGE_BATCH_SIZE
+
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=retention_minutes)
+    total = 0
+    while True:
+        # One short transaction per batch
+        async with async_session_factory() as session:
+            deleted = await OTPRepository(session).delete_purgeable_batch(cutoff, batch_size)
+            await session.commit()
+        total += deleted
+        if deleted < batch_size:
+            break
+        # Yield to request traffic between batches
+        await asyncio.sleep(settings.OTP_PURGE_BATCH_PAUSE_SECONDS)
+
+    total += memory_otp_store.purge_expired()
+    print(f"[OTP PURGE] Purged {total} code(s) older than {retention_minutes} min")
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Purge expired and used OTP codes.")
+    parser.add_argument("--retention-minutes", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(purge_otps(args.retention_minutes, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Outbox cleanup: deletes sent and failed notifications older than the
+retention window, in bounded batches so no single statement holds long
+locks. Delivered bodies are already cleared by the outbox worker; this
+bounds the table itself.
+
+Runs periodically from the application lifespan, or manually with:
+    python -m app.tasks.outbox_cleanup [--retention-hours N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.config import get_settings
+from app.database import async_session_factory
+from app.repositories.outbox_repository import OutboxRepository
+
+settings = get_settings()
+
+
+async def clean_outbox(
+    retention_hours: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Delete finished outbox messages; returns the number removed."""
+    if retention_hours is None:
+        retention_hours = settings.OUTBOX_RETENTION_HOURS
+    if batch_size is None:
+        batch_size = settings.OUTBOX_CLEANUP_BATCH_SIZE
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
+    total = 0
+    while True:
+        # One short transaction per batch
+        async with async_session_factory() as session:
+            deleted = await OutboxRepository(session).delete_finished_batch(cutoff, batch_size)
+            await session.commit()
+        total += deleted
+        if deleted < batch_size:
+            break
+        # Yield to request traffic between batches
+        await asyncio.sleep(settings.OUTBOX_CLEANUP_BATCH_PAUSE_SECONDS)
+
+    print(f"[OUTBOX] Deleted {total} message(s) older than {retention_hours} h")
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Delete sent and failed outbox messages.")
+    parser.add_argument("--retention-hours", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(clean_outbox(args.retention_hours, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
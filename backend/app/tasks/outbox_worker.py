@@ -0,0 +1,104 @@
+"""
+Outbox worker: delivers queued notifications outside the request path.
+
+Each run leases due messages in batches (a short transaction), sends them
+concurrently with no database session open (bounded by
+OUTBOX_CONCURRENCY), then records the results in a second short
+transaction. Failures are retried with exponential backoff until
+OUTBOX_MAX_ATTEMPTS is reached; messages whose worker died are retried
+once their lease (OUTBOX_LEASE_SECONDS) expires, so delivery is
+at-least-once.
+
+Runs periodically from the application lifespan, or manually with:
+    python -m app.tasks.outbox_worker
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.config import get_settings
+from app.database import async_session_factory
+from app.models.outbox import OutboxMessage
+from app.repositories.outbox_repository import OutboxRepository
+from app.services.notification_sender import NotificationSender, get_notification_sender
+
+settings = get_settings()
+
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds to wait before retry number `attempts` (with jitter)."""
+    delay = settings.OUTBOX_BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    delay = min(delay, settings.OUTBOX_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+async def _deliver(
+    sender: NotificationSender,
+    message: OutboxMessage,
+    semaphore: asyncio.Semaphore,
+) -> Optional[str]:
+    """Send one message; returns an error string on failure."""
+    async with semaphore:
+        try:
+            await sender.send(message)
+            return None
+        except Exception as exc:
+            return f"{type(exc).__name__}: {exc}"
+
+
+async def drain_outbox(
+    sender: Optional[NotificationSender] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Deliver all due messages; returns the number sent successfully."""
+    sender = sender or get_notification_sender()
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    semaphore = asyncio.Semaphore(settings.OUTBOX_CONCURRENCY)
+    sent = 0
+
+    while True:
+        # Short transaction 1: lease a batch
+        now = datetime.now(timezone.utc)
+        lease_until = now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+        async with async_session_factory() as session:
+            repo = OutboxRepository(session)
+            batch = await repo.claim_due_batch(now, batch_size, lease_until)
+            await session.commit()
+        if not batch:
+            break
+
+        # Network I/O with no session (locks or SQLite writer) held
+        errors = await asyncio.gather(
+            *(_deliver(sender, message, semaphore) for message in batch)
+        )
+
+        outcomes = []
+        now = datetime.now(timezone.utc)
+        for message, error in zip(batch, errors):
+            if error is None:
+                outcomes.append(OutboxRepository.sent_values(message))
+                sent += 1
+                continue
+            attempts = message.attempts + 1
+            retry_at = (
+                now + timedelta(seconds=backoff_delay(attempts))
+                if attempts < settings.OUTBOX_MAX_ATTEMPTS
+                else None
+            )
+            outcomes.append(OutboxRepository.failed_values(message, error, retry_at))
+
+        # Short transaction 2: record the results
+        async with async_session_factory() as session:
+            await OutboxRepository(session).record_outcomes(outcomes)
+            await session.commit()
+
+        if len(batch) < batch_size:
+            break
+
+    return sent
+
+
+if __name__ == "__main__":
+    print(f"[OUTBOX] Sent {asyncio.run(drain_outbox())} message(s)")
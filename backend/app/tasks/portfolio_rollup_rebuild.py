@@ -0,0 +1,58 @@
+"""
+Portfolio rollup rebuild: repairs per-property counters and rent roll
+(app.tasks.unit_counter_reconcile), then re-sums every owner's rollup
+from their properties, one batch of owners per short transaction.
+
+Runs periodically from the application lifespan, or manually for
+recovery with:
+    python -m app.tasks.portfolio_rollup_rebuild [--batch-size N]
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app.config import get_settings
+from app.database import async_session_factory
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.tasks.unit_counter_reconcile import reconcile_unit_counters
+
+settings = get_settings()
+
+
+async def rebuild_portfolio_rollups(batch_size: Optional[int] = None) -> int:
+    """Repair drifted property and owner rollups; returns owners fixed."""
+    if batch_size is None:
+        batch_size = settings.UNIT_COUNTER_RECONCILE_BATCH_SIZE
+
+    # Owner rollups are sums of property rollups: repair those first
+    await reconcile_unit_counters(batch_size)
+
+    after_id: Optional[str] = None
+    checked = repaired = 0
+    while True:
+        async with async_session_factory() as session:
+            repo = PortfolioRepository(session)
+            owner_ids = await repo.get_owner_ids_after(after_id, batch_size)
+            repaired += await repo.reconcile(owner_ids)
+            await session.commit()
+        checked += len(owner_ids)
+        if len(owner_ids) < batch_size:
+            break
+        after_id = owner_ids[-1]
+        # Yield to request traffic between batches
+        await asyncio.sleep(settings.UNIT_COUNTER_RECONCILE_BATCH_PAUSE_SECONDS)
+
+    print(f"[PORTFOLIO] Checked {checked} owner(s), repaired {repaired}")
+    return repaired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild property and owner portfolio rollups.")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(rebuild_portfolio_rollups(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Property search rebuild: recreates the SQLite full-text triggers if they
+are missing, keys any unindexed properties and reindexes every row.
+
+Not scheduled. Run it manually after a migration that recreates the
+properties table (Alembic batch mode drops its triggers), after restoring
+properties from a dump, or whenever search results look stale:
+    python -m app.tasks.property_search_rebuild
+"""
+
+import asyncio
+
+from app.config import get_settings
+from app.database import engine
+from app.models.property import SQLITE_SEARCH_DDL, SQLITE_SEARCH_REBUILD
+
+settings = get_settings()
+
+
+async def rebuild_property_search() -> bool:
+    """Rebuild the full-text index; returns False where there is none to rebuild."""
+    if not settings.is_sqlite:
+        # PostgreSQL's generated tsvector column cannot drift
+        print("[SEARCH] Nothing to rebuild on this database")
+        return False
+
+    async with engine.begin() as conn:
+        for statement in SQLITE_SEARCH_DDL + SQLITE_SEARCH_REBUILD:
+            await conn.exec_driver_sql(statement)
+    print("[SEARCH] Rebuilt the property search index")
+    return True
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_property_search())
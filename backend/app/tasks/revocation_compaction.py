@@ -0,0 +1,23 @@
+"""
+Revocation compaction: drops revocations whose tokens have expired and
+rebuilds the in-memory Bloom filter from the remaining rows.
+
+Run manually with:
+    python -m app.tasks.revocation_compaction
+"""
+
+import asyncio
+
+from app.core.revocation import load_revocation_list
+
+
+async def compact_revocations() -> int:
+    """Purge expired revocations and refresh the filter; returns rows deleted."""
+    deleted = await load_revocation_list(purge_expired=True)
+    if deleted:
+        print(f"[REVOCATION] Compacted {deleted} expired revocation(s)")
+    return deleted
+
+
+if __name__ == "__main__":
+    asyncio.run(compact_revocations())
@@ -0,0 +1,46 @@
+"""
+Minimal in-process scheduler for periodic background jobs.
+Jobs are started from the application lifespan and cancelled on shutdown.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class PeriodicScheduler:
+    """Runs registered coroutine functions at fixed intervals."""
+
+    def __init__(self):
+        self._jobs: list[tuple[str, float, Callable[[], Awaitable[Any]]]] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(self, name: str, interval_seconds: float, func: Callable[[], Awaitable[Any]]) -> None:
+        """Register a job; interval_seconds <= 0 disables it."""
+        if interval_seconds > 0:
+            self._jobs.append((name, interval_seconds, func))
+
+    def start(self) -> None:
+        """Start all registered jobs on the running event loop."""
+        for name, interval, func in self._jobs:
+            self._tasks.append(asyncio.create_task(self._run(name, interval, func), name=name))
+
+    async def stop(self) -> None:
+        """Cancel all running jobs and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    @staticmethod
+    async def _run(name: str, interval: float, func: Callable[[], Awaitable[Any]]) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # keep the job alive on errors
+                print(f"[TASK] {name} failed: {exc!r}")
+
+
+scheduler = PeriodicScheduler()
@@ -0,0 +1,53 @@
+"""
+Unit counter reconciliation: recounts units per property and repairs
+drifted counters on the properties table, one batch of properties per
+short transaction.
+
+Runs periodically from the application lifespan, or manually with:
+    python -m app.tasks.unit_counter_reconcile [--batch-size N]
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app.config import get_settings
+from app.database import async_session_factory
+from app.repositories.property_repository import PropertyRepository
+
+settings = get_settings()
+
+
+async def reconcile_unit_counters(batch_size: Optional[int] = None) -> int:
+    """Repair drifted unit counters; returns the number of properties fixed."""
+    if batch_size is None:
+        batch_size = settings.UNIT_COUNTER_RECONCILE_BATCH_SIZE
+
+    after_id: Optional[str] = None
+    checked = repaired = 0
+    while True:
+        async with async_session_factory() as session:
+            repo = PropertyRepository(session)
+            property_ids = await repo.get_ids_after(after_id, batch_size)
+            repaired += await repo.reconcile_unit_counters(property_ids)
+            await session.commit()
+        checked += len(property_ids)
+        if len(property_ids) < batch_size:
+            break
+        after_id = property_ids[-1]
+        # Yield to request traffic between batches
+        await asyncio.sleep(settings.UNIT_COUNTER_RECONCILE_BATCH_PAUSE_SECONDS)
+
+    print(f"[UNIT COUNTERS] Checked {checked} property(ies), repaired {repaired}")
+    return repaired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Repair per-property unit counters.")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(reconcile_unit_counters(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
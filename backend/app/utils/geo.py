@@ -0,0 +1,95 @@
+"""
+Geohash and distance helpers for proximity search.
+
+A geohash interleaves longitude and latitude bits into a base32 string;
+points in the same cell share a prefix, so "everything in this cell" is
+a plain range scan on an ordinary B-tree index (SQLite and PostgreSQL
+alike). A radius query is answered by covering its bounding box with a
+handful of cells and range-scanning each prefix.
+"""
+
+import math
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9  # ~4.8 m x 4.8 m cells; width of the stored column
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    """(height, width) in degrees of a geohash cell."""
+    bits = 5 * precision
+    return 180 / 2 ** (bits // 2), 360 / 2 ** ((bits + 1) // 2)
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Geohash of a point."""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, value, bit, even = [], 0, 0, True
+    while len(chars) < precision:
+        span, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (span[0] + span[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            span[0] = middle
+        else:
+            span[1] = middle
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            value, bit = 0, 0
+    return "".join(chars)
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> tuple[float, float, float, float]:
+    """
+    (min_lat, max_lat, min_lon, max_lon) enclosing a circle. Longitudes may
+    fall outside [-180, 180] when the circle crosses the antimeridian; the
+    box spans every longitude when it reaches a pole.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = latitude - dlat, latitude + dlat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+    dlon = dlat / math.cos(math.radians(latitude))
+    return min_lat, max_lat, longitude - dlon, longitude + dlon
+
+
+def covering_cells(
+    latitude: float, longitude: float, radius_km: float, max_cells: int = 9
+) -> list[str]:
+    """
+    Geohash prefixes whose cells cover the circle's bounding box, using the
+    longest precision that needs at most `max_cells` cells. Returns [] when
+    even single-character cells would need more (the whole world).
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    # Keep the north pole and a full turn of longitude inside the last cell
+    max_lat, max_lon = min(max_lat, 90 - 1e-9), min(max_lon, min_lon + 360 - 1e-9)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        rows = range(math.floor((min_lat + 90) / height), math.floor((max_lat + 90) / height) + 1)
+        columns = range(math.floor((min_lon + 180) / width), math.floor((max_lon + 180) / width) + 1)
+        if len(rows) * len(columns) > max_cells:
+            continue
+        wrap = round(360 / width)
+        return sorted({
+            encode_geohash(
+                (row + 0.5) * height - 90,
+                ((column % wrap) + 0.5) * width - 180,
+                precision,
+            )
+            for row in rows
+            for column in columns
+        })
+    return []
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi, dlambda = phi2 - phi1, math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
@@ -3,7 +3,9 @@ Utility helper functions.
 """
 
 import re
-from typing import Optional
+from typing import Iterator, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
 
 
 def is_valid_email(email: str) -> bool:
@@ -23,3 +25,9 @@ def sanitize_string(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
     return value.strip()
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
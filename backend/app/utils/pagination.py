@@ -0,0 +1,167 @@
+"""
+Keyset (cursor) pagination helpers.
+
+List queries are ordered by (created_at, id). A cursor is the opaque,
+URL-safe encoding of the last row's (created_at, id); the next page
+starts strictly after it, so deep pages cost the same as the first one
+and rows do not shift when others are inserted or deleted.
+
+Totals, when requested, come back in the same round trip as the page:
+a `count(*) OVER ()` window column in offset mode, or an uncorrelated
+count subquery in cursor mode (where the cursor condition would
+otherwise shrink the window).
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from sqlalchemy import BigInteger, Select, cast, column, func, literal, select, table, tuple_
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core.exceptions import BadRequestException
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+TOTAL_EXACT = "exact"
+TOTAL_ESTIMATE = "estimate"
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results, the cursor for the next page and an optional total."""
+    items: list[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def encode_cursor(created_at: datetime, id_: str) -> str:
+    """Encode a (created_at, id) position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), id_], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor; 400 if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(id_)
+    except (ValueError, TypeError):
+        raise BadRequestException(detail="Invalid pagination cursor")
+
+
+def page_headers(page: Page) -> dict[str, str]:
+    """Response headers describing a page (next cursor and total)."""
+    headers = {}
+    if page.next_cursor:
+        headers["X-Next-Cursor"] = page.next_cursor
+    if page.total is not None:
+        headers["X-Total-Count"] = str(page.total)
+        if page.total_is_estimate:
+            headers["X-Total-Count-Estimated"] = "true"
+    return headers
+
+
+def _estimated_total_column(table_name: str):
+    """Planner row estimate for a whole table (PostgreSQL only)."""
+    pg_class = table("pg_class", column("reltuples"), column("oid"))
+    return (
+        select(cast(pg_class.c.reltuples, BigInteger))
+        .where(pg_class.c.oid == cast(literal(table_name), REGCLASS))
+        .scalar_subquery()
+    )
+
+
+async def count_rows(db: AsyncSession, query: Select) -> int:
+    """Exact number of rows `query` matches (ignoring order/limit)."""
+    subquery = query.order_by(None).limit(None).offset(None).subquery()
+    result = await db.execute(select(func.count()).select_from(subquery))
+    return result.scalar() or 0
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    created_at_column: Any,
+    id_column: Any,
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    total: Optional[str] = None,
+    order_by: Optional[Sequence[Any]] = None,
+) -> Page:
+    """
+    Run `query` ordered by (created_at, id) and return one page.
+
+    With a cursor the page starts after that position (keyset mode) and
+    `skip` is ignored; without one, `skip` is applied as an OFFSET.
+    `total` is None (no total), "exact" or "estimate". `order_by`
+    replaces the (created_at, id) ordering (e.g. search rank); such pages
+    are offset-only and carry no next cursor.
+    """
+    if order_by is not None and cursor:
+        raise BadRequestException(detail="Cursor pagination is not available for ranked results")
+    filtered = query
+    if cursor:
+        position = decode_cursor(cursor)
+        key = tuple_(created_at_column, id_column)
+        query = query.where(key < position if descending else key > position)
+    elif skip:
+        query = query.offset(skip)
+
+    if order_by is not None:
+        query = query.order_by(*order_by)
+    elif descending:
+        query = query.order_by(created_at_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(created_at_column, id_column)
+
+    estimated = (
+        total == TOTAL_ESTIMATE
+        and settings.is_postgres
+        and filtered.whereclause is None
+    )
+    if estimated:
+        query = query.add_columns(_estimated_total_column(created_at_column.table.name))
+    elif total and cursor:
+        query = query.add_columns(
+            select(func.count()).select_from(filtered.subquery()).scalar_subquery()
+        )
+    elif total:
+        query = query.add_columns(func.count().over())
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    if total:
+        rows: Sequence = result.all()
+        page_total = rows[0][1] if rows else None
+        rows = [row[0] for row in rows]
+    else:
+        rows = result.scalars().all()
+
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and order_by is None:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    page = Page(items=items, next_cursor=next_cursor)
+
+    if total:
+        # An empty page carries no total column, and a never-analyzed table
+        # reports a negative estimate: count exactly in those cases
+        if page_total is None and not (skip or cursor):
+            page_total, estimated = 0, False
+        elif page_total is None or page_total < 0:
+            page_total, estimated = await count_rows(db, filtered), False
+        page.total = int(page_total)
+        page.total_is_estimate = estimated
+    return page
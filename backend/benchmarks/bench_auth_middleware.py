@@ -0,0 +1,96 @@
+"""
+Latency benchmark for authenticated requests to GET /api/v1/properties/.
+
+Measures end-to-end in-process latency (ASGI transport, no network) and
+the number of SQL statements issued per request, so the cost of the auth
+middleware path can be compared between revisions.
+
+Usage (from backend/):
+    python -m benchmarks.bench_auth_middleware --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+_DB_DIR = tempfile.mkdtemp(prefix="amarati_bench_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.core.security import create_access_token, hash_password  # noqa: E402
+from app.database import async_session_factory, create_tables, engine, read_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+
+
+async def _create_user() -> User:
+    async with async_session_factory() as session:
+        user = User(
+            email="bench@amarati.com",
+            full_name="Bench User",
+            hashed_password=hash_password("Password123!"),
+            role=UserRole.OWNER,
+            is_verified=True,
+            is_active=True,
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+
+async def run(requests: int, warmup: int) -> None:
+    await create_tables()
+    user = await _create_user()
+    token = create_access_token({"sub": user.id, "role": user.role.value})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    statements = 0
+
+    def _count(*_args, **_kwargs):
+        nonlocal statements
+        statements += 1
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(warmup):
+            await client.get("/api/v1/properties/", headers=headers)
+
+        # GET requests run on the reader engine in SQLite single-writer mode
+        for eng in {engine, read_engine}:
+            event.listen(eng.sync_engine, "before_cursor_execute", _count)
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = await client.get("/api/v1/properties/", headers=headers)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+        for eng in {engine, read_engine}:
+            event.remove(eng.sync_engine, "before_cursor_execute", _count)
+
+    samples.sort()
+    print(f"requests:        {requests}")
+    print(f"mean latency:    {statistics.mean(samples):.3f} ms")
+    print(f"p50 latency:     {samples[len(samples) // 2]:.3f} ms")
+    print(f"p95 latency:     {samples[int(len(samples) * 0.95)]:.3f} ms")
+    print(f"p99 latency:     {samples[int(len(samples) * 0.99)]:.3f} ms")
+    print(f"SQL per request: {statements / requests:.2f}")
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
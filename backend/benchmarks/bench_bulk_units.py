@@ -0,0 +1,84 @@
+"""
+Throughput benchmark: N single POST /units/ calls vs one POST /units/bulk.
+
+Runs in-process (ASGI transport, no network) against a temporary SQLite
+database and reports units written per second for each path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_bulk_units --units 2000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+_DB_DIR = tempfile.mkdtemp(prefix="amarati_bench_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.core.security import create_access_token  # noqa: E402
+from app.database import async_session_factory, create_tables, engine, read_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.property import Property  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+
+
+async def _seed() -> tuple[str, str]:
+    async with async_session_factory() as session:
+        owner = User(
+            email="bench@amarati.com",
+            full_name="Bench Owner",
+            hashed_password="x",
+            role=UserRole.OWNER,
+            is_verified=True,
+        )
+        session.add(owner)
+        await session.flush()
+        building = Property(name="Bench Tower", address="1 Olaya Street", city="Riyadh", owner_id=owner.id)
+        session.add(building)
+        await session.commit()
+        return owner.id, building.id
+
+
+async def run(units: int) -> None:
+    await create_tables()
+    owner_id, property_id = await _seed()
+    token = create_access_token({"sub": owner_id, "role": UserRole.OWNER.value})
+    headers = {"Authorization": f"Bearer {token}"}
+    items = [{"unit_number": str(i), "property_id": property_id, "bedrooms": 2} for i in range(units)]
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        for item in items:
+            response = await client.post("/api/v1/units/", headers=headers, json=item)
+            assert response.status_code == 201, response.text
+        single_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        response = await client.post("/api/v1/units/bulk", headers=headers, json={"items": items})
+        bulk_s = time.perf_counter() - started
+        assert response.status_code == 200 and response.json()["failed"] == 0, response.text
+
+    print(f"units:              {units}")
+    print(f"single requests:    {single_s:.3f} s  ({units / single_s:,.0f} units/s)")
+    print(f"one bulk request:   {bulk_s:.3f} s  ({units / bulk_s:,.0f} units/s)")
+    print(f"speedup:            {single_s / bulk_s:.1f}x")
+
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.units))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Deep-page latency benchmark: OFFSET vs keyset (cursor) pagination.
+
+Seeds a temporary SQLite database with one owner's properties and times
+PropertyRepository.get_multi at increasing depths in both modes.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pagination --rows 100000 --page-size 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+_DB_DIR = tempfile.mkdtemp(prefix="amarati_bench_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from sqlalchemy import insert  # noqa: E402
+
+from app.database import async_session_factory, create_tables, engine, read_engine  # noqa: E402
+from app.models.property import Property, PropertyType  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.repositories.property_repository import PropertyRepository  # noqa: E402
+from app.utils.pagination import encode_cursor  # noqa: E402
+
+
+async def _seed(rows: int) -> str:
+    owner_id = str(uuid.uuid4())
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with async_session_factory() as session:
+        session.add(User(
+            id=owner_id,
+            email="bench@amarati.com",
+            full_name="Bench Owner",
+            hashed_password="x",
+            role=UserRole.OWNER,
+        ))
+        for offset in range(0, rows, 5000):
+            await session.execute(insert(Property), [
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": f"Building {i}",
+                    "address": f"{i} King Fahd Road",
+                    "city": "Riyadh",
+                    "type": PropertyType.RESIDENTIAL,
+                    "owner_id": owner_id,
+                    "total_units": 0,
+                    "created_at": start + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + 5000, rows))
+            ])
+        await session.commit()
+    return owner_id
+
+
+async def _time_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def run(rows: int, page_size: int, repeat: int) -> None:
+    await create_tables()
+    owner_id = await _seed(rows)
+    depths = sorted({0, rows // 100, rows // 10, rows // 2, rows - page_size})
+
+    print(f"rows: {rows}  page size: {page_size}  (median of {repeat} runs)")
+    print(f"{'depth':>8} {'offset ms':>10} {'cursor ms':>10} {'speedup':>8}")
+    async with async_session_factory() as session:
+        repo = PropertyRepository(session)
+        for depth in depths:
+            # Cursor for the row just before `depth`, so both modes return the same page
+            cursor = None
+            if depth:
+                previous = await repo.get_multi(skip=depth - 1, limit=1, owner_id=owner_id)
+                last = previous.items[0]
+                cursor = encode_cursor(last.created_at, last.id)
+
+            offset_page = await repo.get_multi(skip=depth, limit=page_size, owner_id=owner_id)
+            cursor_page = await repo.get_multi(limit=page_size, owner_id=owner_id, cursor=cursor)
+            assert [p.id for p in offset_page.items] == [p.id for p in cursor_page.items]
+
+            offset_ms = await _time_ms(
+                lambda: repo.get_multi(skip=depth, limit=page_size, owner_id=owner_id), repeat
+            )
+            cursor_ms = await _time_ms(
+                lambda: repo.get_multi(limit=page_size, owner_id=owner_id, cursor=cursor), repeat
+            )
+            session.expunge_all()
+            print(f"{depth:>8} {offset_ms:>10.3f} {cursor_ms:>10.3f} {offset_ms / cursor_ms:>7.1f}x")
+
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Proximity search latency benchmark: geohash index vs bounding-box scan.
+
+Grows a temporary SQLite database of properties scattered across Saudi
+Arabia (clustered around cities, as real listings are) in steps up to
+`--rows`, and after each step times `near` searches at random listed
+locations both through the repository (geohash cells, index range scans)
+and as a plain latitude/longitude bounding-box filter ordered by
+distance (full scan). The scan grows with the table; the indexed search
+grows only with the number of rows near the point.
+
+Usage (from backend/):
+    python -m benchmarks.bench_property_near --rows 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+_DB_DIR = tempfile.mkdtemp(prefix="amarati_bench_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from sqlalchemy import insert, select, text  # noqa: E402
+
+from app.database import async_session_factory, create_tables, engine, read_engine  # noqa: E402
+from app.models.property import Property, PropertyType  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.repositories.property_repository import PropertyRepository  # noqa: E402
+from app.utils.geo import bounding_box, encode_geohash  # noqa: E402
+
+# (latitude, longitude, spread in degrees, share of listings)
+CITIES = [
+    (24.7136, 46.6753, 0.25, 0.35),  # Riyadh
+    (21.5433, 39.1728, 0.20, 0.25),  # Jeddah
+    (26.4207, 50.0888, 0.15, 0.10),  # Dammam
+    (21.3891, 39.8579, 0.10, 0.08),  # Mecca
+    (24.5247, 39.5692, 0.10, 0.07),  # Medina
+]
+COUNTRY = (16.5, 32.0, 36.5, 55.5)  # everything else, spread uniformly
+BATCH = 10000
+
+
+def _point(rng: random.Random) -> tuple[float, float]:
+    roll = rng.random()
+    for latitude, longitude, spread, share in CITIES:
+        if roll < share:
+            return rng.gauss(latitude, spread), rng.gauss(longitude, spread)
+        roll -= share
+    min_lat, max_lat, min_lon, max_lon = COUNTRY
+    return rng.uniform(min_lat, max_lat), rng.uniform(min_lon, max_lon)
+
+
+async def _seed(owner_id: str, start: int, stop: int, rng: random.Random) -> None:
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with async_session_factory() as session:
+        for offset in range(start, stop, BATCH):
+            rows = []
+            for i in range(offset, min(offset + BATCH, stop)):
+                latitude, longitude = _point(rng)
+                rows.append({
+                    "id": str(uuid.uuid4()),
+                    "name": f"Property {i}",
+                    "address": f"{i} Main Street",
+                    "city": "Riyadh",
+                    "type": PropertyType.RESIDENTIAL,
+                    "owner_id": owner_id,
+                    "created_at": created + timedelta(seconds=i),
+                    # Core inserts bypass the ORM hook that derives geohash
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "geohash": encode_geohash(latitude, longitude),
+                })
+            await session.execute(insert(Property), rows)
+        await session.commit()
+
+
+async def _time_ms(func, points, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        for point in points:
+            started = time.perf_counter()
+            await func(point)
+            samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def run(max_rows: int, radius_km: float, page_size: int, repeat: int) -> None:
+    await create_tables()
+    owner_id = str(uuid.uuid4())
+    async with async_session_factory() as session:
+        session.add(User(
+            id=owner_id, email="bench@amarati.com", full_name="Bench Owner",
+            hashed_password="x", role=UserRole.OWNER,
+        ))
+        await session.commit()
+
+    steps = [n for n in (10000, 100000, 1000000) if n < max_rows] + [max_rows]
+    rng = random.Random(7)
+    seeded = 0
+    print(f"radius: {radius_km} km  page size: {page_size}  (median over {repeat} x 20 points)")
+    print(f"{'rows':>9} {'in radius':>10} {'scan ms':>9} {'geohash ms':>11} {'speedup':>8}")
+    for rows in steps:
+        await _seed(owner_id, seeded, rows, rng)
+        seeded = rows
+        async with async_session_factory() as session:
+            await session.execute(text("ANALYZE"))
+            points = [_point(random.Random(seed)) for seed in range(20)]
+            repo = PropertyRepository(session)
+
+            async def scan(point):
+                min_lat, max_lat, min_lon, max_lon = bounding_box(*point, radius_km)
+                dy, dx = Property.latitude - point[0], Property.longitude - point[1]
+                await session.execute(
+                    select(Property)
+                    .where(Property.latitude.between(min_lat, max_lat))
+                    .where(Property.longitude.between(min_lon, max_lon))
+                    .order_by(dy * dy + dx * dx)
+                    .limit(page_size)
+                )
+                session.expunge_all()
+
+            async def indexed(point):
+                await repo.get_multi(near=point, radius_km=radius_km, limit=page_size)
+                session.expunge_all()
+
+            matches = statistics.median([
+                (await repo.get_multi(near=point, radius_km=radius_km, limit=1, total="exact")).total
+                for point in points
+            ])
+            scan_ms = await _time_ms(scan, points, repeat)
+            geo_ms = await _time_ms(indexed, points, repeat)
+            print(f"{rows:>9} {matches:>10.0f} {scan_ms:>9.2f} {geo_ms:>11.2f} {scan_ms / geo_ms:>7.1f}x")
+
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--radius-km", type=float, default=2.0)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.radius_km, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
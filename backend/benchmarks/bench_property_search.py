@@ -0,0 +1,123 @@
+"""
+Search latency benchmark: LIKE '%...%' scan vs the full-text index.
+
+Seeds a temporary SQLite database with properties named from a large
+vocabulary (the FTS5 index is filled by its triggers) and times searches
+both ways. LIKE can stop after the first page of newest matches, so it
+only keeps up on terms matching a large share of rows ("dense"); ranked
+full-text search has to score every match.
+
+Usage (from backend/):
+    python -m benchmarks.bench_property_search --rows 200000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+_DB_DIR = tempfile.mkdtemp(prefix="amarati_bench_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from sqlalchemy import insert, or_, select  # noqa: E402
+
+from app.database import async_session_factory, create_tables, engine, read_engine  # noqa: E402
+from app.models.property import Property, PropertyType  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.repositories.property_repository import PropertyRepository  # noqa: E402
+
+SYLLABLES = ["al", "ra", "mar", "ya", "sa", "din", "ha", "qa", "zu", "fa", "nur", "bel", "kha", "tim"]
+WORDS = sorted({a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES})
+CITIES = ["Riyadh", "Jeddah", "Dammam", "Mecca", "Medina", "Khobar", "Abha", "Tabuk"]
+
+
+async def _seed(rows: int) -> None:
+    rng = random.Random(7)
+    owner_id = str(uuid.uuid4())
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with async_session_factory() as session:
+        session.add(User(
+            id=owner_id, email="bench@amarati.com", full_name="Bench Owner",
+            hashed_password="x", role=UserRole.OWNER,
+        ))
+        for offset in range(0, rows, 5000):
+            await session.execute(insert(Property), [
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": " ".join(rng.sample(WORDS, 2)) + f" {i}",
+                    "address": f"{i} {rng.choice(WORDS)} Street",
+                    "city": rng.choice(CITIES),
+                    "description": " ".join(rng.sample(WORDS, 4)),
+                    "type": PropertyType.RESIDENTIAL,
+                    "owner_id": owner_id,
+                    "created_at": start + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + 5000, rows))
+            ])
+        await session.commit()
+
+
+async def _time_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def run(rows: int, page_size: int, repeat: int) -> None:
+    await create_tables()
+    await _seed(rows)
+
+    print(f"rows: {rows}  page size: {page_size}  (median of {repeat} runs)")
+    print(f"{'query':<22} {'matches':>8} {'LIKE ms':>9} {'FTS ms':>9} {'speedup':>8}")
+    async with async_session_factory() as session:
+        repo = PropertyRepository(session)
+        rare, other = WORDS[100], WORDS[2000]
+        for query in [rare, f"{rare} {other}", f"{other[:4]}", "nomatchword", "riyadh (dense)"]:
+            query = query.replace(" (dense)", "")
+            terms = query.split()
+
+            async def like_scan():
+                stmt = select(Property)
+                for term in terms:
+                    pattern = f"%{term}%"
+                    stmt = stmt.where(or_(
+                        Property.name.ilike(pattern), Property.address.ilike(pattern),
+                        Property.city.ilike(pattern), Property.description.ilike(pattern),
+                    ))
+                stmt = stmt.order_by(Property.created_at.desc()).limit(page_size)
+                await session.execute(stmt)
+                session.expunge_all()
+
+            async def fts_search():
+                await repo.get_multi(search=query, limit=page_size)
+                session.expunge_all()
+
+            matches = (await repo.get_multi(search=query, limit=1, total="exact")).total
+            like_ms = await _time_ms(like_scan, repeat)
+            fts_ms = await _time_ms(fts_search, repeat)
+            print(f"{query:<22} {matches:>8} {like_ms:>9.2f} {fts_ms:>9.2f} {like_ms / fts_ms:>7.1f}x")
+
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
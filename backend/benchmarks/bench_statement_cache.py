@@ -0,0 +1,99 @@
+"""
+Per-call Python overhead of hot user lookups: ad-hoc select() vs pre-built statements.
+
+For each lookup, times (1) statement construction plus cache-key
+generation alone, and (2) the full lookup against a temporary SQLite
+database, once with a select() built per call (the old repository code)
+and once through the repository's pre-built statement. Finishes with the
+compiled-cache hit rate seen by the engine.
+
+Usage (from backend/):
+    python -m benchmarks.bench_statement_cache --calls 5000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import timeit
+
+_DB_DIR = tempfile.mkdtemp(prefix="amarati_bench_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ["DEBUG"] = "false"
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.statement_cache import compiled_cache_stats  # noqa: E402
+from app.database import async_session_factory, create_tables, engine, read_engine  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.repositories import user_repository  # noqa: E402
+from app.repositories.user_repository import UserRepository  # noqa: E402
+
+
+async def _seed() -> dict[str, str]:
+    async with async_session_factory() as session:
+        owner = User(
+            email="bench@amarati.com", phone="+966500000000", full_name="Bench",
+            hashed_password="x", role=UserRole.OWNER,
+        )
+        session.add(owner)
+        await session.commit()
+        return {"email": owner.email, "phone": owner.phone}
+
+
+def _lookups(keys: dict[str, str]):
+    """(name, ad-hoc statement factory, pre-built statement, repository call)."""
+    return [
+        ("user by email", lambda: select(User).where(User.email == keys["email"]),
+         user_repository._USER_BY_EMAIL, lambda s: UserRepository(s).get_by_email(keys["email"])),
+        ("user by phone", lambda: select(User).where(User.phone == keys["phone"]),
+         user_repository._USER_BY_PHONE, lambda s: UserRepository(s).get_by_phone(keys["phone"])),
+    ]
+
+
+async def _per_call_us(session, call, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call()
+        # Defeat the identity map so every call loads the row
+        session.expunge_all()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def run(calls: int) -> None:
+    await create_tables()
+    lookups = _lookups(await _seed())
+
+    print("statement build + cache key (Python only), us/call")
+    print(f"{'lookup':<16} {'ad-hoc':>9} {'pre-built':>10}")
+    for name, build, prebuilt, _ in lookups:
+        adhoc_us = timeit.timeit(lambda: build()._generate_cache_key(), number=calls) / calls * 1e6
+        prebuilt_us = timeit.timeit(prebuilt._generate_cache_key, number=calls) / calls * 1e6
+        print(f"{name:<16} {adhoc_us:>9.2f} {prebuilt_us:>10.2f}")
+
+    print("\nfull lookup on SQLite, us/call")
+    print(f"{'lookup':<16} {'ad-hoc':>9} {'pre-built':>10} {'saved':>8}")
+    compiled_cache_stats.reset()
+    async with async_session_factory() as session:
+        for name, build, _, repo_call in lookups:
+            adhoc_us = await _per_call_us(session, lambda: session.execute(build()), calls)
+            prebuilt_us = await _per_call_us(session, lambda: repo_call(session), calls)
+            print(f"{name:<16} {adhoc_us:>9.1f} {prebuilt_us:>10.1f} {adhoc_us - prebuilt_us:>8.1f}")
+
+    stats = compiled_cache_stats.stats()
+    print(f"\ncompiled cache: {stats['hits']} hits, {stats['misses']} misses, hit rate {stats['hit_rate']:.2%}")
+
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
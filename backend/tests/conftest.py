@@ -4,9 +4,12 @@ Test configuration and fixtures.
 
 import os
 os.environ["DEBUG"] = "True"
+# Cheapest bcrypt cost keeps the suite fast
+os.environ["BCRYPT_ROUNDS"] = "4"
 
 import asyncio
 import uuid
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
 import pytest
@@ -14,9 +17,12 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select
 
-from app.database import Base, engine, async_session_factory
+from app.database import Base, engine, read_engine, async_session_factory
 from app.main import app
 from app.config import get_settings
+from app.core.rate_limit import bucket_store
+from app.core.revocation import revocation_list
+from app.core.user_cache import user_cache
 from app.models.user import User
 from app.models.otp import OTPCode
 
@@ -29,12 +35,21 @@ def event_loop():
     """Create an event loop for the test session."""
     loop = asyncio.new_event_loop()
     yield loop
+    # Closing all connections checkpoints and removes the SQLite WAL files
+    loop.run_until_complete(read_engine.dispose())
+    loop.run_until_complete(engine.dispose())
     loop.close()
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def setup_database():
     """Create tables before each test, drop after."""
+    user_cache.clear()
+    # Pin the revocation sync: a poll landing inside count_queries() would
+    # add a SELECT depending on the wall clock (tested on its own instances)
+    revocation_list.rebuild([], as_of=datetime.now(timezone.utc))
+    revocation_list.sync_interval = float("inf")
+    await bucket_store.reset()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -57,16 +72,15 @@ async def db_session():
         yield session
 
 
-@pytest_asyncio.fixture
-async def token_headers(client: AsyncClient) -> dict:
-    """Register and verify a test user, then return auth headers."""
+async def create_user_headers(client: AsyncClient, role: str = "owner") -> dict:
+    """Register, verify and log in a new user, then return auth headers."""
     unique_id = str(uuid.uuid4())[:8]
     user_data = {
         "email": f"tester_{unique_id}@amarati.com",
         "password": "Password123!",
         "full_name": "Test User",
         "phone": f"+1234567{unique_id}",
-        "role": "owner",
+        "role": role,
     }
     # 1. Register
     reg = await client.post("/api/v1/auth/register", json=user_data)
@@ -92,3 +106,15 @@ async def token_headers(client: AsyncClient) -> dict:
     token = login.json()["access_token"]
     
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def token_headers(client: AsyncClient) -> dict:
+    """Register and verify a test owner, then return auth headers."""
+    return await create_user_headers(client, role="owner")
+
+
+@pytest_asyncio.fixture
+async def admin_headers(client: AsyncClient) -> dict:
+    """Register and verify a test admin, then return auth headers."""
+    return await create_user_headers(client, role="admin")
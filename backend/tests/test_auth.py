@@ -2,8 +2,24 @@
 Authentication endpoint tests.
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.config import get_settings
+from app.core.revocation import RevocationList, revocation_list
+from app.core.security import build_crypt_context
+from app.database import async_session_factory
+from app.models.otp import OTPCode
+from app.models.user import User
+from app.repositories.otp_store import memory_otp_store
+from app.repositories.revocation_repository import RevocationRepository
+from app.services.revocation_service import RevocationService
+from tests.test_query_counts import count_queries
+
+settings = get_settings()
 
 
 # ── Test Data ──────────────────────────────────────────────────
@@ -176,3 +192,137 @@ async def test_health_check(client: AsyncClient):
     response = await client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_access_token(client: AsyncClient, token_headers: dict):
+    """A logged-out access token is rejected even before it expires."""
+    assert (await client.get("/api/v1/auth/me", headers=token_headers)).status_code == 200
+
+    logout = await client.post("/api/v1/auth/logout", headers=token_headers)
+    assert logout.status_code == 200
+
+    response = await client.get("/api/v1/auth/me", headers=token_headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limited_per_email(client: AsyncClient):
+    """Repeated failed logins for one email are rejected with 429."""
+    await client.post("/api/v1/auth/register", json=TEST_USER)
+    credentials = {"email": TEST_USER["email"], "password": "wrongpassword"}
+
+    for _ in range(settings.RATE_LIMIT_EMAIL_BURST):
+        response = await client.post("/api/v1/auth/login", json=credentials)
+        assert response.status_code == 401
+
+    response = await client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_auth_flow_with_memory_otp_store(client: AsyncClient):
+    """Registration and OTP verification work without touching otp_codes."""
+    memory_otp_store._codes.clear()
+    settings.OTP_STORE = "memory"
+    try:
+        await client.post("/api/v1/auth/register", json=TEST_USER)
+        resend = await client.post(
+            "/api/v1/auth/resend-otp", json={"email": TEST_USER["email"]}
+        )
+        otp_code = resend.json()["otp_code"]
+
+        # The first (invalidated) code no longer verifies
+        codes = next(iter(memory_otp_store._codes.values()))
+        assert len(codes) == 2 and codes[0].is_used
+
+        verify = await client.post(
+            "/api/v1/auth/verify-otp",
+            json={"email": TEST_USER["email"], "code": otp_code},
+        )
+        assert verify.status_code == 200
+    finally:
+        settings.OTP_STORE = "sql"
+
+    async with async_session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(OTPCode))
+    assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password_hash(client: AsyncClient):
+    """A hash with a different bcrypt cost is upgraded on successful login."""
+    await client.post("/api/v1/auth/register", json=TEST_USER)
+    old_hash = build_crypt_context(bcrypt_rounds=5).hash(TEST_USER["password"])
+    async with async_session_factory() as session:
+        user = await session.scalar(select(User).where(User.email == TEST_USER["email"]))
+        user.hashed_password = old_hash
+        user.is_verified = True
+        await session.commit()
+
+    login = await client.post(
+        "/api/v1/auth/login",
+        json={"email": TEST_USER["email"], "password": TEST_USER["password"]},
+    )
+    assert login.status_code == 200
+
+    async with async_session_factory() as session:
+        user = await session.scalar(select(User).where(User.email == TEST_USER["email"]))
+    assert user.hashed_password != old_hash
+    assert user.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+
+@pytest.mark.asyncio
+async def test_revocation_reaches_other_workers_within_sync_interval():
+    """A revocation recorded by one worker is enforced by another after a sync."""
+    loaded_at = datetime.now(timezone.utc)
+    worker_a, worker_b = RevocationList(1000, 0.01), RevocationList(1000, 0.01, sync_interval=0)
+    lagging = RevocationList(1000, 0.01, sync_interval=3600)
+    for worker in (worker_a, worker_b, lagging):
+        worker.rebuild([], as_of=loaded_at)
+
+    payload = {"sub": "user-1", "jti": "logged-out", "iat": int(loaded_at.timestamp())}
+    async with async_session_factory() as session:
+        await RevocationRepository(session).revoke_jti(
+            "logged-out", "user-1", loaded_at + timedelta(minutes=30)
+        )
+        await session.commit()
+    worker_a.add_jti("logged-out")
+
+    assert await worker_a.is_revoked(payload)
+    assert await worker_b.is_revoked(payload)
+    assert worker_b.syncs == 1
+    # Within the interval the filter miss is still trusted
+    assert not await lagging.is_revoked(payload)
+
+
+@pytest.mark.asyncio
+async def test_revocation_sync_polls_once_per_interval():
+    """A filter miss polls the table only when the last poll is older than the interval."""
+    worker = RevocationList(1000, 0.01, sync_interval=3600)
+    worker.rebuild([], as_of=datetime.now(timezone.utc))
+    payload = {"sub": "user-3", "jti": "still-valid", "iat": 0}
+
+    with count_queries() as statements:
+        assert not await worker.is_revoked(payload)
+    assert statements == [] and worker.syncs == 0
+
+    worker.sync_interval = 0
+    with count_queries() as statements:
+        assert not await worker.is_revoked(payload)
+    assert len(statements) == 1 and statements[0].lstrip().upper().startswith("SELECT")
+    assert worker.syncs == 1
+
+
+@pytest.mark.asyncio
+async def test_user_revocation_compares_iat_in_whole_seconds():
+    """Tokens issued in the cut-off's second are revoked; later ones are not."""
+    async with async_session_factory() as session:
+        await RevocationService(session).revoke_user("user-2")
+        await session.commit()
+        cutoff = await RevocationRepository(session).get_user_revoked_before("user-2")
+    second = int(cutoff.replace(tzinfo=timezone.utc).timestamp())
+
+    assert await revocation_list.is_revoked({"sub": "user-2", "iat": second})
+    assert not await revocation_list.is_revoked({"sub": "user-2", "iat": second + 1})
@@ -0,0 +1,244 @@
+"""
+Tests for engine configuration, connection pooling and session routing.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import exc, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import get_settings
+from app.core.db_pool import InstrumentedQueuePool, pool_stats, warm_up_pool
+from app.core.statement_cache import compiled_cache_stats
+from app.database import Base, async_session_factory, engine, read_engine, read_router
+from app.models.property import Property
+from app.models.unit import Unit
+from app.models.user import User
+from app.repositories.property_repository import PropertyRepository
+from app.repositories.unit_repository import UnitRepository
+from app.repositories.user_repository import UserRepository
+from app.services import auth_service, user_service
+from tests.conftest import create_user_headers
+from tests.test_query_counts import count_queries
+
+settings = get_settings()
+
+single_writer_only = pytest.mark.skipif(
+    not (settings.is_sqlite and settings.SQLITE_SINGLE_WRITER),
+    reason="SQLite single-writer mode only",
+)
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_sqlite_pragmas_applied():
+    """Both engines open connections in WAL mode with a busy timeout."""
+    for eng in (engine, read_engine):
+        async with eng.connect() as conn:
+            journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+            busy_timeout = (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar()
+        assert journal_mode.lower() == "wal"
+        assert busy_timeout == settings.SQLITE_BUSY_TIMEOUT_MS
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_concurrent_writes_are_serialized(client: AsyncClient):
+    """Concurrent registrations all succeed through the single writer."""
+    async def register(i: int):
+        return await client.post("/api/v1/auth/register", json={
+            "email": f"concurrent_{i}@amarati.com",
+            "password": "Password123!",
+            "full_name": f"User {i}",
+            "phone": f"+1555000{i:04d}",
+            "role": "tenant",
+        })
+
+    responses = await asyncio.gather(*(register(i) for i in range(30)))
+    assert all(r.status_code == 201 for r in responses)
+
+    async with async_session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(User)) == 30
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_password_hashing_runs_without_the_writer(client: AsyncClient, monkeypatch):
+    """
+    Every bcrypt call in the auth flows happens before the request takes
+    the writer, so concurrent logins never queue behind each other's hashing.
+    """
+    writer_held: dict[str, list[int]] = {}
+
+    def recording(name, hasher):
+        async def wrapper(*args):
+            writer_held.setdefault(name, []).append(engine.pool.checkedout())
+            return await hasher(*args)
+        return wrapper
+
+    for module in (auth_service, user_service):
+        for name in ("hash_password_async", "verify_password_async", "verify_and_update_password_async"):
+            if hasattr(module, name):
+                monkeypatch.setattr(module, name, recording(name, getattr(module, name)))
+
+    headers = await create_user_headers(client)  # register + login
+    me = (await client.get("/api/v1/auth/me", headers=headers)).json()
+    response = await client.post(f"/api/v1/users/{me['id']}/change-password", headers=headers, json={
+        "current_password": "Password123!", "new_password": "Changed123!",
+    })
+    assert response.status_code == 200
+    reset = await client.post("/api/v1/auth/request-password-reset", json={"email": me["email"]})
+    response = await client.post("/api/v1/auth/confirm-password-reset", json={
+        "email": me["email"], "code": reset.json()["otp_code"], "new_password": "Reset1234!",
+    })
+    assert response.status_code == 200
+
+    assert set(writer_held) == {
+        "hash_password_async", "verify_password_async", "verify_and_update_password_async",
+    }
+    assert {held for calls in writer_held.values() for held in calls} == {0}
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_get_requests_use_reader_pool(client: AsyncClient, token_headers: dict):
+    """GET endpoints run on the reader engine, not the writer."""
+    writer_checkouts = engine.pool.checkouts
+    reader_checkouts = read_engine.pool.checkouts
+
+    response = await client.get("/api/v1/properties/", headers=token_headers)
+    assert response.status_code == 200
+
+    assert read_engine.pool.checkouts > reader_checkouts
+    assert engine.pool.checkouts == writer_checkouts
+
+
+@pytest_asyncio.fixture
+async def replicas(tmp_path):
+    """Two empty SQLite files configured as read replicas."""
+    read_router.configure([
+        f"sqlite+aiosqlite:///{tmp_path}/replica_{i}.db" for i in range(2)
+    ])
+    for replica in read_router.engines:
+        async with replica.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield read_router
+    read_router.pins.clear()
+    await read_router.dispose()
+
+
+async def _property_names(client: AsyncClient, headers: dict) -> list[str]:
+    response = await client.get("/api/v1/properties/", headers=headers)
+    assert response.status_code == 200
+    return [p["name"] for p in response.json()]
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_reads_go_to_replicas_round_robin(client: AsyncClient, token_headers: dict, replicas):
+    """Without a recent write, GET requests alternate between replicas."""
+    for _ in range(4):
+        await client.get("/api/v1/properties/", headers=token_headers)
+    assert replicas.stats()["replica_reads"] == [2, 2]
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_read_your_writes_pins_user_to_primary(client: AsyncClient, token_headers: dict, replicas):
+    """
+    The replicas are never written to, so seeing the new property proves
+    the read went to the primary.
+    """
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    created = await client.post("/api/v1/properties/", headers=token_headers, json={
+        "name": "Pinned Tower", "address": "1 Olaya Street", "city": "Riyadh", "owner_id": owner_id,
+    })
+    assert created.status_code == 201
+
+    assert await _property_names(client, token_headers) == ["Pinned Tower"]
+    assert replicas.stats()["pinned_reads"] == 1
+
+    # Once the window has passed, reads go back to the (lagging) replica
+    replicas.pins.clear()
+    assert await _property_names(client, token_headers) == []
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_hot_lookups_reuse_compiled_statements():
+    """Repeated email and phone lookups are compiled once, then hit the cache."""
+    async with async_session_factory() as session:
+        lookups = [UserRepository(session).get_by_email, UserRepository(session).get_by_phone]
+        for lookup in lookups:
+            await lookup("warm-up")
+        compiled_cache_stats.reset()
+        for i in range(5):
+            for lookup in lookups:
+                await lookup(f"missing-{i}")
+    assert compiled_cache_stats.hits == 10
+    assert compiled_cache_stats.misses == 0
+
+
+@pytest.mark.asyncio
+@single_writer_only
+async def test_get_by_id_served_from_identity_map():
+    """Primary-key lookups of rows already in the session run no SQL."""
+    async with async_session_factory() as session:
+        owner = User(email="identity@amarati.com", full_name="Identity Owner", hashed_password="x")
+        session.add(owner)
+        await session.flush()
+        building = Property(name="Identity Tower", address="1 Olaya Street", city="Riyadh", owner_id=owner.id)
+        session.add(building)
+        await session.flush()
+        unit = Unit(unit_number="101", property_id=building.id)
+        session.add(unit)
+        await session.flush()
+
+        with count_queries() as statements:
+            assert await UserRepository(session).get_by_id(owner.id) is owner
+            assert await PropertyRepository(session).get_by_id(building.id) is building
+            assert await UnitRepository(session).get_by_id(unit.id) is unit
+        assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_tracks_checkouts(tmp_path):
+    """Pool stats report warm-up connections, checkouts and timeouts."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        assert await warm_up_pool(engine, 2) == 2
+        stats = pool_stats(engine)
+        assert stats["checked_in"] == 2 and stats["checked_out"] == 0
+
+        async with engine.connect(), engine.connect():
+            assert pool_stats(engine)["checked_out"] == 2
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = pool_stats(engine)
+        assert stats["timeouts"] == 1
+        assert stats["checkouts"] == 5
+        assert stats["max_wait_ms"] >= 50
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_metrics_include_db_pool(client: AsyncClient, admin_headers: dict):
+    """The internal metrics endpoint exposes pool statistics."""
+    response = await client.get("/api/v1/internal/metrics", headers=admin_headers)
+    assert response.status_code == 200
+    db_pool = response.json()["db_pool"]
+    assert db_pool["pool_class"] == "InstrumentedQueuePool"
+    assert db_pool["checkouts"] > 0
+    assert "hit_rate" in response.json()["sql_compiled_cache"]
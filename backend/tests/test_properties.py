@@ -4,7 +4,16 @@ Tests for property management endpoints.
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+from app.database import engine
 from app.models.user import UserRole
+from app.tasks.property_search_rebuild import rebuild_property_search
+from tests.test_query_counts import count_queries
+
+settings = get_settings()
 
 @pytest.mark.asyncio
 async def test_create_property(client: AsyncClient, token_headers: dict):
@@ -31,3 +40,290 @@ async def test_list_properties_filter(client: AsyncClient, token_headers: dict):
     response = await client.get("/api/v1/properties/?city=Riyadh", headers=token_headers)
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+async def create_properties(client: AsyncClient, headers: dict, count: int) -> list[str]:
+    """Create `count` properties owned by the current user; returns their IDs."""
+    owner_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+    ids = []
+    for i in range(count):
+        response = await client.post("/api/v1/properties/", headers=headers, json={
+            "name": f"Building {i}",
+            "address": f"{i} King Fahd Road",
+            "city": "Riyadh",
+            "owner_id": owner_id,
+        })
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_list_properties_cursor_pagination(client: AsyncClient, token_headers: dict):
+    """Cursor pages cover every property once, newest first."""
+    ids = await create_properties(client, token_headers, 5)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/properties/", headers=token_headers, params=params)
+        assert response.status_code == 200
+        seen += [p["id"] for p in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == list(reversed(ids))
+
+    # Offset mode still works and agrees with the cursor order
+    response = await client.get(
+        "/api/v1/properties/", headers=token_headers, params={"skip": 2, "limit": 2}
+    )
+    assert [p["id"] for p in response.json()] == seen[2:4]
+
+
+@pytest.mark.asyncio
+async def test_list_properties_invalid_cursor(client: AsyncClient, token_headers: dict):
+    """A malformed cursor is rejected with 400."""
+    response = await client.get(
+        "/api/v1/properties/", headers=token_headers, params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_properties_total_in_one_query(client: AsyncClient, token_headers: dict):
+    """include_total returns X-Total-Count for offset and cursor pages in one query."""
+    await create_properties(client, token_headers, 5)
+    params = {"limit": 2, "include_total": "true"}
+
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if "FROM properties" in statement:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    try:
+        first = await client.get("/api/v1/properties/", headers=token_headers, params=params)
+        second = await client.get(
+            "/api/v1/properties/",
+            headers=token_headers,
+            params={**params, "cursor": first.headers["X-Next-Cursor"]},
+        )
+    finally:
+        event.remove(Engine, "before_cursor_execute", capture)
+
+    assert first.headers["X-Total-Count"] == "5"
+    assert second.headers["X-Total-Count"] == "5"
+    assert len(second.json()) == 2
+    assert len(statements) == 2
+
+    # Past the last page there is no row to carry the total
+    empty = await client.get(
+        "/api/v1/properties/", headers=token_headers, params={**params, "skip": 10}
+    )
+    assert empty.json() == [] and empty.headers["X-Total-Count"] == "5"
+
+    # Totals are opt-in
+    plain = await client.get("/api/v1/properties/", headers=token_headers)
+    assert "X-Total-Count" not in plain.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page_size", [1, 5])
+async def test_list_properties_include_units(client: AsyncClient, token_headers: dict, page_size: int):
+    """include=units nests units with exactly two queries, whatever the page size."""
+    ids = await create_properties(client, token_headers, 5)
+    for property_id in ids:
+        for number in ("101", "102"):
+            await client.post("/api/v1/units/", headers=token_headers, json={
+                "unit_number": number, "property_id": property_id,
+            })
+    # Cache the authenticated user so only the listing itself is counted
+    await client.get("/api/v1/properties/", headers=token_headers, params={"limit": 1})
+
+    with count_queries() as statements:
+        response = await client.get(
+            "/api/v1/properties/",
+            headers=token_headers,
+            params={"limit": page_size, "include": "units", "include_total": "true"},
+        )
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == page_size
+    assert all([u["unit_number"] for u in p["units"]] == ["101", "102"] for p in body)
+    assert len(statements) == 2, statements
+
+    plain = await client.get("/api/v1/properties/", headers=token_headers)
+    assert all(p["units"] is None for p in plain.json())
+
+
+@pytest.mark.asyncio
+async def test_get_property_include_units(client: AsyncClient, token_headers: dict):
+    [property_id] = await create_properties(client, token_headers, 1)
+    await client.post("/api/v1/units/", headers=token_headers, json={
+        "unit_number": "101", "property_id": property_id,
+    })
+
+    response = await client.get(
+        f"/api/v1/properties/{property_id}", headers=token_headers, params={"include": "units"}
+    )
+    assert response.status_code == 200
+    assert [u["unit_number"] for u in response.json()["units"]] == ["101"]
+
+    unknown = await client.get(
+        f"/api/v1/properties/{property_id}", headers=token_headers, params={"include": "owner"}
+    )
+    assert unknown.status_code == 400
+
+
+async def _create_property(client: AsyncClient, headers: dict, owner_id: str, **fields) -> str:
+    response = await client.post("/api/v1/properties/", headers=headers, json={
+        "address": "1 King Fahd Road", "city": "Riyadh", "owner_id": owner_id, **fields,
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_list_properties_type_filter(client: AsyncClient, token_headers: dict):
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    await _create_property(client, token_headers, owner_id, name="Home", type="residential")
+    shop_id = await _create_property(client, token_headers, owner_id, name="Shop", type="commercial")
+
+    response = await client.get("/api/v1/properties/", headers=token_headers, params={"type": "commercial"})
+    assert [p["id"] for p in response.json()] == [shop_id]
+
+    invalid = await client.get("/api/v1/properties/", headers=token_headers, params={"type": "castle"})
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_properties_full_text_search(client: AsyncClient, token_headers: dict):
+    """Search matches word prefixes across fields, best (name) matches first."""
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    in_name = await _create_property(client, token_headers, owner_id, name="Olaya Towers")
+    in_description = await _create_property(
+        client, token_headers, owner_id, name="Palm Court", description="Near Olaya park",
+    )
+    await _create_property(client, token_headers, owner_id, name="Desert Villas", city="Jeddah")
+
+    async def search(query: str, **params) -> list[str]:
+        response = await client.get(
+            "/api/v1/properties/", headers=token_headers, params={"search": query, **params}
+        )
+        assert response.status_code == 200
+        return [p["id"] for p in response.json()]
+
+    assert await search("olay") == [in_name, in_description]
+    assert await search("olay", include_total="true", limit=1) == [in_name]
+    assert await search("olaya park") == [in_description]
+    assert len(await search("jedd")) == 1
+    assert await search('"(*') == await search("")  # no words: search is ignored
+
+    # The index follows updates and deletes
+    await client.put(f"/api/v1/properties/{in_name}", headers=token_headers, json={"name": "Kingdom Tower"})
+    assert await search("olaya") == [in_description]
+    assert await search("kingdom") == [in_name]
+    await client.delete(f"/api/v1/properties/{in_description}", headers=token_headers)
+    assert await search("olaya") == []
+
+    # Ranked results are paged by offset only
+    cursor = await client.get(
+        "/api/v1/properties/", headers=token_headers, params={"search": "tower", "cursor": "abc"}
+    )
+    assert cursor.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not settings.is_sqlite, reason="SQLite FTS5 index only")
+async def test_full_text_search_survives_vacuum_and_rebuild(client: AsyncClient, token_headers: dict):
+    """
+    The index is keyed on search_rowid, so VACUUM renumbering rowids leaves
+    it correct; the rebuild task restores dropped triggers and reindexes.
+    """
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    first = await _create_property(client, token_headers, owner_id, name="Olaya Towers")
+    second = await _create_property(client, token_headers, owner_id, name="Palm Court")
+    await client.delete(f"/api/v1/properties/{first}", headers=token_headers)
+
+    async def search(query: str) -> list[str]:
+        response = await client.get("/api/v1/properties/", headers=token_headers, params={"search": query})
+        return [p["id"] for p in response.json()]
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("VACUUM")
+    assert await search("palm") == [second]
+    assert await search("olaya") == []
+
+    # As after a table-recreating migration: writes go unindexed
+    async with engine.begin() as conn:
+        for trigger in ("properties_fts_ai", "properties_fts_ad", "properties_fts_au"):
+            await conn.exec_driver_sql(f"DROP TRIGGER {trigger}")
+    third = await _create_property(client, token_headers, owner_id, name="Desert Villas")
+    assert await search("desert") == []
+
+    assert await rebuild_property_search()
+    assert await search("desert") == [third]
+    await client.put(f"/api/v1/properties/{third}", headers=token_headers, json={"name": "Kingdom Tower"})
+    assert await search("desert") == []
+    assert await search("kingdom") == [third]
+
+
+@pytest.mark.asyncio
+async def test_list_properties_near(client: AsyncClient, token_headers: dict):
+    """`near` keeps properties within the radius, nearest first, with distances."""
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    kingdom = await _create_property(
+        client, token_headers, owner_id, name="Kingdom Centre", latitude=24.7114, longitude=46.6744,
+    )
+    faisaliah = await _create_property(
+        client, token_headers, owner_id, name="Al Faisaliah", latitude=24.6906, longitude=46.6853,
+    )
+    await _create_property(client, token_headers, owner_id, name="Jeddah Tower", latitude=21.7346, longitude=39.0863)
+    await _create_property(client, token_headers, owner_id, name="No Location")
+    # Either side of the antimeridian
+    taveuni = await _create_property(
+        client, token_headers, owner_id, name="Taveuni East", latitude=-16.80, longitude=179.99,
+    )
+    west = await _create_property(
+        client, token_headers, owner_id, name="Taveuni West", latitude=-16.80, longitude=-179.99,
+    )
+
+    async def near(point: str, **params) -> list[dict]:
+        response = await client.get(
+            "/api/v1/properties/", headers=token_headers, params={"near": point, **params}
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    results = await near("24.7136,46.6753", radius_km=5)
+    assert [p["id"] for p in results] == [kingdom, faisaliah]
+    assert results[0]["distance_km"] == pytest.approx(0.26, abs=0.01)
+    assert results[1]["distance_km"] == pytest.approx(2.75, abs=0.01)
+    assert [p["id"] for p in await near("24.7136,46.6753", radius_km=1)] == [kingdom]
+    assert [p["id"] for p in await near("-16.80,-179.999", radius_km=5)] == [west, taveuni]
+    unfiltered = await client.get("/api/v1/properties/", headers=token_headers)
+    assert unfiltered.json()[0]["distance_km"] is None
+
+    # Moving a property moves it in and out of results
+    await client.put(f"/api/v1/properties/{faisaliah}", headers=token_headers,
+                     json={"latitude": 21.7, "longitude": 39.1})
+    assert [p["id"] for p in await near("24.7136,46.6753")] == [kingdom]
+    await client.put(f"/api/v1/properties/{kingdom}", headers=token_headers,
+                     json={"latitude": None, "longitude": None})
+    assert await near("24.7136,46.6753") == []
+
+    for bad in ["24.7", "north,east", "95,46"]:
+        response = await client.get("/api/v1/properties/", headers=token_headers, params={"near": bad})
+        assert response.status_code == 400
+    too_far = await client.get(
+        "/api/v1/properties/", headers=token_headers, params={"near": "24.7,46.6", "radius_km": 5000}
+    )
+    assert too_far.status_code == 422
+    half = await client.post("/api/v1/properties/", headers=token_headers, json={
+        "name": "Half", "address": "1 King Fahd Road", "city": "Riyadh", "owner_id": owner_id, "latitude": 24.7,
+    })
+    assert half.status_code == 422
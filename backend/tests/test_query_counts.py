@@ -0,0 +1,120 @@
+"""
+Query-count regression tests: each write endpoint commits once and never
+re-selects rows it has just written.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from tests.conftest import create_user_headers
+
+
+@contextmanager
+def count_queries():
+    """Record the SQL statements sent by any engine (PRAGMAs excluded)."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        if not statement.lstrip().upper().startswith("PRAGMA"):
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def _verbs(statements: list[str]) -> list[str]:
+    return [s.split()[0].upper() for s in statements]
+
+
+REGISTER = {
+    "email": "counted@amarati.com",
+    "password": "Password123!",
+    "full_name": "Counted User",
+    "phone": "+966500000001",
+    "role": "owner",
+}
+
+
+@pytest.mark.asyncio
+async def test_register_query_count(client: AsyncClient):
+    with count_queries() as statements:
+        response = await client.post("/api/v1/auth/register", json=REGISTER)
+    assert response.status_code == 201
+    # email check, phone check, user + OTP + outbox inserts
+    assert _verbs(statements) == ["SELECT", "SELECT", "INSERT", "INSERT", "INSERT"], statements
+
+
+@pytest.mark.asyncio
+async def test_verify_otp_query_count(client: AsyncClient):
+    await client.post("/api/v1/auth/register", json=REGISTER)
+    resend = await client.post("/api/v1/auth/resend-otp", json={"email": REGISTER["email"]})
+    code = resend.json()["otp_code"]
+
+    with count_queries() as statements:
+        response = await client.post(
+            "/api/v1/auth/verify-otp", json={"email": REGISTER["email"], "code": code}
+        )
+    assert response.status_code == 200
+    # user lookup, latest OTP, then one UPDATE each for the OTP and the user
+    assert _verbs(statements) == ["SELECT", "SELECT", "UPDATE", "UPDATE"], statements
+
+
+@pytest.mark.asyncio
+async def test_property_and_unit_write_query_counts(client: AsyncClient):
+    headers = await create_user_headers(client, role="owner")
+    owner_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+
+    with count_queries() as statements:
+        created = await client.post("/api/v1/properties/", headers=headers, json={
+            "name": "Counted Tower",
+            "address": "1 Olaya Street",
+            "city": "Riyadh",
+            "owner_id": owner_id,
+        })
+    assert created.status_code == 201
+    # the property, then the owner's portfolio rollup upsert
+    assert _verbs(statements) == ["INSERT", "INSERT"], statements
+    property_id = created.json()["id"]
+
+    with count_queries() as statements:
+        updated = await client.put(
+            f"/api/v1/properties/{property_id}", headers=headers, json={"name": "Renamed"}
+        )
+    assert updated.status_code == 200 and updated.json()["name"] == "Renamed"
+    assert _verbs(statements) == ["SELECT", "UPDATE"], statements
+
+    with count_queries() as statements:
+        unit = await client.post("/api/v1/units/", headers=headers, json={
+            "unit_number": "101", "property_id": property_id,
+        })
+    assert unit.status_code == 201
+    # property counter bump (also the existence check), portfolio bump, insert
+    assert _verbs(statements) == ["UPDATE", "UPDATE", "INSERT"], statements
+    unit_id = unit.json()["id"]
+
+    with count_queries() as statements:
+        updated = await client.put(
+            f"/api/v1/units/{unit_id}", headers=headers, json={"status": "occupied"}
+        )
+    assert updated.status_code == 200 and updated.json()["status"] == "occupied"
+    # status change moves the unit between property and portfolio counters
+    assert _verbs(statements) == ["SELECT", "UPDATE", "UPDATE", "UPDATE"], statements
+
+    with count_queries() as statements:
+        updated = await client.put(
+            f"/api/v1/units/{unit_id}", headers=headers, json={"bedrooms": 3}
+        )
+    assert updated.status_code == 200
+    assert _verbs(statements) == ["SELECT", "UPDATE"], statements
+
+    with count_queries() as statements:
+        deleted = await client.delete(f"/api/v1/units/{unit_id}", headers=headers)
+    assert deleted.status_code == 204
+    assert _verbs(statements) == ["SELECT", "UPDATE", "UPDATE", "DELETE"], statements
@@ -0,0 +1,154 @@
+"""
+Query-plan checks: list queries must be served by an index, not a table scan.
+
+Each test runs a repository method, captures the SQL it sends and asks
+SQLite for the plan with EXPLAIN QUERY PLAN.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.database import async_session_factory, engine
+from app.repositories.property_repository import PropertyRepository
+from app.repositories.unit_repository import UnitRepository
+from app.schemas.unit import UnitSearchFilters
+from app.utils.pagination import encode_cursor
+
+settings = get_settings()
+
+pytestmark = pytest.mark.skipif(not settings.is_sqlite, reason="SQLite query plans only")
+
+
+@asynccontextmanager
+async def captured_statements():
+    """Collect (statement, parameters) for every query sent to the engine."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def query_plan(statement: str, parameters) -> str:
+    async with engine.connect() as conn:
+        rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return " | ".join(row[-1] for row in rows)
+
+
+async def assert_uses_index(statements, table: str, *indexes: str):
+    assert statements, "no query captured"
+    for statement, parameters in statements:
+        plan = await query_plan(statement, parameters)
+        # "SEARCH <table> USING INDEX ..." is an index lookup; "SCAN" is not
+        assert f"SEARCH {table} USING" in plan, plan
+        assert any(index in plan for index in indexes), plan
+
+
+async def assert_sorted_by_index(statements):
+    """The (created_at, id) ordering comes from the index, not a sort step."""
+    for statement, parameters in statements:
+        plan = await query_plan(statement, parameters)
+        assert "TEMP B-TREE" not in plan, plan
+
+
+CURSOR = encode_cursor(datetime(2026, 1, 1), "id")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters, indexes", [
+    ({"owner_id": "o"}, ["ix_properties_owner_id_created_at_id"]),
+    ({"owner_id": "o", "cursor": CURSOR}, ["ix_properties_owner_id_created_at_id"]),
+    ({"owner_id": "o", "city": "Riyadh"},
+     ["ix_properties_owner_id_city", "ix_properties_owner_id_created_at_id"]),
+    ({"supervisor_id": "s"}, ["ix_properties_supervisor_id"]),
+    ({"city": "Riyadh"}, ["ix_properties_city"]),
+    ({"cursor": CURSOR}, ["ix_properties_created_at_id"]),
+])
+async def test_property_list_uses_index(filters: dict, indexes: list[str]):
+    async with async_session_factory() as session, captured_statements() as statements:
+        await PropertyRepository(session).get_multi(**filters)
+    await assert_uses_index(statements, "properties", *indexes)
+
+
+@pytest.mark.asyncio
+async def test_property_list_is_sorted_by_index():
+    async with async_session_factory() as session, captured_statements() as statements:
+        repo = PropertyRepository(session)
+        await repo.get_multi()
+        await repo.get_multi(owner_id="o")
+        await repo.get_multi(owner_id="o", cursor=CURSOR)
+    await assert_sorted_by_index(statements)
+
+
+@pytest.mark.asyncio
+async def test_property_count_uses_index():
+    async with async_session_factory() as session, captured_statements() as statements:
+        await PropertyRepository(session).count(owner_id="o")
+    await assert_uses_index(
+        statements, "properties",
+        "ix_properties_owner_id_city", "ix_properties_owner_id_created_at_id",
+    )
+
+
+@pytest.mark.asyncio
+async def test_unit_list_uses_index():
+    async with async_session_factory() as session, captured_statements() as statements:
+        repo = UnitRepository(session)
+        await repo.get_multi_by_property("p")
+        await repo.get_multi_by_property("p", cursor=CURSOR)
+    await assert_uses_index(statements, "units", "ix_units_property_id_created_at_id")
+    await assert_sorted_by_index(statements)
+
+
+@pytest.mark.asyncio
+async def test_unit_count_uses_index():
+    async with async_session_factory() as session, captured_statements() as statements:
+        await UnitRepository(session).count_by_property("p")
+    await assert_uses_index(
+        statements, "units",
+        "ix_units_property_id_status", "ix_units_property_id_created_at_id",
+    )
+
+
+@pytest.mark.asyncio
+async def test_property_search_uses_fts_index():
+    """Search is answered by the FTS5 index, then rows are fetched by search key."""
+    async with async_session_factory() as session, captured_statements() as statements:
+        await PropertyRepository(session).get_multi(search="olaya tower", owner_id="o")
+    assert statements
+    for statement, parameters in statements:
+        plan = await query_plan(statement, parameters)
+        assert "SCAN properties_fts VIRTUAL TABLE INDEX" in plan, plan
+        assert "SEARCH properties USING INDEX ix_properties_search_rowid" in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_property_near_uses_geohash_index():
+    async with async_session_factory() as session, captured_statements() as statements:
+        await PropertyRepository(session).get_multi(near=(24.7136, 46.6753), radius_km=5)
+    await assert_uses_index(statements, "properties", "ix_properties_geohash")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters, table, indexes", [
+    ({"status": "vacant", "min_bedrooms": 2}, "units", ["ix_units_status_bedrooms_rent_amount"]),
+    ({"min_rent": 3000, "max_rent": 5000}, "units", ["ix_units_rent_amount"]),
+    ({"city": "Riyadh"}, "properties", ["ix_properties_city"]),
+])
+async def test_unit_search_uses_index(filters: dict, table: str, indexes: list[str]):
+    repo_filters = UnitSearchFilters(**filters)
+    async with async_session_factory() as session, captured_statements() as statements:
+        repo = UnitRepository(session)
+        await repo.search(repo_filters)
+        await repo.facet_counts(repo_filters, settings.UNIT_SEARCH_RENT_BUCKETS)
+    await assert_uses_index(statements, table, *indexes)
@@ -0,0 +1,158 @@
+"""
+Tests for password hashing and token utilities.
+"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+from starlette.requests import Request
+
+from app.config import get_settings
+from app.core.hashing_pool import HashingPool, hashing_pool
+from app.core.rate_limit import SQLiteBucketStore, client_ip
+from app.core.security import (
+    build_crypt_context,
+    create_access_token,
+    hash_password_async,
+    token_cache,
+    verify_access_token,
+    verify_password_async,
+)
+from app.core.user_cache import user_cache
+from app.utils.bloom import BloomFilter
+
+settings = get_settings()
+
+
+@pytest.mark.asyncio
+async def test_async_hashing_round_trip():
+    """Async hash/verify helpers agree with each other."""
+    hashed = await hash_password_async("Password123!")
+    assert await verify_password_async("Password123!", hashed)
+    assert not await verify_password_async("wrong-password", hashed)
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    """Other coroutines keep running while passwords are hashed."""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    # Use a realistic cost; the suite itself runs with the cheapest one
+    context = build_crypt_context(bcrypt_rounds=10)
+    task = asyncio.create_task(ticker())
+    await asyncio.gather(*(hashing_pool.run(context.hash, "Password123!") for _ in range(4)))
+    done.set()
+    await task
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_caps_concurrency():
+    """The pool never runs more jobs than its concurrency cap."""
+    pool = HashingPool(max_workers=4, max_concurrency=2)
+    peak = 0
+
+    def job():
+        nonlocal peak
+        peak = max(peak, pool.in_flight)
+        return True
+
+    results = await asyncio.gather(*(pool.run(job) for _ in range(8)))
+    pool.shutdown()
+
+    assert all(results)
+    assert peak <= 2
+    stats = pool.stats()
+    assert stats["completed"] == 8
+    assert stats["waiting"] == 0
+
+
+def test_verified_token_cache():
+    """Verified payloads are cached; invalid tokens are never cached."""
+    token_cache.clear()
+    token = create_access_token({"sub": "user-1", "role": "owner"})
+
+    assert verify_access_token(token)["sub"] == "user-1"
+    assert verify_access_token(token)["sub"] == "user-1"
+    assert token_cache.hits == 1
+
+    assert verify_access_token(token + "x") is None
+    assert len(token_cache) == 1
+
+
+def test_expired_token_not_cached():
+    """Tokens past their exp are rejected and not cached."""
+    token_cache.clear()
+    token = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-1))
+    assert verify_access_token(token) is None
+    assert len(token_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_role_check_from_token_claim(client: AsyncClient, token_headers: dict):
+    """Claims-only RBAC authorizes without loading the user row."""
+    settings.RBAC_TRUST_TOKEN_ROLE = True
+    user_cache.clear()
+    try:
+        response = await client.get("/api/v1/internal/metrics", headers=token_headers)
+    finally:
+        settings.RBAC_TRUST_TOKEN_ROLE = False
+
+    assert response.status_code == 403
+    assert "owner" in response.json()["detail"]
+    assert user_cache.hits + user_cache.misses == 0
+
+
+def test_bloom_filter_membership():
+    """Bloom filter has no false negatives and few false positives."""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti:{i}")
+
+    assert all(f"jti:{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other:{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bucket_store(tmp_path):
+    """The shared SQLite store enforces the bucket like the memory store."""
+    store = SQLiteBucketStore(str(tmp_path / "buckets.db"))
+    results = [await store.consume("login:ip:1.2.3.4", 3, 0.01) for _ in range(4)]
+
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert results[3] > 0
+    assert await store.consume("login:ip:5.6.7.8", 3, 0.01) == 0.0
+
+
+def _request(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "client": (peer, 40000), "headers": headers})
+
+
+def test_client_ip_trusts_forwarded_for_only_from_proxies():
+    """X-Forwarded-For is read right to left, and only behind a trusted proxy."""
+    # Without trusted proxies the header is ignored
+    assert client_ip(_request("10.0.0.5", "198.51.100.7")) == "10.0.0.5"
+
+    settings.TRUSTED_PROXIES = ["10.0.0.0/24", "192.0.2.1"]
+    try:
+        assert client_ip(_request("10.0.0.5", "198.51.100.7")) == "198.51.100.7"
+        # Client-supplied entries left of the first untrusted hop are ignored
+        assert client_ip(_request("10.0.0.5", "1.1.1.1, 198.51.100.7, 192.0.2.1")) == "198.51.100.7"
+        # A direct, untrusted peer cannot spoof its address
+        assert client_ip(_request("203.0.113.9", "198.51.100.7")) == "203.0.113.9"
+        assert client_ip(_request("10.0.0.5")) == "10.0.0.5"
+    finally:
+        settings.TRUSTED_PROXIES = []
+
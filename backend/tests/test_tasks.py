@@ -0,0 +1,189 @@
+"""
+Tests for background jobs.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.database import async_session_factory, engine
+from app.models.otp import OTPCode
+from app.models.outbox import OutboxMessage
+from app.models.user import User
+from app.services.notification_sender import NotificationSender
+from app.tasks.otp_purge import purge_otps
+from app.tasks.outbox_cleanup import clean_outbox
+from app.tasks.outbox_worker import drain_outbox
+
+settings = get_settings()
+
+
+async def _create_user(session) -> User:
+    user = User(
+        email="purge@amarati.com",
+        full_name="Purge User",
+        hashed_password="not-a-real-hash",
+    )
+    session.add(user)
+    await session.flush()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_purge_otps_in_batches():
+    """Old expired/used codes are purged in batches; recent ones are kept."""
+    now = datetime.now(timezone.utc)
+    async with async_session_factory() as session:
+        user = await _create_user(session)
+        old = now - timedelta(hours=3)
+        for i in range(5):
+            session.add(OTPCode(user_id=user.id, code=f"{i:06d}", expires_at=old, created_at=old))
+        session.add(OTPCode(
+            user_id=user.id, code="111111", is_used=True,
+            expires_at=now + timedelta(minutes=5), created_at=old,
+        ))
+        session.add(OTPCode(user_id=user.id, code="222222", expires_at=now + timedelta(minutes=5)))
+        await session.commit()
+
+    purged = await purge_otps(retention_minutes=60, batch_size=2)
+    assert purged == 6
+
+    async with async_session_factory() as session:
+        remaining = await session.scalars(select(OTPCode.code))
+        assert list(remaining) == ["222222"]
+
+
+class RecordingSender(NotificationSender):
+    """Test sender that records deliveries or fails on demand."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.delivered: list[str] = []
+
+    async def send(self, message: OutboxMessage) -> None:
+        if self.fail:
+            raise ConnectionError("provider unavailable")
+        self.delivered.append(message.recipient)
+
+
+@pytest.mark.asyncio
+async def test_register_queues_otp_in_outbox(client: AsyncClient):
+    """Registration writes the OTP message to the outbox; the worker sends it."""
+    response = await client.post("/api/v1/auth/register", json={
+        "email": "outbox@amarati.com",
+        "password": "Password123!",
+        "full_name": "Outbox User",
+    })
+    assert response.status_code == 201
+
+    sender = RecordingSender()
+    assert await drain_outbox(sender=sender) == 1
+    assert sender.delivered == ["outbox@amarati.com"]
+
+    async with async_session_factory() as session:
+        message = await session.scalar(select(OutboxMessage))
+    assert message.status == "sent"
+    assert message.attempts == 1
+    assert message.body == ""  # the OTP is not kept once delivered
+
+
+@pytest.mark.asyncio
+async def test_outbox_retries_with_backoff():
+    """Failed deliveries are rescheduled, then marked failed after max attempts."""
+    async with async_session_factory() as session:
+        session.add(OutboxMessage(recipient="retry@amarati.com", body="code 123456"))
+        await session.commit()
+
+    assert await drain_outbox(sender=RecordingSender(fail=True)) == 0
+    async with async_session_factory() as session:
+        message = await session.scalar(select(OutboxMessage))
+        assert message.status == "pending"
+        assert message.attempts == 1
+        assert "provider unavailable" in message.last_error
+        assert message.body == "code 123456"  # kept for the retry
+        next_attempt = message.next_attempt_at.replace(tzinfo=timezone.utc)
+        assert next_attempt > datetime.now(timezone.utc)
+
+        # Exhaust the remaining attempts
+        message.attempts = settings.OUTBOX_MAX_ATTEMPTS - 1
+        message.next_attempt_at = datetime.now(timezone.utc)
+        await session.commit()
+
+    await drain_outbox(sender=RecordingSender(fail=True))
+    async with async_session_factory() as session:
+        message = await session.scalar(select(OutboxMessage))
+    assert message.status == "failed"
+    assert message.body == ""
+
+
+class SlowSender(RecordingSender):
+    """Records whether a database connection was held while sending."""
+
+    def __init__(self):
+        super().__init__()
+        self.connections_held = []
+
+    async def send(self, message: OutboxMessage) -> None:
+        self.connections_held.append(engine.pool.checkedout())
+        await asyncio.sleep(0.05)
+        await super().send(message)
+
+
+
+async def _queue_messages(count: int) -> None:
+    async with async_session_factory() as session:
+        session.add_all(
+            OutboxMessage(recipient=f"lease{i}@amarati.com", body="hello")
+            for i in range(count)
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_outbox_sends_with_no_session_open():
+    """The claiming transaction is committed before any message is sent."""
+    await _queue_messages(3)
+    sender = SlowSender()
+
+    assert await drain_outbox(sender=sender, batch_size=2) == 3
+    assert sender.connections_held == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_outbox_workers_send_each_message_once():
+    """Leased rows are skipped by other workers until their outcome is recorded."""
+    await _queue_messages(6)
+    sender = SlowSender()
+    sent = await asyncio.gather(
+        drain_outbox(sender=sender, batch_size=2),
+        drain_outbox(sender=sender, batch_size=2),
+    )
+
+    assert sum(sent) == 6
+    assert sorted(sender.delivered) == sorted(f"lease{i}@amarati.com" for i in range(6))
+    async with async_session_factory() as session:
+        messages = (await session.scalars(select(OutboxMessage))).all()
+    assert {(m.status, m.attempts, m.lease_id) for m in messages} == {("sent", 1, None)}
+
+
+@pytest.mark.asyncio
+async def test_clean_outbox_in_batches():
+    """Finished messages past the retention window are deleted; others are kept."""
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(hours=48)
+    async with async_session_factory() as session:
+        for status in ("sent", "sent", "failed"):
+            session.add(OutboxMessage(recipient=f"{status}@amarati.com", body="", status=status, next_attempt_at=old))
+        session.add(OutboxMessage(recipient="recent@amarati.com", body="", status="sent", next_attempt_at=now))
+        session.add(OutboxMessage(recipient="pending@amarati.com", body="code", next_attempt_at=old))
+        await session.commit()
+
+    assert await clean_outbox(retention_hours=24, batch_size=2) == 3
+
+    async with async_session_factory() as session:
+        remaining = await session.scalars(select(OutboxMessage.recipient))
+        assert sorted(remaining) == ["pending@amarati.com", "recent@amarati.com"]
@@ -0,0 +1,433 @@
+"""
+Tests for unit endpoints, including bulk operations.
+"""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from app.models.portfolio import PortfolioRollup
+from app.models.property import Property
+from app.repositories.portfolio_repository import PortfolioRepository
+from app.repositories.property_repository import PropertyRepository
+from app.repositories.unit_repository import UnitRepository
+from app.tasks.portfolio_rollup_rebuild import rebuild_portfolio_rollups
+from app.tasks.unit_counter_reconcile import reconcile_unit_counters
+from tests.test_properties import create_properties
+from tests.test_query_counts import count_queries
+
+
+async def _bulk_create(client: AsyncClient, headers: dict, property_id: str, count: int) -> list[str]:
+    response = await client.post("/api/v1/units/bulk", headers=headers, json={
+        "items": [
+            {"unit_number": str(100 + i), "property_id": property_id, "bedrooms": 2}
+            for i in range(count)
+        ],
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["failed"] == 0
+    return [r["id"] for r in body["results"]]
+
+
+async def _counters(client: AsyncClient, headers: dict, property_id: str) -> tuple[int, int, int, int]:
+    body = (await client.get(f"/api/v1/properties/{property_id}", headers=headers)).json()
+    return (
+        body["total_units"], body["occupied_units"],
+        body["vacant_units"], body["maintenance_units"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_unit_writes_maintain_property_counters(client: AsyncClient, token_headers: dict):
+    """Create, status change and delete keep the property's counters in step."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    created = [
+        (await client.post("/api/v1/units/", headers=token_headers, json={
+            "unit_number": str(i), "property_id": property_id, "status": status,
+        })).json()["id"]
+        for i, status in enumerate(["vacant", "vacant", "occupied"])
+    ]
+    assert await _counters(client, token_headers, property_id) == (3, 1, 2, 0)
+
+    await client.put(f"/api/v1/units/{created[0]}", headers=token_headers, json={"status": "maintenance"})
+    await client.put(f"/api/v1/units/{created[1]}", headers=token_headers, json={"bedrooms": 2})
+    assert await _counters(client, token_headers, property_id) == (3, 1, 1, 1)
+
+    await client.delete(f"/api/v1/units/{created[2]}", headers=token_headers)
+    assert await _counters(client, token_headers, property_id) == (2, 0, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_unit_writes_count_once(client: AsyncClient, token_headers: dict):
+    """Concurrent writes to one unit move it between counters exactly once."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    kept, deleted = await _bulk_create(client, token_headers, property_id, 2)
+
+    updates = await asyncio.gather(*(
+        client.put(f"/api/v1/units/{kept}", headers=token_headers, json={
+            "status": "occupied", "rent_amount": 1000,
+        })
+        for _ in range(3)
+    ))
+    deletes = await asyncio.gather(*(
+        client.delete(f"/api/v1/units/{deleted}", headers=token_headers) for _ in range(2)
+    ))
+
+    assert [r.status_code for r in updates] == [200, 200, 200]
+    assert sorted(r.status_code for r in deletes) == [204, 404]
+    assert await _counters(client, token_headers, property_id) == (1, 1, 0, 0)
+    body = (await client.get(f"/api/v1/properties/{property_id}", headers=token_headers)).json()
+    assert float(body["rent_roll"]) == 1000
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bulk_writes_count_once(client: AsyncClient, token_headers: dict):
+    """Overlapping bulk updates and deletes change each unit's counters once."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    ids = await _bulk_create(client, token_headers, property_id, 4)
+
+    updates = await asyncio.gather(*(
+        client.put("/api/v1/units/bulk", headers=token_headers, json={
+            "items": [{"id": unit_id, "status": "maintenance"} for unit_id in ids[:2]],
+        })
+        for _ in range(2)
+    ))
+    deletes = await asyncio.gather(*(
+        client.request("DELETE", "/api/v1/units/bulk", headers=token_headers, json={"ids": ids[2:]})
+        for _ in range(2)
+    ))
+
+    assert [r.json()["succeeded"] for r in updates] == [2, 2]
+    assert sorted(r.json()["succeeded"] for r in deletes) == [0, 2]
+    assert await _counters(client, token_headers, property_id) == (2, 0, 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_unit_writes_lock_rows_before_counting(db_session):
+    """Deltas come from rows locked FOR UPDATE, so concurrent writers see each other."""
+    rendered = _postgres_sql(db_session)
+    await UnitRepository(db_session).get_states(["b", "a"], for_update=True)
+    await db_session.rollback()
+
+    assert rendered[0].endswith("ORDER BY units.id FOR UPDATE")
+
+
+@pytest.mark.asyncio
+async def test_create_unit_for_missing_property(client: AsyncClient, token_headers: dict):
+    response = await client.post("/api/v1/units/", headers=token_headers, json={
+        "unit_number": "1", "property_id": "missing-property",
+    })
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_writes_maintain_property_counters(client: AsyncClient, token_headers: dict):
+    """Bulk create, update and delete adjust counters per property."""
+    first, second = await create_properties(client, token_headers, 2)
+    ids = await _bulk_create(client, token_headers, first, 3) + await _bulk_create(
+        client, token_headers, second, 2
+    )
+    await client.put("/api/v1/units/bulk", headers=token_headers, json={"items": [
+        {"id": ids[0], "status": "occupied"},
+        {"id": ids[3], "status": "occupied"},
+        {"id": ids[4], "status": "maintenance"},
+    ]})
+    await client.request("DELETE", "/api/v1/units/bulk", headers=token_headers, json={"ids": [ids[1]]})
+
+    assert await _counters(client, token_headers, first) == (2, 1, 1, 0)
+    assert await _counters(client, token_headers, second) == (2, 1, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_drifted_counters(client: AsyncClient, token_headers: dict, db_session):
+    """The reconciliation job recounts units and fixes only drifted rows."""
+    property_ids = await create_properties(client, token_headers, 3)
+    await _bulk_create(client, token_headers, property_ids[0], 2)
+    await db_session.execute(
+        update(Property)
+        .where(Property.id.in_(property_ids[:2]))
+        .values(total_units=9, vacant_units=9)
+    )
+    await db_session.commit()
+
+    assert await reconcile_unit_counters(batch_size=1) == 2
+    assert await _counters(client, token_headers, property_ids[0]) == (2, 0, 2, 0)
+    assert await _counters(client, token_headers, property_ids[1]) == (0, 0, 0, 0)
+    assert await reconcile_unit_counters() == 0
+
+
+async def _summary(client: AsyncClient, headers: dict, **params) -> dict:
+    response = await client.get("/api/v1/properties/summary", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_follows_writes(client: AsyncClient, token_headers: dict):
+    """Property and unit writes keep the owner's rollup current; reads are one row."""
+    first, second = await create_properties(client, token_headers, 2)
+    occupied = (await client.post("/api/v1/units/", headers=token_headers, json={
+        "unit_number": "1", "property_id": first, "status": "occupied", "rent_amount": "4000.50",
+    })).json()["id"]
+    vacant = (await client.post("/api/v1/units/", headers=token_headers, json={
+        "unit_number": "2", "property_id": first, "rent_amount": "3000",
+    })).json()["id"]
+    await client.post("/api/v1/units/bulk", headers=token_headers, json={"items": [
+        {"unit_number": "3", "property_id": second, "status": "occupied", "rent_amount": "2000"},
+        {"unit_number": "4", "property_id": second, "status": "maintenance"},
+    ]})
+
+    with count_queries() as statements:
+        summary = await _summary(client, token_headers)
+    assert len(statements) == 1, statements
+    assert summary["property_count"] == 2
+    assert (summary["total_units"], summary["occupied_units"], summary["vacant_units"],
+            summary["maintenance_units"]) == (4, 2, 1, 1)
+    assert summary["occupancy_rate"] == 0.5
+    assert float(summary["rent_roll"]) == 6000.50
+
+    # Rent changes count only while occupied; moving in/out moves the rent
+    await client.put(f"/api/v1/units/{occupied}", headers=token_headers, json={"rent_amount": "4500"})
+    await client.put(f"/api/v1/units/{vacant}", headers=token_headers, json={"rent_amount": "3500"})
+    assert float((await _summary(client, token_headers))["rent_roll"]) == 6500
+    await client.put("/api/v1/units/bulk", headers=token_headers, json={"items": [
+        {"id": vacant, "status": "occupied"},
+        {"id": occupied, "status": "vacant"},
+    ]})
+    property_body = (await client.get(f"/api/v1/properties/{first}", headers=token_headers)).json()
+    assert float(property_body["rent_roll"]) == 3500
+    assert float((await _summary(client, token_headers))["rent_roll"]) == 5500
+
+    await client.delete(f"/api/v1/units/{vacant}", headers=token_headers)
+    await client.delete(f"/api/v1/properties/{second}", headers=token_headers)
+    summary = await _summary(client, token_headers)
+    assert (summary["property_count"], summary["total_units"], summary["occupied_units"]) == (1, 1, 0)
+    assert float(summary["rent_roll"]) == 0 and summary["occupancy_rate"] == 0
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_access(client: AsyncClient, token_headers: dict):
+    """Owners see only their own portfolio; owners without properties get zeros."""
+    from tests.conftest import create_user_headers
+
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    other = await create_user_headers(client, role="owner")
+    empty = await _summary(client, other)
+    assert empty["property_count"] == 0 and empty["occupancy_rate"] == 0
+    response = await client.get(
+        "/api/v1/properties/summary", headers=other, params={"owner_id": owner_id}
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_rebuild_repairs_portfolio_rollups(client: AsyncClient, token_headers: dict, db_session):
+    """The rebuild recomputes property counters first, then owner rollups from them."""
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    [property_id] = await create_properties(client, token_headers, 1)
+    await client.post("/api/v1/units/", headers=token_headers, json={
+        "unit_number": "1", "property_id": property_id, "status": "occupied", "rent_amount": "2500",
+    })
+    await db_session.execute(update(Property).values(rent_roll=0, total_units=7))
+    await db_session.execute(update(PortfolioRollup).values(property_count=5, occupied_units=0))
+    await db_session.commit()
+
+    assert await rebuild_portfolio_rollups(batch_size=1) == 1
+    summary = await _summary(client, token_headers, owner_id=owner_id)
+    assert (summary["property_count"], summary["total_units"], summary["occupied_units"]) == (1, 1, 1)
+    assert float(summary["rent_roll"]) == 2500
+    assert await rebuild_portfolio_rollups() == 0
+
+
+def _postgres_sql(session) -> list[str]:
+    """Record the session's statements as PostgreSQL would render them."""
+    rendered: list[str] = []
+    execute = session.execute
+
+    async def recording_execute(statement, *args, **kwargs):
+        rendered.append(str(statement.compile(dialect=postgresql.dialect())))
+        return await execute(statement, *args, **kwargs)
+
+    session.execute = recording_execute
+    return rendered
+
+
+@pytest.mark.asyncio
+async def test_reconcile_locks_batch_before_recounting(client: AsyncClient, token_headers: dict, db_session):
+    """Rows are locked in key order before the recount UPDATEs read their snapshot."""
+    property_ids = sorted(await create_properties(client, token_headers, 2))
+    rendered = _postgres_sql(db_session)
+
+    await PropertyRepository(db_session).reconcile_unit_counters(property_ids)
+    await PortfolioRepository(db_session).reconcile([property_ids[0]])
+    await db_session.rollback()
+
+    property_lock, property_update, _, rollup_lock, rollup_update = rendered
+    assert property_lock.endswith("ORDER BY properties.id FOR NO KEY UPDATE")
+    assert property_update.startswith("UPDATE properties")
+    assert rollup_lock.endswith("ORDER BY portfolio_rollups.owner_id FOR UPDATE")
+    assert rollup_update.startswith("UPDATE portfolio_rollups")
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_units(client: AsyncClient, token_headers: dict):
+    """Valid items are inserted in one statement; invalid ones are reported."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    items = [{"unit_number": str(i), "property_id": property_id} for i in range(50)]
+    items.insert(3, {"unit_number": "X", "property_id": "missing-property"})
+
+    with count_queries() as statements:
+        response = await client.post(
+            "/api/v1/units/bulk", headers=token_headers, json={"items": items}
+        )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 50 and body["failed"] == 1
+    assert body["results"][3]["status"] == "error"
+    assert "missing-property" in body["results"][3]["error"]
+    assert [s.split()[0] for s in statements].count("INSERT") == 1
+
+    listed = await client.get(
+        f"/api/v1/units/property/{property_id}",
+        headers=token_headers,
+        params={"include_total": "true"},
+    )
+    assert listed.headers["X-Total-Count"] == "50"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_units(client: AsyncClient, token_headers: dict):
+    """Shared values use one UPDATE ... IN; distinct values are applied per row."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    ids = await _bulk_create(client, token_headers, property_id, 4)
+
+    items = [
+        {"id": ids[0], "status": "occupied"},
+        {"id": ids[1], "status": "occupied"},
+        {"id": ids[2], "bedrooms": 5},
+        {"id": ids[3]},
+        {"id": "missing-unit", "status": "vacant"},
+    ]
+    response = await client.put("/api/v1/units/bulk", headers=token_headers, json={"items": items})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == ["updated", "updated", "updated", "error", "error"]
+
+    units = {
+        u["id"]: u for u in (await client.get(
+            f"/api/v1/units/property/{property_id}", headers=token_headers
+        )).json()
+    }
+    assert units[ids[0]]["status"] == units[ids[1]]["status"] == "occupied"
+    assert units[ids[2]]["bedrooms"] == 5 and units[ids[2]]["status"] == "vacant"
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_units(client: AsyncClient, token_headers: dict):
+    """Existing IDs are deleted; missing and repeated IDs are reported."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    ids = await _bulk_create(client, token_headers, property_id, 3)
+
+    response = await client.request(
+        "DELETE", "/api/v1/units/bulk", headers=token_headers,
+        json={"ids": [ids[0], ids[1], ids[0], "missing-unit"]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["status"] for r in body["results"]] == ["deleted", "deleted", "error", "error"]
+
+    remaining = await client.get(f"/api/v1/units/property/{property_id}", headers=token_headers)
+    assert [u["id"] for u in remaining.json()] == [ids[2]]
+
+
+@pytest.mark.asyncio
+async def test_bulk_requires_owner_role(client: AsyncClient):
+    """Tenants cannot bulk-create units."""
+    from tests.conftest import create_user_headers
+
+    headers = await create_user_headers(client, role="tenant")
+    response = await client.post("/api/v1/units/bulk", headers=headers, json={
+        "items": [{"unit_number": "1", "property_id": "p"}],
+    })
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_search_units_with_facets(client: AsyncClient, token_headers: dict):
+    """Filters apply across properties; facets and total come from one grouped query."""
+    owner_id = (await client.get("/api/v1/auth/me", headers=token_headers)).json()["id"]
+    property_ids = {}
+    for city in ("Riyadh", "Jeddah"):
+        created = await client.post("/api/v1/properties/", headers=token_headers, json={
+            "name": f"{city} Tower", "address": "1 Main Street", "city": city, "owner_id": owner_id,
+        })
+        property_ids[city] = created.json()["id"]
+
+    units = [
+        ("Riyadh", 1, 2500, "vacant"),
+        ("Riyadh", 2, 3500, "vacant"),
+        ("Riyadh", 3, 4800, "vacant"),
+        ("Riyadh", 3, 4000, "occupied"),
+        ("Riyadh", 2, 9000, "vacant"),
+        ("Riyadh", None, None, "vacant"),
+        ("Jeddah", 2, 3500, "vacant"),
+    ]
+    await client.post("/api/v1/units/bulk", headers=token_headers, json={"items": [
+        {"unit_number": str(i), "property_id": property_ids[city], "bedrooms": bedrooms,
+         "rent_amount": rent, "status": status}
+        for i, (city, bedrooms, rent, status) in enumerate(units)
+    ]})
+    await client.get("/api/v1/units/search", headers=token_headers)  # cache the user
+
+    with count_queries() as statements:
+        response = await client.get("/api/v1/units/search", headers=token_headers, params={
+            "city": "Riyadh", "min_bedrooms": 2, "min_rent": 3000, "max_rent": 5000, "limit": 1,
+        })
+    assert response.status_code == 200
+    body = response.json()
+    assert len(statements) == 2, statements  # page + facets
+    assert body["total"] == 3 and len(body["items"]) == 1 and body["next_cursor"]
+    assert body["facets"]["status"] == {"vacant": 2, "occupied": 1, "maintenance": 0}
+    assert body["facets"]["bedrooms"] == {"2": 1, "3": 2}
+    rent = {bucket["min"]: bucket["count"] for bucket in body["facets"]["rent"]}
+    assert rent[3000] == 3 and sum(rent.values()) == 3
+
+    seen = [u["id"] for u in body["items"]]
+    cursor = body["next_cursor"]
+    while cursor:
+        page = (await client.get("/api/v1/units/search", headers=token_headers, params={
+            "city": "Riyadh", "min_bedrooms": 2, "min_rent": 3000, "max_rent": 5000,
+            "limit": 1, "cursor": cursor,
+        })).json()
+        seen += [u["id"] for u in page["items"]]
+        cursor = page["next_cursor"]
+    assert len(set(seen)) == 3
+
+    everything = (await client.get("/api/v1/units/search", headers=token_headers)).json()
+    assert everything["total"] == 7
+    assert everything["facets"]["bedrooms"]["unknown"] == 1
+    assert everything["facets"]["rent_unknown"] == 1
+    assert [b["max"] for b in everything["facets"]["rent"]][-1] is None
+
+
+@pytest.mark.asyncio
+async def test_unit_update_rejects_null_required_fields(client: AsyncClient, token_headers: dict):
+    """unit_number and status can be omitted but not set to null."""
+    [property_id] = await create_properties(client, token_headers, 1)
+    [unit_id] = await _bulk_create(client, token_headers, property_id, 1)
+
+    for field in ("status", "unit_number"):
+        response = await client.put("/api/v1/units/bulk", headers=token_headers, json={
+            "items": [{"id": unit_id, field: None}],
+        })
+        assert response.status_code == 422
+        assert "cannot be null" in response.text
+
+        response = await client.put(
+            f"/api/v1/units/{unit_id}", headers=token_headers, json={field: None}
+        )
+        assert response.status_code == 422
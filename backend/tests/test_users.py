@@ -0,0 +1,119 @@
+"""
+User management and user-cache tests.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.user_cache import cache_user, invalidate_user, user_cache
+from app.database import async_session_factory
+from app.models.user import User
+
+
+async def _get_me(client: AsyncClient, headers: dict) -> dict:
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_user_cache_serves_repeat_requests(client: AsyncClient, token_headers: dict):
+    """Repeated authenticated requests are served from the user cache."""
+    await _get_me(client, token_headers)
+    hits_before = user_cache.hits
+
+    for _ in range(5):
+        await _get_me(client, token_headers)
+
+    assert user_cache.hits >= hits_before + 5
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_cache(client: AsyncClient, token_headers: dict):
+    """Profile updates are visible immediately despite the cache."""
+    me = await _get_me(client, token_headers)
+    assert me["id"] in user_cache._data
+
+    response = await client.put(
+        f"/api/v1/users/{me['id']}",
+        json={"full_name": "Renamed User"},
+        headers=token_headers,
+    )
+    assert response.status_code == 200
+    assert me["id"] not in user_cache._data
+
+    me = await _get_me(client, token_headers)
+    assert me["full_name"] == "Renamed User"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_waits_for_commit():
+    """Eviction happens after commit, and not at all on rollback."""
+    cache_user(User(id="cached-user", email="cached@amarati.com"))
+
+    async with async_session_factory() as session:
+        await session.execute(select(User))
+        invalidate_user(session, "cached-user")
+        await session.rollback()
+        await session.commit()
+    assert "cached-user" in user_cache._data
+
+    async with async_session_factory() as session:
+        await session.execute(select(User))
+        invalidate_user(session, "cached-user")
+        assert "cached-user" in user_cache._data
+        await session.commit()
+    assert "cached-user" not in user_cache._data
+
+
+@pytest.mark.asyncio
+async def test_user_lookup_runs_once_per_request(client: AsyncClient, token_headers: dict):
+    """RoleChecker and get_current_user share one lazy user lookup."""
+    user_cache.clear()
+
+    # list_users depends on both get_current_user and RoleChecker
+    response = await client.get("/api/v1/users/", headers=token_headers)
+    assert response.status_code == 403  # owner, not admin
+
+    assert user_cache.hits + user_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_deactivate_user_revokes_tokens(
+    client: AsyncClient, token_headers: dict, admin_headers: dict
+):
+    """A deactivated user's existing tokens stop working immediately."""
+    me = await _get_me(client, token_headers)
+
+    response = await client.delete(f"/api/v1/users/{me['id']}", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+    response = await client.get("/api/v1/auth/me", headers=token_headers)
+    assert response.status_code == 401
+    # The admin's own token is unaffected
+    assert (await client.get("/api/v1/auth/me", headers=admin_headers)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_list_users_cursor_pagination(
+    client: AsyncClient, token_headers: dict, admin_headers: dict
+):
+    """next_cursor walks the user list one page at a time without repeats."""
+    first = await client.get("/api/v1/users/", headers=admin_headers, params={"page_size": 1})
+    assert first.status_code == 200
+    body = first.json()
+    assert body["total"] == 2 and body["next_cursor"]
+
+    second = await client.get(
+        "/api/v1/users/",
+        headers=admin_headers,
+        params={"page_size": 1, "cursor": body["next_cursor"]},
+    )
+    second_body = second.json()
+    assert second_body["next_cursor"] is None
+    assert {body["users"][0]["id"], second_body["users"][0]["id"]} == {
+        (await _get_me(client, token_headers))["id"],
+        (await _get_me(client, admin_headers))["id"],
+    }